@@ -3,11 +3,12 @@
 # Provides expected stats, contact metrics, power metrics, plate discipline,
 # and composite scores for player evaluation
 
-from trade_value import parse_number, parse_salary
+from field_types import get_number
 from player_utils import (
-    parse_star_rating, get_age, get_war, normalize_to_100, 
+    get_age, get_war, normalize_to_100, 
     get_games_played, get_innings_pitched
 )
+from progress import track
 
 # Minimum sample size thresholds
 MIN_PLATE_APPEARANCES_FOR_ADVANCED = 50  # Minimum PA for reliable advanced stats
@@ -76,8 +77,8 @@ def calculate_expected_batting_average(player):
     Returns:
         xBA as float (0.000 to 1.000 scale)
     """
-    babip = parse_number(player.get("BABIP", 0))
-    avg = parse_number(player.get("AVG", 0))
+    babip = get_number(player, "BABIP", 0)
+    avg = get_number(player, "AVG", 0)
     
     if babip <= 0 and avg <= 0:
         return 0.0
@@ -101,7 +102,7 @@ def calculate_expected_slugging(player):
     Returns:
         xSLG as float
     """
-    slg = parse_number(player.get("SLG", 0))
+    slg = get_number(player, "SLG", 0)
     
     # Calculate ISO if not directly available
     iso = calculate_isolated_power(player)
@@ -124,10 +125,10 @@ def calculate_expected_woba(player):
     Returns:
         xWOBA as float
     """
-    obp = parse_number(player.get("OBP", 0))
-    slg = parse_number(player.get("SLG", 0))
-    hr = parse_number(player.get("HR", 0))
-    pa = parse_number(player.get("PA", 0))
+    obp = get_number(player, "OBP", 0)
+    slg = get_number(player, "SLG", 0)
+    hr = get_number(player, "HR", 0)
+    pa = get_number(player, "PA", 0)
     
     if obp <= 0 and slg <= 0:
         return 0.0
@@ -149,7 +150,7 @@ def calculate_expected_ops_plus(player):
     Returns:
         xOPS+ as float (100 is league average)
     """
-    ops_plus = parse_number(player.get("OPS+", 0))
+    ops_plus = get_number(player, "OPS+", 0)
     xwoba = calculate_expected_woba(player)
     
     if ops_plus <= 0:
@@ -178,12 +179,12 @@ def calculate_contact_plus(player):
     Returns:
         Contact+ as float (100 is average)
     """
-    contact = parse_number(player.get("CON", 0))
+    contact = get_number(player, "CON", 0)
     
     # Calculate strikeout percentage
-    so = parse_number(player.get("SO", player.get("K", 0)))
-    pa = parse_number(player.get("PA", 0))
-    ab = parse_number(player.get("AB", 0))
+    so = get_number(player, "SO", player.get("K", 0))
+    pa = get_number(player, "PA", 0)
+    ab = get_number(player, "AB", 0)
     
     # Use PA if available, otherwise AB
     denominator = pa if pa > 0 else ab
@@ -213,9 +214,9 @@ def calculate_balls_in_play_pct(player):
     Returns:
         BIP% as float (0-100)
     """
-    ab = parse_number(player.get("AB", 0))
-    so = parse_number(player.get("SO", player.get("K", 0)))
-    hr = parse_number(player.get("HR", 0))
+    ab = get_number(player, "AB", 0)
+    so = get_number(player, "SO", player.get("K", 0))
+    hr = get_number(player, "HR", 0)
     
     if ab <= 0:
         return 0.0
@@ -236,8 +237,8 @@ def calculate_isolated_power(player):
     Returns:
         ISO as float
     """
-    slg = parse_number(player.get("SLG", 0))
-    avg = parse_number(player.get("AVG", 0))
+    slg = get_number(player, "SLG", 0)
+    avg = get_number(player, "AVG", 0)
     
     iso = slg - avg
     return round(max(0, iso), 3)
@@ -255,7 +256,7 @@ def calculate_true_iso(player):
         True ISO as float
     """
     iso = calculate_isolated_power(player)
-    power = parse_number(player.get("POW", 0))
+    power = get_number(player, "POW", 0)
     
     # Normalize power rating
     if power > 10:
@@ -278,10 +279,10 @@ def calculate_barrel_pct(player):
     Returns:
         Barrel% as float
     """
-    hr = parse_number(player.get("HR", 0))
-    doubles = parse_number(player.get("2B", 0))
-    triples = parse_number(player.get("3B", 0))
-    pa = parse_number(player.get("PA", 0))
+    hr = get_number(player, "HR", 0)
+    doubles = get_number(player, "2B", 0)
+    triples = get_number(player, "3B", 0)
+    pa = get_number(player, "PA", 0)
     
     if pa <= 0:
         return 0.0
@@ -302,9 +303,9 @@ def calculate_expected_hr_pct(player):
     Returns:
         xHR% as float
     """
-    hr = parse_number(player.get("HR", 0))
-    pa = parse_number(player.get("PA", 0))
-    power = parse_number(player.get("POW", 0))
+    hr = get_number(player, "HR", 0)
+    pa = get_number(player, "PA", 0)
+    power = get_number(player, "POW", 0)
     
     # Actual HR rate
     hr_pct = (hr / pa * 100) if pa > 0 else 0
@@ -334,11 +335,11 @@ def calculate_chase_pct(player):
     Returns:
         Chase% as float (0-100, lower is better)
     """
-    eye = parse_number(player.get("EYE", 0))
+    eye = get_number(player, "EYE", 0)
     
-    so = parse_number(player.get("SO", player.get("K", 0)))
-    pa = parse_number(player.get("PA", 0))
-    ab = parse_number(player.get("AB", 0))
+    so = get_number(player, "SO", player.get("K", 0))
+    pa = get_number(player, "PA", 0)
+    ab = get_number(player, "AB", 0)
     
     denominator = pa if pa > 0 else ab
     so_pct = (so / denominator * 100) if denominator > 0 else 20
@@ -367,12 +368,12 @@ def calculate_plate_skills(player):
     Returns:
         Plate Skills as float (0-1 scale, like OBP)
     """
-    obp = parse_number(player.get("OBP", 0))
-    eye = parse_number(player.get("EYE", 0))
+    obp = get_number(player, "OBP", 0)
+    eye = get_number(player, "EYE", 0)
     
-    so = parse_number(player.get("SO", player.get("K", 0)))
-    pa = parse_number(player.get("PA", 0))
-    ab = parse_number(player.get("AB", 0))
+    so = get_number(player, "SO", player.get("K", 0))
+    pa = get_number(player, "PA", 0)
+    ab = get_number(player, "AB", 0)
     
     denominator = pa if pa > 0 else ab
     so_pct = (so / denominator * 100) if denominator > 0 else 20
@@ -398,11 +399,11 @@ def calculate_offensive_rating(player):
     Returns:
         Offensive Rating as float (typically 60-200)
     """
-    obp = parse_number(player.get("OBP", 0))
-    slg = parse_number(player.get("SLG", 0))
-    contact = parse_number(player.get("CON", 0))
-    power = parse_number(player.get("POW", 0))
-    eye = parse_number(player.get("EYE", 0))
+    obp = get_number(player, "OBP", 0)
+    slg = get_number(player, "SLG", 0)
+    contact = get_number(player, "CON", 0)
+    power = get_number(player, "POW", 0)
+    eye = get_number(player, "EYE", 0)
     
     # Normalize ratings to 50-based scale
     if contact > 10:
@@ -433,14 +434,14 @@ def calculate_true_woba(player):
     Returns:
         True wOBA as float
     """
-    bb = parse_number(player.get("BB", 0))
-    hbp = parse_number(player.get("HBP", 0))
-    hr = parse_number(player.get("HR", 0))
-    doubles = parse_number(player.get("2B", 0))
-    triples = parse_number(player.get("3B", 0))
-    h = parse_number(player.get("H", 0))
-    ab = parse_number(player.get("AB", 0))
-    sf = parse_number(player.get("SF", 0))
+    bb = get_number(player, "BB", 0)
+    hbp = get_number(player, "HBP", 0)
+    hr = get_number(player, "HR", 0)
+    doubles = get_number(player, "2B", 0)
+    triples = get_number(player, "3B", 0)
+    h = get_number(player, "H", 0)
+    ab = get_number(player, "AB", 0)
+    sf = get_number(player, "SF", 0)
     
     # Calculate singles
     singles = h - doubles - triples - hr
@@ -470,11 +471,11 @@ def calculate_run_production_efficiency(player):
     Returns:
         RPE as float (1.0 is average)
     """
-    r = parse_number(player.get("R", 0))
-    rbi = parse_number(player.get("RBI", 0))
-    hr = parse_number(player.get("HR", 0))
-    h = parse_number(player.get("H", 0))
-    bb = parse_number(player.get("BB", 0))
+    r = get_number(player, "R", 0)
+    rbi = get_number(player, "RBI", 0)
+    hr = get_number(player, "HR", 0)
+    h = get_number(player, "H", 0)
+    bb = get_number(player, "BB", 0)
     
     opportunities = h + bb
     if opportunities <= 0:
@@ -498,8 +499,8 @@ def calculate_power_speed_number(player):
     Returns:
         Power-Speed Number as float
     """
-    hr = parse_number(player.get("HR", 0))
-    sb = parse_number(player.get("SB", 0))
+    hr = get_number(player, "HR", 0)
+    sb = get_number(player, "SB", 0)
     
     if hr + sb <= 0:
         return 0.0
@@ -520,10 +521,10 @@ def calculate_clutch_index(player):
     Returns:
         Clutch Index as float (100 is average)
     """
-    rbi = parse_number(player.get("RBI", 0))
-    h = parse_number(player.get("H", 0))
-    hr = parse_number(player.get("HR", 0))
-    ab = parse_number(player.get("AB", 0))
+    rbi = get_number(player, "RBI", 0)
+    h = get_number(player, "H", 0)
+    hr = get_number(player, "HR", 0)
+    ab = get_number(player, "AB", 0)
     
     if ab <= 0:
         return 100.0
@@ -554,7 +555,7 @@ def calculate_stuff_plus(player):
     Returns:
         Stuff+ as float (100 is average)
     """
-    stu = parse_number(player.get("STU", 0))
+    stu = get_number(player, "STU", 0)
     
     if stu <= 0:
         return 100.0
@@ -580,8 +581,8 @@ def calculate_k_bb_ratio(player):
     Returns:
         K/BB ratio as float
     """
-    k9 = parse_number(player.get("K/9", 0))
-    bb9 = parse_number(player.get("BB/9", 0))
+    k9 = get_number(player, "K/9", 0)
+    bb9 = get_number(player, "BB/9", 0)
     
     if bb9 <= 0:
         if k9 > 0:
@@ -603,11 +604,11 @@ def calculate_expected_era_indicator(player):
     Returns:
         Expected ERA as float
     """
-    fip = parse_number(player.get("FIP", 0))
-    era = parse_number(player.get("ERA", 0))
-    k9 = parse_number(player.get("K/9", 0))
-    bb9 = parse_number(player.get("BB/9", 0))
-    hr9 = parse_number(player.get("HR/9", 0))
+    fip = get_number(player, "FIP", 0)
+    era = get_number(player, "ERA", 0)
+    k9 = get_number(player, "K/9", 0)
+    bb9 = get_number(player, "BB/9", 0)
+    hr9 = get_number(player, "HR/9", 0)
     
     # If FIP is available, weight it heavily
     if fip > 0:
@@ -636,12 +637,12 @@ def calculate_pitcher_composite_score(player):
         Composite score as float (0-100)
     """
     # Ratings components
-    stu = parse_number(player.get("STU", 0))
-    mov = parse_number(player.get("MOV", 0))
-    con = parse_number(player.get("CON", 0))  # Control
+    stu = get_number(player, "STU", 0)
+    mov = get_number(player, "MOV", 0)
+    con = get_number(player, "CON", 0)  # Control
     
     # Stats components
-    era_plus = parse_number(player.get("ERA+", 0))
+    era_plus = get_number(player, "ERA+", 0)
     war = get_war(player, "pitcher")
     k_bb = calculate_k_bb_ratio(player)
     
@@ -683,7 +684,7 @@ def get_babip_luck_indicator(player):
     Returns:
         Dict with luck status, color, and description
     """
-    babip = parse_number(player.get("BABIP", 0))
+    babip = get_number(player, "BABIP", 0)
     
     if babip <= 0:
         return {"status": "unknown", "color": "#888888", "description": "BABIP not available"}
@@ -723,7 +724,7 @@ def is_undervalued_player(player, player_type="batter"):
     Returns:
         Dict with undervalued status and reason
     """
-    ovr = parse_star_rating(player.get("OVR", "0"))
+    ovr = get_number(player, "OVR", "0")
     
     # Normalize OVR to 0-100 scale
     if ovr > 10:
@@ -733,8 +734,8 @@ def is_undervalued_player(player, player_type="batter"):
     
     if player_type == "batter":
         # Check batting metrics
-        wrc_plus = parse_number(player.get("wRC+", 0))
-        ops_plus = parse_number(player.get("OPS+", 0))
+        wrc_plus = get_number(player, "wRC+", 0)
+        ops_plus = get_number(player, "OPS+", 0)
         xwoba = calculate_expected_woba(player)
         
         # Calculate expected performance level (0-100)
@@ -768,7 +769,7 @@ def is_undervalued_player(player, player_type="batter"):
             }
     else:
         # Pitcher evaluation
-        era_plus = parse_number(player.get("ERA+", 0))
+        era_plus = get_number(player, "ERA+", 0)
         war = get_war(player, "pitcher")
         
         stat_score = 0
@@ -825,8 +826,8 @@ def is_regression_candidate(player, player_type="batter"):
             direction = "up"
         
         # Check for unsustainable HR rate
-        hr = parse_number(player.get("HR", 0))
-        pa = parse_number(player.get("PA", 0))
+        hr = get_number(player, "HR", 0)
+        pa = get_number(player, "PA", 0)
         hr_rate = (hr / pa * 100) if pa > 0 else 0
         
         if hr_rate > 6:  # Very high HR rate
@@ -835,8 +836,8 @@ def is_regression_candidate(player, player_type="batter"):
                 direction = "down"
     else:
         # Pitcher regression indicators
-        era = parse_number(player.get("ERA", 0))
-        fip = parse_number(player.get("FIP", 0))
+        era = get_number(player, "ERA", 0)
+        fip = get_number(player, "FIP", 0)
         
         if fip > 0 and era > 0:
             era_fip_gap = era - fip
@@ -869,8 +870,8 @@ def is_breakout_candidate(player, player_type="batter"):
         Dict with breakout status and indicators
     """
     age = get_age(player)
-    ovr = parse_star_rating(player.get("OVR", "0"))
-    pot = parse_star_rating(player.get("POT", "0"))
+    ovr = get_number(player, "OVR", "0")
+    pot = get_number(player, "POT", "0")
     
     # Check age requirement
     if age > BREAKOUT_MAX_AGE:
@@ -936,7 +937,7 @@ def calculate_all_batter_advanced_stats(player):
     Returns:
         Dict with all calculated advanced stats
     """
-    pa = parse_number(player.get("PA", 0))
+    pa = get_number(player, "PA", 0)
     has_sample = pa >= MIN_PLATE_APPEARANCES_FOR_ADVANCED
     
     return {
@@ -1010,7 +1011,27 @@ def calculate_all_pitcher_advanced_stats(player):
     }
 
 
-def add_advanced_stats_to_players(players, player_type="batter"):
+def calculate_advanced_stats(players, player_type="batter", progress=None):
+    """
+    Calculate advanced stats for a list of players without changing them.
+    
+    Safe to run on a worker thread while other threads read the players;
+    assign the results on the thread that owns them.
+    
+    Args:
+        players: List of player dicts
+        player_type: "batter" or "pitcher"
+        progress: Optional Progress token; reports one step per player on its
+            current stage (start it with STAGE_ADVANCED_STATS first)
+    
+    Returns:
+        List of (player, advanced stats dict) pairs, in the order of players
+    """
+    calculate = calculate_all_batter_advanced_stats if player_type == "batter" else calculate_all_pitcher_advanced_stats
+    return [(player, calculate(player)) for player in track(players, progress)]
+
+
+def add_advanced_stats_to_players(players, player_type="batter", progress=None):
     """
     Add advanced stats to a list of players.
     Modifies players in place and returns the same list.
@@ -1018,15 +1039,13 @@ def add_advanced_stats_to_players(players, player_type="batter"):
     Args:
         players: List of player dicts
         player_type: "batter" or "pitcher"
+        progress: Optional Progress token (see calculate_advanced_stats)
     
     Returns:
         Same list with advanced_stats added to each player
     """
-    for player in players:
-        if player_type == "batter":
-            player["advanced_stats"] = calculate_all_batter_advanced_stats(player)
-        else:
-            player["advanced_stats"] = calculate_all_pitcher_advanced_stats(player)
+    for player, stats in calculate_advanced_stats(players, player_type, progress):
+        player["advanced_stats"] = stats
     
     return players
 
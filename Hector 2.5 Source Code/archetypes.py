@@ -1,8 +1,8 @@
 # Franchise Archetypes
 # Filter and find players that fit desired team-building philosophies
 
-from trade_value import parse_number, parse_salary, parse_years_left
-from player_utils import parse_star_rating, get_age, get_war, is_star_scale
+from field_types import get_number, get_salary, get_years_left
+from player_utils import get_age, get_war, is_star_scale
 
 
 # Archetype Definitions
@@ -165,7 +165,7 @@ def calculate_speed_defense_fit(player):
     premium_positions = {"C", "2B", "SS", "CF"}
     
     # Speed (25 points)
-    spe = parse_number(player.get("SPE", 0))
+    spe = get_number(player, "SPE", 0)
     if spe >= 70:
         score += 25
     elif spe >= 60:
@@ -174,7 +174,7 @@ def calculate_speed_defense_fit(player):
         score += 10
     
     # Stealing (15 points)
-    ste = parse_number(player.get("STE", 0))
+    ste = get_number(player, "STE", 0)
     if ste >= 70:
         score += 15
     elif ste >= 60:
@@ -184,18 +184,18 @@ def calculate_speed_defense_fit(player):
     
     # Defense (30 points) - check position-appropriate ratings
     if pos == "C":
-        c_abi = parse_number(player.get("C ABI", 0))
-        c_arm = parse_number(player.get("C ARM", 0))
+        c_abi = get_number(player, "C ABI", 0)
+        c_arm = get_number(player, "C ARM", 0)
         def_avg = (c_abi + c_arm) / 2
     elif pos in {"2B", "SS", "3B", "1B"}:
-        if_rng = parse_number(player.get("IF RNG", 0))
-        if_arm = parse_number(player.get("IF ARM", 0))
-        if_err = parse_number(player.get("IF ERR", 0))
+        if_rng = get_number(player, "IF RNG", 0)
+        if_arm = get_number(player, "IF ARM", 0)
+        if_err = get_number(player, "IF ERR", 0)
         def_avg = (if_rng + if_arm + if_err) / 3
     else:
-        of_rng = parse_number(player.get("OF RNG", 0))
-        of_arm = parse_number(player.get("OF ARM", 0))
-        of_err = parse_number(player.get("OF ERR", 0))
+        of_rng = get_number(player, "OF RNG", 0)
+        of_arm = get_number(player, "OF ARM", 0)
+        of_err = get_number(player, "OF ERR", 0)
         def_avg = (of_rng + of_arm + of_err) / 3
     
     if def_avg >= 65:
@@ -206,8 +206,8 @@ def calculate_speed_defense_fit(player):
         score += 12
     
     # Contact over power (15 points)
-    con = parse_number(player.get("CON", 0))
-    pow_ = parse_number(player.get("POW", 0))
+    con = get_number(player, "CON", 0)
+    pow_ = get_number(player, "POW", 0)
     if con >= 55 and con > pow_:
         score += 15
     elif con >= 50:
@@ -237,7 +237,7 @@ def calculate_mashers_fit(player):
     corner_positions = {"1B", "3B", "LF", "RF", "DH"}
     
     # Power (35 points)
-    pow_ = parse_number(player.get("POW", 0))
+    pow_ = get_number(player, "POW", 0)
     if pow_ >= 70:
         score += 35
     elif pow_ >= 60:
@@ -246,7 +246,7 @@ def calculate_mashers_fit(player):
         score += 15
     
     # ISO (20 points)
-    iso = parse_number(player.get("ISO", 0))
+    iso = get_number(player, "ISO", 0)
     if iso >= 0.250:
         score += 20
     elif iso >= 0.200:
@@ -257,7 +257,7 @@ def calculate_mashers_fit(player):
         score += 6
     
     # SLG (15 points)
-    slg = parse_number(player.get("SLG", 0))
+    slg = get_number(player, "SLG", 0)
     if slg >= 0.550:
         score += 15
     elif slg >= 0.500:
@@ -272,7 +272,7 @@ def calculate_mashers_fit(player):
         score += 8  # Some bonus for power at non-premium positions
     
     # Gap power (15 points)
-    gap = parse_number(player.get("GAP", 0))
+    gap = get_number(player, "GAP", 0)
     if gap >= 60:
         score += 15
     elif gap >= 50:
@@ -293,7 +293,7 @@ def calculate_moneyball_fit(player):
     max_score = 100
     
     # Eye (25 points)
-    eye = parse_number(player.get("EYE", 0))
+    eye = get_number(player, "EYE", 0)
     if eye >= 70:
         score += 25
     elif eye >= 60:
@@ -304,7 +304,7 @@ def calculate_moneyball_fit(player):
         score += 8
     
     # BB% (25 points)
-    bb_pct = parse_number(player.get("BB%", 0))
+    bb_pct = get_number(player, "BB%", 0)
     if bb_pct >= 15:
         score += 25
     elif bb_pct >= 12:
@@ -315,7 +315,7 @@ def calculate_moneyball_fit(player):
         score += 8
     
     # OBP (25 points)
-    obp = parse_number(player.get("OBP", 0))
+    obp = get_number(player, "OBP", 0)
     if obp >= 0.400:
         score += 25
     elif obp >= 0.370:
@@ -326,7 +326,7 @@ def calculate_moneyball_fit(player):
         score += 10
     
     # wOBA (25 points)
-    woba = parse_number(player.get("wOBA", 0))
+    woba = get_number(player, "wOBA", 0)
     if woba >= 0.400:
         score += 25
     elif woba >= 0.370:
@@ -366,8 +366,8 @@ def calculate_youth_movement_fit(player, player_type="batter"):
         return 0  # Not a fit for youth movement
     
     # Potential (30 points)
-    pot = parse_star_rating(player.get("POT", "0"))
-    ovr = parse_star_rating(player.get("OVR", "0"))
+    pot = get_number(player, "POT", "0")
+    ovr = get_number(player, "OVR", "0")
     
     if is_star_scale(pot):  # Star scale
         if pot >= 4.5:
@@ -406,7 +406,7 @@ def calculate_youth_movement_fit(player, player_type="batter"):
             score += 12
     
     # Contract (15 points)
-    yl_data = parse_years_left(player.get("YL", ""))
+    yl_data = get_years_left(player, "YL", "")
     status = yl_data.get("status", "unknown")
     
     if status == "pre_arb":
@@ -414,7 +414,7 @@ def calculate_youth_movement_fit(player, player_type="batter"):
     elif status == "arbitration":
         score += 12
     else:
-        salary = parse_salary(player.get("SLR", 0))
+        salary = get_salary(player, "SLR", 0)
         if salary < 3:
             score += 8
     
@@ -445,7 +445,7 @@ def calculate_win_now_fit(player, player_type="batter"):
         score += 5
     
     # OVR (35 points)
-    ovr = parse_star_rating(player.get("OVR", "0"))
+    ovr = get_number(player, "OVR", "0")
     if is_star_scale(ovr):  # Star scale
         if ovr >= 4.5:
             score += 35
@@ -467,8 +467,8 @@ def calculate_win_now_fit(player, player_type="batter"):
     
     # Current production (45 points)
     if player_type == "batter":
-        wrc_plus = parse_number(player.get("wRC+", 0))
-        war = parse_number(player.get("WAR (Batter)", player.get("WAR", 0)))
+        wrc_plus = get_number(player, "wRC+", 0)
+        war = get_number(player, "WAR (Batter)", player.get("WAR", 0))
         
         if wrc_plus >= 140:
             score += 25
@@ -488,8 +488,8 @@ def calculate_win_now_fit(player, player_type="batter"):
         elif war >= 2:
             score += 6
     else:
-        era_plus = parse_number(player.get("ERA+", 0))
-        war = parse_number(player.get("WAR (Pitcher)", player.get("WAR", 0)))
+        era_plus = get_number(player, "ERA+", 0)
+        war = get_number(player, "WAR (Pitcher)", player.get("WAR", 0))
         
         if era_plus >= 140:
             score += 25
@@ -525,7 +525,7 @@ def calculate_budget_build_fit(player, player_type="batter"):
     
     # Get WAR and salary
     war = get_war(player, player_type)
-    salary = parse_salary(player.get("SLR", 0))
+    salary = get_salary(player, "SLR", 0)
     
     # WAR/$ ratio (40 points)
     if salary > 0:
@@ -542,7 +542,7 @@ def calculate_budget_build_fit(player, player_type="batter"):
         score += 40  # Free production!
     
     # Contract status (25 points)
-    yl_data = parse_years_left(player.get("YL", ""))
+    yl_data = get_years_left(player, "YL", "")
     status = yl_data.get("status", "unknown")
     
     if status == "pre_arb":
@@ -592,11 +592,11 @@ def calculate_balanced_fit(player, player_type="batter"):
     
     if player_type == "batter":
         ratings = {
-            "CON": parse_number(player.get("CON", 0)),
-            "GAP": parse_number(player.get("GAP", 0)),
-            "POW": parse_number(player.get("POW", 0)),
-            "EYE": parse_number(player.get("EYE", 0)),
-            "SPE": parse_number(player.get("SPE", 0)),
+            "CON": get_number(player, "CON", 0),
+            "GAP": get_number(player, "GAP", 0),
+            "POW": get_number(player, "POW", 0),
+            "EYE": get_number(player, "EYE", 0),
+            "SPE": get_number(player, "SPE", 0),
         }
         
         # Count ratings at various thresholds
@@ -634,9 +634,9 @@ def calculate_balanced_fit(player, player_type="batter"):
     
     else:  # pitcher
         ratings = {
-            "STU": parse_number(player.get("STU", 0)),
-            "MOV": parse_number(player.get("MOV", 0)),
-            "CON": parse_number(player.get("CON", 0)),
+            "STU": get_number(player, "STU", 0),
+            "MOV": get_number(player, "MOV", 0),
+            "CON": get_number(player, "CON", 0),
         }
         
         above_45 = sum(1 for v in ratings.values() if v >= 45)
@@ -682,7 +682,7 @@ def calculate_chaos_ball_fit(player):
     max_score = 100
     
     # Power (30 points)
-    pow_ = parse_number(player.get("POW", 0))
+    pow_ = get_number(player, "POW", 0)
     if pow_ >= 70:
         score += 30
     elif pow_ >= 60:
@@ -691,7 +691,7 @@ def calculate_chaos_ball_fit(player):
         score += 15
     
     # ISO (25 points)
-    iso = parse_number(player.get("ISO", 0))
+    iso = get_number(player, "ISO", 0)
     if iso >= 0.250:
         score += 25
     elif iso >= 0.200:
@@ -702,7 +702,7 @@ def calculate_chaos_ball_fit(player):
         score += 8
     
     # K% - higher is actually good for this archetype (20 points)
-    k_pct = parse_number(player.get("K%", 0))
+    k_pct = get_number(player, "K%", 0)
     if k_pct >= 30:
         score += 20
     elif k_pct >= 25:
@@ -711,7 +711,7 @@ def calculate_chaos_ball_fit(player):
         score += 10
     
     # Low contact is acceptable (15 points if CON < 50)
-    con = parse_number(player.get("CON", 0))
+    con = get_number(player, "CON", 0)
     if con < 40:
         score += 15
     elif con < 50:
@@ -720,7 +720,7 @@ def calculate_chaos_ball_fit(player):
         score += 5
     
     # HR totals bonus (10 points)
-    hr = parse_number(player.get("HR", 0))
+    hr = get_number(player, "HR", 0)
     if hr >= 35:
         score += 10
     elif hr >= 25:
@@ -742,7 +742,7 @@ def calculate_small_ball_fit(player):
     max_score = 100
     
     # Contact (30 points)
-    con = parse_number(player.get("CON", 0))
+    con = get_number(player, "CON", 0)
     if con >= 70:
         score += 30
     elif con >= 60:
@@ -753,7 +753,7 @@ def calculate_small_ball_fit(player):
         score += 10
     
     # Speed (20 points)
-    spe = parse_number(player.get("SPE", 0))
+    spe = get_number(player, "SPE", 0)
     if spe >= 65:
         score += 20
     elif spe >= 55:
@@ -762,7 +762,7 @@ def calculate_small_ball_fit(player):
         score += 8
     
     # Stealing (20 points)
-    ste = parse_number(player.get("STE", 0))
+    ste = get_number(player, "STE", 0)
     if ste >= 65:
         score += 20
     elif ste >= 55:
@@ -771,7 +771,7 @@ def calculate_small_ball_fit(player):
         score += 8
     
     # Low K% (15 points)
-    k_pct = parse_number(player.get("K%", 0))
+    k_pct = get_number(player, "K%", 0)
     if k_pct <= 10:
         score += 15
     elif k_pct <= 15:
@@ -782,7 +782,7 @@ def calculate_small_ball_fit(player):
         score += 4
     
     # Bunting ability (15 points) - use BUN if available, else estimate from CON/SPE
-    bun = parse_number(player.get("BUN", 0))
+    bun = get_number(player, "BUN", 0)
     if bun >= 60:
         score += 15
     elif bun >= 50:
@@ -812,7 +812,7 @@ def calculate_ace_hunter_fit(player, player_type="pitcher"):
         return 0  # Only SP qualify for ace
     
     # OVR (50 points) - needs to be elite
-    ovr = parse_star_rating(player.get("OVR", "0"))
+    ovr = get_number(player, "OVR", "0")
     if is_star_scale(ovr):  # Star scale
         if ovr >= 4.5:
             score += 50
@@ -833,7 +833,7 @@ def calculate_ace_hunter_fit(player, player_type="pitcher"):
             return 0  # Not ace material
     
     # Stuff (25 points)
-    stu = parse_number(player.get("STU", 0))
+    stu = get_number(player, "STU", 0)
     if stu >= 70:
         score += 25
     elif stu >= 65:
@@ -842,7 +842,7 @@ def calculate_ace_hunter_fit(player, player_type="pitcher"):
         score += 15
     
     # Movement (15 points)
-    mov = parse_number(player.get("MOV", 0))
+    mov = get_number(player, "MOV", 0)
     if mov >= 65:
         score += 15
     elif mov >= 60:
@@ -851,7 +851,7 @@ def calculate_ace_hunter_fit(player, player_type="pitcher"):
         score += 8
     
     # Control (10 points)
-    ctrl = parse_number(player.get("CON", 0))
+    ctrl = get_number(player, "CON", 0)
     if ctrl >= 65:
         score += 10
     elif ctrl >= 60:
@@ -879,7 +879,7 @@ def calculate_bullpen_first_fit(player, player_type="pitcher"):
         return 0  # Only relievers
     
     # OVR (35 points)
-    ovr = parse_star_rating(player.get("OVR", "0"))
+    ovr = get_number(player, "OVR", "0")
     if is_star_scale(ovr):
         if ovr >= 4.0:
             score += 35
@@ -900,7 +900,7 @@ def calculate_bullpen_first_fit(player, player_type="pitcher"):
             score += 12
     
     # Stuff (30 points) - critical for relievers
-    stu = parse_number(player.get("STU", 0))
+    stu = get_number(player, "STU", 0)
     if stu >= 70:
         score += 30
     elif stu >= 65:
@@ -911,7 +911,7 @@ def calculate_bullpen_first_fit(player, player_type="pitcher"):
         score += 10
     
     # Movement (20 points)
-    mov = parse_number(player.get("MOV", 0))
+    mov = get_number(player, "MOV", 0)
     if mov >= 65:
         score += 20
     elif mov >= 60:
@@ -944,7 +944,7 @@ def calculate_platoon_army_fit(player):
         return 0  # Switch hitters don't need platoons
     
     # OVR in platoon-friendly range - not stars, not scrubs (25 points)
-    ovr = parse_star_rating(player.get("OVR", "0"))
+    ovr = get_number(player, "OVR", "0")
     if is_star_scale(ovr):
         if 2.5 <= ovr <= 3.5:
             score += 25
@@ -961,9 +961,9 @@ def calculate_platoon_army_fit(player):
             score += 5
     
     # Good batting tool (25 points)
-    con = parse_number(player.get("CON", 0))
-    pow_ = parse_number(player.get("POW", 0))
-    eye = parse_number(player.get("EYE", 0))
+    con = get_number(player, "CON", 0)
+    pow_ = get_number(player, "POW", 0)
+    eye = get_number(player, "EYE", 0)
     
     best_tool = max(con, pow_, eye)
     if best_tool >= 60:
@@ -974,8 +974,8 @@ def calculate_platoon_army_fit(player):
         score += 12
     
     # Check vL and vR splits if available (30 points)
-    v_l = parse_number(player.get("vL", 0))
-    v_r = parse_number(player.get("vR", 0))
+    v_l = get_number(player, "vL", 0)
+    v_r = get_number(player, "vR", 0)
     
     if v_l > 0 and v_r > 0:
         split_diff = abs(v_l - v_r)
@@ -994,7 +994,7 @@ def calculate_platoon_army_fit(player):
             score += 10
     
     # Value as part-time player (20 points)
-    salary = parse_salary(player.get("SLR", 0))
+    salary = get_salary(player, "SLR", 0)
     if salary < 2:
         score += 20
     elif salary < 5:
@@ -1016,7 +1016,7 @@ def calculate_launch_angle_fit(player):
     max_score = 100
     
     # Power (35 points)
-    pow_ = parse_number(player.get("POW", 0))
+    pow_ = get_number(player, "POW", 0)
     if pow_ >= 70:
         score += 35
     elif pow_ >= 60:
@@ -1027,7 +1027,7 @@ def calculate_launch_angle_fit(player):
         score += 10
     
     # Eye/Walk ability (30 points)
-    eye = parse_number(player.get("EYE", 0))
+    eye = get_number(player, "EYE", 0)
     if eye >= 65:
         score += 30
     elif eye >= 55:
@@ -1038,7 +1038,7 @@ def calculate_launch_angle_fit(player):
         score += 8
     
     # HR production (20 points)
-    hr = parse_number(player.get("HR", 0))
+    hr = get_number(player, "HR", 0)
     if hr >= 40:
         score += 20
     elif hr >= 30:
@@ -1049,7 +1049,7 @@ def calculate_launch_angle_fit(player):
         score += 5
     
     # BB% (15 points)
-    bb_pct = parse_number(player.get("BB%", 0))
+    bb_pct = get_number(player, "BB%", 0)
     if bb_pct >= 15:
         score += 15
     elif bb_pct >= 12:
@@ -1077,19 +1077,19 @@ def calculate_defense_wins_fit(player):
     
     # Get defensive ratings based on position
     if pos == "C":
-        c_abi = parse_number(player.get("C ABI", 0))
-        c_arm = parse_number(player.get("C ARM", 0))
-        c_frm = parse_number(player.get("C FRM", 0))
+        c_abi = get_number(player, "C ABI", 0)
+        c_arm = get_number(player, "C ARM", 0)
+        c_frm = get_number(player, "C FRM", 0)
         def_avg = (c_abi + c_arm + c_frm) / 3 if c_frm > 0 else (c_abi + c_arm) / 2
     elif pos in {"2B", "SS", "3B", "1B"}:
-        if_rng = parse_number(player.get("IF RNG", 0))
-        if_arm = parse_number(player.get("IF ARM", 0))
-        if_err = parse_number(player.get("IF ERR", 0))
+        if_rng = get_number(player, "IF RNG", 0)
+        if_arm = get_number(player, "IF ARM", 0)
+        if_err = get_number(player, "IF ERR", 0)
         def_avg = (if_rng + if_arm + if_err) / 3
     else:  # OF
-        of_rng = parse_number(player.get("OF RNG", 0))
-        of_arm = parse_number(player.get("OF ARM", 0))
-        of_err = parse_number(player.get("OF ERR", 0))
+        of_rng = get_number(player, "OF RNG", 0)
+        of_arm = get_number(player, "OF ARM", 0)
+        of_err = get_number(player, "OF ERR", 0)
         def_avg = (of_rng + of_arm + of_err) / 3
     
     # Defense (50 points) - most important
@@ -1111,7 +1111,7 @@ def calculate_defense_wins_fit(player):
         score += 10
     
     # Speed (15 points) - helps defense
-    spe = parse_number(player.get("SPE", 0))
+    spe = get_number(player, "SPE", 0)
     if spe >= 60:
         score += 15
     elif spe >= 50:
@@ -1120,10 +1120,10 @@ def calculate_defense_wins_fit(player):
         score += 5
     
     # Accept weaker bat bonus (10 points) - low salary despite poor offense
-    con = parse_number(player.get("CON", 0))
-    pow_ = parse_number(player.get("POW", 0))
+    con = get_number(player, "CON", 0)
+    pow_ = get_number(player, "POW", 0)
     avg_bat = (con + pow_) / 2
-    salary = parse_salary(player.get("SLR", 0))
+    salary = get_salary(player, "SLR", 0)
     
     if avg_bat < 45 and def_avg >= 60:
         if salary < 3:
@@ -1160,8 +1160,8 @@ def calculate_prospect_pipeline_fit(player, player_type="batter"):
         return 0  # Too old for prospect pipeline
     
     # High potential (35 points)
-    pot = parse_star_rating(player.get("POT", "0"))
-    ovr = parse_star_rating(player.get("OVR", "0"))
+    pot = get_number(player, "POT", "0")
+    ovr = get_number(player, "OVR", "0")
     
     if is_star_scale(pot):
         if pot >= 4.5:
@@ -1204,7 +1204,7 @@ def calculate_prospect_pipeline_fit(player, player_type="batter"):
             score += 5
     
     # Cheap contract (10 points)
-    yl_data = parse_years_left(player.get("YL", ""))
+    yl_data = get_years_left(player, "YL", "")
     status = yl_data.get("status", "unknown")
     
     if status == "pre_arb":
@@ -1212,7 +1212,7 @@ def calculate_prospect_pipeline_fit(player, player_type="batter"):
     elif status == "arbitration":
         score += 6
     else:
-        salary = parse_salary(player.get("SLR", 0))
+        salary = get_salary(player, "SLR", 0)
         if salary < 2:
             score += 4
     
@@ -1243,7 +1243,7 @@ def calculate_veteran_presence_fit(player, player_type="batter"):
         return 0  # Not veteran enough
     
     # High OVR (40 points) - proven track record
-    ovr = parse_star_rating(player.get("OVR", "0"))
+    ovr = get_number(player, "OVR", "0")
     if is_star_scale(ovr):
         if ovr >= 4.0:
             score += 40
@@ -1265,8 +1265,8 @@ def calculate_veteran_presence_fit(player, player_type="batter"):
     
     # Current production (25 points)
     if player_type == "batter":
-        war = parse_number(player.get("WAR (Batter)", player.get("WAR", 0)))
-        wrc_plus = parse_number(player.get("wRC+", 0))
+        war = get_number(player, "WAR (Batter)", player.get("WAR", 0))
+        wrc_plus = get_number(player, "wRC+", 0)
         
         if war >= 3:
             score += 15
@@ -1280,8 +1280,8 @@ def calculate_veteran_presence_fit(player, player_type="batter"):
         elif wrc_plus >= 100:
             score += 6
     else:
-        war = parse_number(player.get("WAR (Pitcher)", player.get("WAR", 0)))
-        era_plus = parse_number(player.get("ERA+", 0))
+        war = get_number(player, "WAR (Pitcher)", player.get("WAR", 0))
+        era_plus = get_number(player, "ERA+", 0)
         
         if war >= 3:
             score += 15
@@ -1324,7 +1324,7 @@ def calculate_innings_eaters_fit(player, player_type="pitcher"):
         return 0  # Only starters can be innings eaters
     
     # Stamina (40 points) - most important
-    stm = parse_number(player.get("STM", 0))
+    stm = get_number(player, "STM", 0)
     if stm >= 70:
         score += 40
     elif stm >= 65:
@@ -1351,7 +1351,7 @@ def calculate_innings_eaters_fit(player, player_type="pitcher"):
         score += 15  # Unknown, assume average
     
     # IP production (20 points)
-    ip = parse_number(player.get("IP", 0))
+    ip = get_number(player, "IP", 0)
     if ip >= 200:
         score += 20
     elif ip >= 180:
@@ -1364,7 +1364,7 @@ def calculate_innings_eaters_fit(player, player_type="pitcher"):
         score += 4
     
     # Baseline competence (15 points) - needs to be good enough to keep in games
-    ovr = parse_star_rating(player.get("OVR", "0"))
+    ovr = get_number(player, "OVR", "0")
     if is_star_scale(ovr):
         if ovr >= 3.0:
             score += 15
@@ -1438,8 +1438,8 @@ def find_players_by_archetype(players, archetype, player_type="batter", min_fit=
                 "team": player.get("ORG", ""),
                 "pos": player.get("POS", ""),
                 "age": get_age(player),
-                "ovr": parse_star_rating(player.get("OVR", "0")),
-                "pot": parse_star_rating(player.get("POT", "0")),
+                "ovr": get_number(player, "OVR", "0"),
+                "pot": get_number(player, "POT", "0"),
             })
     
     # Sort by fit score descending
@@ -1451,7 +1451,20 @@ def get_player_archetype_fits(player, player_type="batter"):
     """
     Get all archetype fits for a single player.
     Returns dict of archetype -> fit_score
+    
+    Fits only depend on the player's own cells, so PlayerTable rows keep them
+    in their cache; unchanged players keep their fits across reloads.
     """
+    cache = getattr(player, "cache", None)
+    if cache is not None:
+        key = ("archetype_fits", player_type)
+        if key not in cache:
+            cache[key] = _archetype_fits(player, player_type)
+        return cache[key]
+    return _archetype_fits(player, player_type)
+
+
+def _archetype_fits(player, player_type):
     results = {}
     for archetype, info in ARCHETYPES.items():
         if player_type in info.get("player_types", []):
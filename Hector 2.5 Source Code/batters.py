@@ -2,6 +2,47 @@ import sys
 import importlib.util
 from pathlib import Path 
 
+import numpy as np
+
+from field_types import get_number, typed_value
+from player_table import column_matrix, column_values
+from stat_scores import calculate_stat_scores, stat_score_pairs
+from weights import on_weights_changed
+
+
+# Batter rating columns in scoring order, with the section_weights entry each one uses
+BATTER_KEY_MAP = {
+    'CON': ('overall', 'contact'),
+    'GAP': ('overall', 'gap'),
+    'POW': ('overall', 'power'),
+    'EYE': ('overall', 'eye'),
+    "K's": ('overall', 'strikeouts'),
+    'CON P': ('potential', 'contact_potential'),
+    'GAP P': ('potential', 'gap_potential'),
+    'POW P': ('potential', 'power_potential'),
+    'EYE P': ('potential', 'eye_potential'),
+    'K P': ('potential', 'strikeouts_potential'),
+    'C ABI': ('defense', 'catcher', 'catcher_ability'),
+    'C ARM': ('defense', 'catcher', 'catcher_arm'),
+    'C FRM': ('defense', 'catcher', 'catcher_framing'),
+    'IF RNG': ('defense', 'infield', 'infield_range'),
+    'IF ERR': ('defense', 'infield', 'infield_error'),
+    'IF ARM': ('defense', 'infield', 'infield_arm'),
+    'OF RNG': ('defense', 'outfield', 'outfield_range'),
+    'OF ERR': ('defense', 'outfield', 'outfield_error'),
+    'OF ARM': ('defense', 'outfield', 'outfield_arm'),
+    'SPE': ('baserunning', 'speed'),
+    'STE': ('baserunning', 'stealing'),
+    'RUN': ('baserunning', 'running'),
+    'SctAcc': ('scout_accuracy',)
+}
+
+INFIELD_POSITIONS = ('1B', '2B', '3B', 'SS')
+OUTFIELD_POSITIONS = ('LF', 'CF', 'RF')
+
+# Score sections in the order they are added up into the total
+BATTER_SECTIONS = ("overall", "potential", "defense", "baserunning", "scout_accuracy")
+
 
 def parse_stat_value(val):
     """Parse a stat value from HTML export, handling various formats"""
@@ -28,7 +69,7 @@ def calculate_batter_stat_score(player, stat_weights_module):
     min_games = getattr(stat_weights_module, 'MIN_PLATE_APPEARANCES', 50)
     
     # Check sample size - use G (games) as proxy for plate appearances
-    games = parse_stat_value(player.get("G", 0))
+    games = get_number(player, "G", 0)
     has_sufficient_sample = games >= min_games
     
     if not has_sufficient_sample:
@@ -44,7 +85,7 @@ def calculate_batter_stat_score(player, stat_weights_module):
         if weight == 0:
             continue
             
-        raw_value = parse_stat_value(player.get(stat_name, 0))
+        raw_value = get_number(player, stat_name, 0)
         
         # Apply scale factor if present
         scale_factor = config.get("scale_factor", 1.0)
@@ -67,39 +108,19 @@ def calculate_batter_stat_score(player, stat_weights_module):
     return round(stat_score, 2), True
 
 
+def calculate_batter_stat_scores(batters, stat_weights_module):
+    """
+    calculate_batter_stat_score of every batter at once (see stat_scores).
+    
+    Returns:
+        Tuple of (stat_score, used_stats) arrays over batters
+    """
+    min_games = getattr(stat_weights_module, 'MIN_PLATE_APPEARANCES', 50)
+    return calculate_stat_scores(batters, stat_weights_module, "G", min_games)
+
+
 def calculate_batter_score(player, section_weights, use_stats=False, stat_weights_module=None):
     pos = player.get('POS', '').upper()
-    def to_number(val):
-        val = str(val).replace(" Stars", "").strip()
-        if val == "-" or val == "":
-            return 0.0
-        try: return float(val)
-        except ValueError: return 0.0
-    batter_key_map = {
-        'CON': ('overall', 'contact'),
-        'GAP': ('overall', 'gap'),
-        'POW': ('overall', 'power'),
-        'EYE': ('overall', 'eye'),
-        "K's": ('overall', 'strikeouts'),
-        'CON P': ('potential', 'contact_potential'),
-        'GAP P': ('potential', 'gap_potential'),
-        'POW P': ('potential', 'power_potential'),
-        'EYE P': ('potential', 'eye_potential'),
-        'K P': ('potential', 'strikeouts_potential'),
-        'C ABI': ('defense', 'catcher', 'catcher_ability'),
-        'C ARM': ('defense', 'catcher', 'catcher_arm'),
-        'C FRM': ('defense', 'catcher', 'catcher_framing'),
-        'IF RNG': ('defense', 'infield', 'infield_range'),
-        'IF ERR': ('defense', 'infield', 'infield_error'),
-        'IF ARM': ('defense', 'infield', 'infield_arm'),
-        'OF RNG': ('defense', 'outfield', 'outfield_range'),
-        'OF ERR': ('defense', 'outfield', 'outfield_error'),
-        'OF ARM': ('defense', 'outfield', 'outfield_arm'),
-        'SPE': ('baserunning', 'speed'),
-        'STE': ('baserunning', 'stealing'),
-        'RUN': ('baserunning', 'running'),
-        'SctAcc': ('scout_accuracy',)
-    }
     overall_score = 0.0
     potential_score = 0.0
     defense_score = 0.0
@@ -112,8 +133,8 @@ def calculate_batter_score(player, section_weights, use_stats=False, stat_weight
     meta_baserunning = meta.get("baserunning", 1.0)
     meta_scout = 1.0
 
-    for attr, weight_path in batter_key_map.items():
-        val = to_number(player.get(attr, "-"))
+    for attr, weight_path in BATTER_KEY_MAP.items():
+        val = get_number(player, attr, "-")
         if not val:
             continue
         if weight_path[0] == "overall":
@@ -130,13 +151,13 @@ def calculate_batter_score(player, section_weights, use_stats=False, stat_weight
                 if pos == "C" and section == "catcher":
                     weight = section_weights['defense']['catcher'].get(key,0)
                     defense_score += val * weight
-                elif pos in ['1B', '2B', '3B', 'SS'] and section == "infield":
+                elif pos in INFIELD_POSITIONS and section == "infield":
                     if key in ['infield_range', 'infield_arm']:
                         weight = section_weights['defense']['infield'][key].get(pos,0)
                     else:
                         weight = section_weights['defense']['infield'].get(key,0)
                     defense_score += val * weight
-                elif pos in ['LF', 'CF', 'RF'] and section == "outfield":
+                elif pos in OUTFIELD_POSITIONS and section == "outfield":
                     if key == 'outfield_range':
                         weight = section_weights['defense']['outfield'][key].get(pos,0)
                     else:
@@ -177,6 +198,204 @@ def calculate_batter_score(player, section_weights, use_stats=False, stat_weight
         "overall_stars": player.get('OVR', '0 Stars'),
         "potential_stars": player.get('POT', '0 Stars')
     }
+
+
+class BatterScoreModel:
+    """
+    section_weights compiled for scoring a whole batter table at once.
+    
+    Every rating in BATTER_KEY_MAP becomes one column of a coefficient row,
+    built once per position: the defensive weights a position uses (catcher,
+    infield or outfield, with the per-position range and arm weights) and
+    zeros for the rest. Scoring reads each rating column once for all
+    batters, multiplies it by the coefficients of each batter's position and
+    adds the products up per section.
+    
+    Products are added in BATTER_KEY_MAP order, section by section, exactly as
+    calculate_batter_score does, so the scores are identical to the last bit.
+    
+    The meta multipliers are only applied at the end, to each section's sum.
+    components() returns those sums before any multiplier, and combine()
+    turns them into scores for any meta multipliers (Draft Mode) and stat
+    scores (Stats Mode) without reading a rating again. Both are exact.
+    
+    Args:
+        section_weights: batter_weights.section_weights; the coefficient rows
+            are built from it once, so build a new model (see
+            get_batter_score_model) after changing anything but meta
+    """
+    
+    def __init__(self, section_weights):
+        self.section_weights = section_weights
+        self.columns = tuple(BATTER_KEY_MAP)
+        # Columns of each section, in BATTER_KEY_MAP order
+        self.section_columns = tuple(
+            [j for j, path in enumerate(BATTER_KEY_MAP.values()) if path[0] == section]
+            for section in BATTER_SECTIONS
+        )
+        self._coefficients = {}  # position -> coefficient row
+    
+    def multipliers(self, meta=None):
+        """Meta multiplier of every section, from meta or else section_weights['meta']."""
+        if meta is None:
+            meta = self.section_weights.get('meta', {})
+        return (
+            meta.get("overall", 1.0),
+            meta.get("potential", 1.0),
+            meta.get("defense", 1.0),
+            meta.get("baserunning", 1.0),
+            1.0,
+        )
+    
+    def coefficients(self, pos):
+        """Weight of every BATTER_KEY_MAP rating for a batter at pos (upper case)."""
+        row = self._coefficients.get(pos)
+        if row is not None:
+            return row
+        weights = self.section_weights
+        row = np.zeros(len(self.columns), dtype=np.float64)
+        for j, weight_path in enumerate(BATTER_KEY_MAP.values()):
+            if weight_path[0] in ("overall", "potential", "baserunning"):
+                row[j] = weights[weight_path[0]].get(weight_path[1], 0)
+            elif weight_path[0] == "defense":
+                section, key = weight_path[1], weight_path[2]
+                if pos == "C" and section == "catcher":
+                    row[j] = weights['defense']['catcher'].get(key, 0)
+                elif pos in INFIELD_POSITIONS and section == "infield":
+                    if key in ['infield_range', 'infield_arm']:
+                        row[j] = weights['defense']['infield'][key].get(pos, 0)
+                    else:
+                        row[j] = weights['defense']['infield'].get(key, 0)
+                elif pos in OUTFIELD_POSITIONS and section == "outfield":
+                    if key == 'outfield_range':
+                        row[j] = weights['defense']['outfield'][key].get(pos, 0)
+                    else:
+                        row[j] = weights['defense']['outfield'].get(key, 0)
+            elif weight_path[0] == "scout_accuracy":
+                row[j] = weights.get('scout_accuracy', 0)
+        self._coefficients[pos] = row
+        return row
+    
+    def components(self, batters):
+        """
+        Section scores of every batter before the meta multipliers.
+        
+        Returns:
+            (len(batters), len(BATTER_SECTIONS)) float array
+        """
+        positions = column_values(batters, 'POS', str.upper, '', object)
+        uniques, codes = np.unique(positions.astype(str), return_inverse=True)
+        coefficients = np.array([self.coefficients(pos) for pos in uniques]).reshape(len(uniques), len(self.columns))
+        coefficients = coefficients[codes.reshape(-1)]
+        
+        values = column_matrix(batters, self.columns, typed_value, "-")
+        # Missing and zero ratings add nothing, as in calculate_batter_score
+        products = np.where(values != 0, values * coefficients, 0.0)
+        
+        components = np.zeros((len(batters), len(BATTER_SECTIONS)), dtype=np.float64)
+        for s, columns in enumerate(self.section_columns):
+            section = components[:, s]
+            for j in columns:
+                section += products[:, j]
+        return components
+    
+    def stat_results(self, batters, stat_weights_module):
+        """(stat_score, used_stats) of every batter, see calculate_batter_stat_score."""
+        return stat_score_pairs(*calculate_batter_stat_scores(batters, stat_weights_module))
+    
+    def combine(self, batters, components, meta=None, stat_results=None):
+        """
+        Score dicts from components(batters), cheap enough to redo for every
+        Draft/Stats mode change.
+        
+        Args:
+            batters: The batters components was calculated for
+            components: Result of components(batters)
+            meta: Meta multipliers to use instead of section_weights['meta']
+            stat_results: stat_results(batters, ...) for Stats Mode, or None
+        
+        Returns:
+            List of score dicts, in the order of batters
+        """
+        scores = components * np.array(self.multipliers(meta), dtype=np.float64)
+        total = scores[:, 0].copy()
+        for s in range(1, len(BATTER_SECTIONS)):
+            total += scores[:, s]
+        if stat_results is None:
+            stat_results = [(None, False)] * len(batters)
+        
+        results = []
+        for player, section, player_total, (stat_score, used_stats) in zip(
+                batters, scores.tolist(), total.tolist(), stat_results):
+            overall_score, potential_score, defense_score, baserunning_score, scout_accuracy_score = section
+            if used_stats and stat_score is not None:
+                player_total = stat_score
+            results.append({
+                "offense": round(overall_score, 2),
+                "offense_potential": round(potential_score, 2),
+                "defense": round(defense_score, 2),
+                "baserunning": round(baserunning_score, 2),
+                "scout_accuracy": round(scout_accuracy_score, 2),
+                "total": round(player_total, 2),
+                "stat_score": stat_score,
+                "used_stats": used_stats,
+                "overall_stars": player.get('OVR', '0 Stars'),
+                "potential_stars": player.get('POT', '0 Stars')
+            })
+        return results
+    
+    def score(self, batters, use_stats=False, stat_weights_module=None, meta=None):
+        """
+        Scores of every batter, the same dicts calculate_batter_score returns.
+        
+        Args:
+            batters: List of batter rows (PlayerRows of one table are read by column)
+            use_stats: Use the stat score as the total for batters with enough games
+            stat_weights_module: batter_stat_weights module, required with use_stats
+            meta: Meta multipliers to use instead of section_weights['meta']
+        
+        Returns:
+            List of score dicts, in the order of batters
+        """
+        if not batters:
+            return []
+        stat_results = None
+        if use_stats and stat_weights_module is not None:
+            stat_results = self.stat_results(batters, stat_weights_module)
+        return self.combine(batters, self.components(batters), meta, stat_results)
+
+
+# Compiled models of the section_weights in use: id(section_weights) -> model
+_score_models = {}
+
+
+def get_batter_score_model(section_weights):
+    """The BatterScoreModel of section_weights, compiled on first use."""
+    model = _score_models.get(id(section_weights))
+    if model is None or model.section_weights is not section_weights:
+        model = _score_models[id(section_weights)] = BatterScoreModel(section_weights)
+    return model
+
+
+def _drop_score_models(module_name, module):
+    if module_name == "batter_weights":
+        _score_models.clear()
+
+
+on_weights_changed(_drop_score_models)
+
+
+def calculate_batter_scores(batters, section_weights, use_stats=False, stat_weights_module=None, meta=None):
+    """
+    calculate_batter_score for a whole list of batters at once (see BatterScoreModel).
+    
+    Args:
+        meta: Meta multipliers to use instead of section_weights['meta']
+    
+    Returns:
+        List of score dicts, in the order of batters
+    """
+    return get_batter_score_model(section_weights).score(batters, use_stats, stat_weights_module, meta)
 # No file loader needed anymore!
 
 
@@ -210,10 +429,10 @@ def calculate_park_adjusted_batter_score(player, team_data):
     """
     if not team_data:
         # No team data available, return neutral adjustments
-        power_raw = parse_stat_value(player.get("POW", 0))
-        contact_raw = parse_stat_value(player.get("CON", 0))
-        gap_raw = parse_stat_value(player.get("GAP", 0))
-        eye_raw = parse_stat_value(player.get("EYE", 0))
+        power_raw = get_number(player, "POW", 0)
+        contact_raw = get_number(player, "CON", 0)
+        gap_raw = get_number(player, "GAP", 0)
+        eye_raw = get_number(player, "EYE", 0)
         
         return {
             "power_raw": power_raw,
@@ -244,10 +463,10 @@ def calculate_park_adjusted_batter_score(player, team_data):
         pf_overall = 1.0
     
     # Get raw batting ratings
-    power_raw = parse_stat_value(player.get("POW", 0))
-    contact_raw = parse_stat_value(player.get("CON", 0))
-    gap_raw = parse_stat_value(player.get("GAP", 0))
-    eye_raw = parse_stat_value(player.get("EYE", 0))
+    power_raw = get_number(player, "POW", 0)
+    contact_raw = get_number(player, "CON", 0)
+    gap_raw = get_number(player, "GAP", 0)
+    eye_raw = get_number(player, "EYE", 0)
     
     # Calculate adjusted scores using inverse of park factor
     # Lower park factor = higher adjusted score for batters
@@ -328,7 +547,7 @@ def get_park_impact_preview(player, current_team_data, new_team_data):
     avg_ratio = new_pf_avg / current_pf_avg if current_pf_avg > 0 else 1.0
     
     # Get player's raw power rating to estimate HR impact
-    power_raw = parse_stat_value(player.get("POW", 0))
+    power_raw = get_number(player, "POW", 0)
     
     # Estimate HR change based on power and park factor change
     # This is a simplified model: higher power = more sensitive to park factors
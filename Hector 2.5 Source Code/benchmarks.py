@@ -0,0 +1,300 @@
+# Benchmarks for Rosterlytics load and scoring paths
+# Run from the folder that holds your exports, e.g.:
+#     python benchmarks.py parsers
+#     python benchmarks.py parsers "Player List.html" "Team List.html"
+#     python benchmarks.py table
+#     python benchmarks.py parallel [rows]
+#     python benchmarks.py batters
+#     python benchmarks.py pitchers [count]
+#     python benchmarks.py stats [count]
+
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from batters import (
+    calculate_batter_score, calculate_batter_scores, calculate_batter_stat_score, calculate_batter_stat_scores
+)
+from html_parser import (
+    read_html_table, read_html_table_parallel, available_backends, parse_players_from_html,
+    split_players_by_type
+)
+from csv_parser import read_csv_table
+from export_files import csv_export_path
+from pitchers import (
+    calculate_score, calculate_scores, calculate_pitcher_stat_score, calculate_pitcher_stat_scores
+)
+from player_table import PlayerTable, load_player_table
+from stat_scores import stat_score_pairs
+from weights import get_weights_module, load_section_weights
+
+
+DEFAULT_EXPORTS = ["Player List.html", "Team List.html", "Free Agents.html"]
+
+
+def best_time(func, repeat=3):
+    """Run func `repeat` times and return (best wall-clock seconds, last result)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def bench_parsers(paths=None, repeat=3):
+    """
+    Time every available parser backend on each export and check that they
+    all return the same rows as the BeautifulSoup path. A CSV version of the
+    export ("Player List.csv") is timed and checked too when present.
+    """
+    paths = [p for p in (paths or DEFAULT_EXPORTS) if os.path.exists(p)]
+    if not paths:
+        print("No exports found. Pass the paths to Player List.html / Team List.html / Free Agents.html.")
+        return
+
+    backends = available_backends()
+    print(f"Backends available: {', '.join(backends)}")
+    for path in paths:
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"\n{path} ({size_mb:.2f} MB)")
+        timings = {}
+        results = {}
+        for backend in backends:
+            timings[backend], results[backend] = best_time(
+                lambda: read_html_table(path, backend), repeat
+            )
+
+        baseline = timings.get("bs4")
+        reference = results.get("bs4", results[backends[-1]])
+        for backend in backends:
+            speedup = f"{baseline / timings[backend]:6.1f}x" if baseline else "     -"
+            identical = "identical" if results[backend] == reference else "ROWS DIFFER"
+            rows = len(results[backend][1])
+            print(f"  {backend:<8} {timings[backend] * 1000:9.1f} ms  {speedup}  {rows:>6} rows  {identical}")
+
+        # CSV version of the same export, when it has been saved next to it
+        csv_path = csv_export_path(path)
+        if os.path.exists(csv_path):
+            elapsed, result = best_time(lambda: read_csv_table(csv_path), repeat)
+            speedup = f"{baseline / elapsed:6.1f}x" if baseline else "     -"
+            identical = "identical" if result == reference else "ROWS DIFFER"
+            print(f"  {'csv':<8} {elapsed * 1000:9.1f} ms  {speedup}  {len(result[1]):>6} rows  {identical}")
+
+
+def _measure(func):
+    """Return (seconds, bytes still allocated by the result, result)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, result
+
+
+def bench_player_table(paths=None, repeat=1):
+    """Compare memory and load time of list-of-dicts players vs. a PlayerTable."""
+    path = (paths or DEFAULT_EXPORTS)[0]
+    if not os.path.exists(path):
+        print(f"{path} not found.")
+        return
+    dict_time, dict_size, players = _measure(lambda: parse_players_from_html(path))
+    del players
+    table_time, table_size, table = _measure(lambda: load_player_table(path).rows())
+    print(f"{path}: {len(table)} players")
+    print(f"  dicts  {dict_time * 1000:9.1f} ms  {dict_size / (1024 * 1024):7.2f} MB")
+    print(f"  table  {table_time * 1000:9.1f} ms  {table_size / (1024 * 1024):7.2f} MB")
+
+
+SYNTHETIC_ROWS = 100_000
+
+
+def make_synthetic_export(source, path, rows=SYNTHETIC_ROWS):
+    """
+    Write a large export by repeating the body rows of a real one, e.g. to
+    stand in for a 100k-row multi-level universe.
+    """
+    with open(source, "rb") as f:
+        data = f.read()
+    table = re.search(rb"<table[^>]*class=\"[^\"]*\bdata\b", data, re.IGNORECASE)
+    body_start = re.compile(rb"<tbody[^>]*>", re.IGNORECASE).search(data, table.end()).end()
+    body_end = re.compile(rb"</tbody\s*>", re.IGNORECASE).search(data, body_start).start()
+    body = data[body_start:body_end]
+    starts = [m.start() for m in re.finditer(rb"<tr\b", body, re.IGNORECASE)]
+    source_rows = [body[a:b] for a, b in zip(starts, starts[1:] + [len(body)])]
+    with open(path, "wb") as f:
+        f.write(data[:body_start])
+        for i in range(rows):
+            f.write(source_rows[i % len(source_rows)])
+        f.write(data[body_end:])
+
+
+def bench_parallel(args=None, repeat=1):
+    """
+    Time row-chunked multiprocess parsing of a synthetic export against the
+    single-process backends, for 1, 2, 4, ... worker processes.
+    """
+    rows = int(args[0]) if args else SYNTHETIC_ROWS
+    source = DEFAULT_EXPORTS[0]
+    if not os.path.exists(source):
+        print(f"{source} not found.")
+        return
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "Synthetic Player List.html")
+    try:
+        make_synthetic_export(source, path, rows)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"Synthetic export: {rows} rows ({size_mb:.1f} MB), {os.cpu_count()} CPUs")
+        
+        single = {}
+        for backend in ("stream", "lxml"):
+            if backend in available_backends():
+                single[backend], reference = best_time(lambda: read_html_table(path, backend), repeat)
+                print(f"  {backend:<8} 1 process  {single[backend]:8.2f} s")
+        
+        baseline = min(single.values())
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            elapsed, result = best_time(lambda: read_html_table_parallel(path, workers=workers), repeat)
+            identical = "identical" if result == reference else "ROWS DIFFER"
+            print(f"  parallel {workers:>2} workers {elapsed:8.2f} s  {baseline / elapsed:5.1f}x  {identical}")
+            workers *= 2
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+        os.rmdir(folder)
+
+
+def bench_batters(paths=None, repeat=5):
+    """
+    Time scoring every batter one at a time (calculate_batter_score) against
+    the batch scorer (calculate_batter_scores), in ratings and stats mode, and
+    check that both give the same scores.
+    """
+    path = (paths or DEFAULT_EXPORTS)[0]
+    if not os.path.exists(path):
+        print(f"{path} not found.")
+        return
+    table = load_player_table(path)
+    table.normalize()
+    _pitchers, batters = split_players_by_type(table.rows())
+    _pitcher_weights, batter_weights = load_section_weights()
+    stat_weights = get_weights_module("batter_stat_weights")
+    print(f"{path}: {len(batters)} batters")
+
+    for label, use_stats in (("ratings", False), ("stats", True)):
+        one_time, one = best_time(
+            lambda: [calculate_batter_score(b, batter_weights, use_stats, stat_weights) for b in batters], repeat
+        )
+        batch_time, batch = best_time(
+            lambda: calculate_batter_scores(batters, batter_weights, use_stats, stat_weights), repeat
+        )
+        identical = "identical" if one == batch else "SCORES DIFFER"
+        print(f"  {label:<8} one at a time {one_time * 1000:7.2f} ms  batch {batch_time * 1000:7.2f} ms  "
+              f"{one_time / batch_time:5.1f}x  {identical}")
+
+
+SYNTHETIC_PITCHERS = 5_000
+
+
+def synthetic_league(path, count):
+    """
+    Normalized tables of `count` pitchers and `count` batters, made by
+    repeating the players of an export.
+    
+    Returns:
+        Tuple of (pitchers, batters, pitchers in the export)
+    """
+    headers, rows = read_html_table(path)
+    rows = [row for row in rows if len(row) == len(headers)]
+    source_pitchers, source_batters = split_players_by_type(PlayerTable.from_rows(headers, rows).rows())
+    groups = []
+    for source in (source_pitchers, source_batters):
+        group_rows = [rows[p.index] for p in source]
+        table = PlayerTable.from_rows(headers, [group_rows[i % len(group_rows)] for i in range(count)])
+        table.normalize()
+        groups.append(table.rows())
+    return groups[0], groups[1], len(source_pitchers)
+
+
+def bench_pitchers(args=None, repeat=3):
+    """
+    Time scoring pitchers one at a time (calculate_score) against the batch
+    scorer (calculate_scores) on a table of `count` pitchers, made by
+    repeating the pitchers of the Player List, and check that both give the
+    same scores.
+    """
+    count = int(args[0]) if args else SYNTHETIC_PITCHERS
+    path = DEFAULT_EXPORTS[0]
+    if not os.path.exists(path):
+        print(f"{path} not found.")
+        return
+    pitchers, _batters, source_count = synthetic_league(path, count)
+    section_weights, _batter_weights = load_section_weights()
+    stat_weights = get_weights_module("pitcher_stat_weights")
+    print(f"{count} pitchers (from {source_count} in {path})")
+
+    for label, use_stats in (("ratings", False), ("stats", True)):
+        one_time, one = best_time(
+            lambda: [calculate_score(p, section_weights, use_stats, stat_weights) for p in pitchers], repeat
+        )
+        batch_time, batch = best_time(
+            lambda: calculate_scores(pitchers, section_weights, use_stats, stat_weights), repeat
+        )
+        identical = "identical" if one == batch else "SCORES DIFFER"
+        print(f"  {label:<8} one at a time {one_time * 1000:7.1f} ms  batch {batch_time * 1000:7.1f} ms  "
+              f"{one_time / batch_time:5.1f}x  {identical}")
+
+
+def bench_stats(args=None, repeat=3):
+    """
+    Time stats-based scoring one player at a time (calculate_*_stat_score)
+    against the batch stat scorers (calculate_*_stat_scores) on `count`
+    pitchers and `count` batters, and check that both give the same results.
+    """
+    count = int(args[0]) if args else SYNTHETIC_PITCHERS
+    path = DEFAULT_EXPORTS[0]
+    if not os.path.exists(path):
+        print(f"{path} not found.")
+        return
+    pitchers, batters, _source_count = synthetic_league(path, count)
+    print(f"{count} pitchers and {count} batters (from {path})")
+
+    groups = (
+        ("pitchers", pitchers, get_weights_module("pitcher_stat_weights"),
+         calculate_pitcher_stat_score, calculate_pitcher_stat_scores),
+        ("batters", batters, get_weights_module("batter_stat_weights"),
+         calculate_batter_stat_score, calculate_batter_stat_scores),
+    )
+    for label, players, stat_weights, score_one, score_all in groups:
+        one_time, one = best_time(lambda: [score_one(p, stat_weights) for p in players], repeat)
+        batch_time, batch = best_time(lambda: stat_score_pairs(*score_all(players, stat_weights)), repeat)
+        used = sum(1 for _score, used_stats in batch if used_stats)
+        identical = "identical" if one == batch else "SCORES DIFFER"
+        print(f"  {label:<8} one at a time {one_time * 1000:7.1f} ms  batch {batch_time * 1000:7.1f} ms  "
+              f"{one_time / batch_time:5.1f}x  {identical} ({used} with stats)")
+
+
+BENCHMARKS = {
+    "parsers": bench_parsers,
+    "table": bench_player_table,
+    "parallel": bench_parallel,
+    "batters": bench_batters,
+    "pitchers": bench_pitchers,
+    "stats": bench_stats,
+}
+
+
+if __name__ == "__main__":
+    name = sys.argv[1] if len(sys.argv) > 1 else "parsers"
+    if name not in BENCHMARKS:
+        print(f"Unknown benchmark '{name}'. Choose from: {', '.join(BENCHMARKS)}")
+        sys.exit(1)
+    BENCHMARKS[name](sys.argv[2:] or None)
@@ -0,0 +1,61 @@
+# CSV Parser Module
+# Reads OOTP exports saved as CSV instead of HTML.
+#
+# OOTP can write the same list views (Player List, Free Agents, Team List) as
+# CSV files. They carry the same header row as the HTML table, duplicate CON /
+# CON P / WAR headers included, so the rows go through the same export schema
+# (see export_schema) and produce exactly the same players. The stdlib csv
+# reader is C code and reads the file in one streaming pass, which is far
+# cheaper than tokenising rendered HTML.
+#
+# Exports are looked up by their usual HTML name; export_files.find_export()
+# switches to a "<name>.csv" next to it when that is the newer file.
+
+import csv
+import io
+
+from export_files import CSV_EXTENSION, export_format, open_export
+
+
+# Tried in order; OOTP writes UTF-8 (with a BOM on Windows), older builds Latin-1
+CSV_ENCODINGS = ("utf-8-sig", "latin-1")
+
+
+def is_csv_export(path):
+    """True when path names a CSV export (compressed or not)."""
+    return export_format(path) == CSV_EXTENSION
+
+
+def _read_rows(csv_path, encoding):
+    with open_export(csv_path) as raw:
+        reader = csv.reader(io.TextIOWrapper(raw, encoding=encoding, newline=""))
+        headers = None
+        rows = []
+        for row in reader:
+            if not row:
+                continue  # blank line
+            cells = list(map(str.strip, row))
+            if headers is None:
+                headers = cells
+            else:
+                rows.append(cells)
+    return headers or [], rows
+
+
+def read_csv_table(csv_path):
+    """
+    Read the header and body rows of an OOTP CSV export.
+    
+    Args:
+        csv_path: Path to the CSV file (gzip, xz and zip files are decompressed as read)
+    
+    Returns:
+        Tuple of (headers, rows) like html_parser.read_html_table: cell text
+        lists, returned as found; callers skip rows with the wrong cell count.
+    """
+    for encoding in CSV_ENCODINGS[:-1]:
+        try:
+            return _read_rows(csv_path, encoding)
+        except UnicodeDecodeError:
+            continue
+    return _read_rows(csv_path, CSV_ENCODINGS[-1])
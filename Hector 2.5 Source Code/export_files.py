@@ -0,0 +1,150 @@
+# Export Files Module
+# Finds and opens the file an OOTP export is read from.
+#
+# An export can sit next to the app as HTML ("Player List.html"), as CSV
+# ("Player List.csv", see csv_parser), or compressed in either form
+# ("Player List.html.gz", "Player List.csv.xz", "Player List.zip", ...).
+# Compressed exports are decompressed on the fly while they are parsed:
+# nothing is extracted to disk and only the parser's read buffer is held in
+# memory on top of the parsed rows.
+#
+# find_export() picks the newest of these files for an export name, so the
+# app keeps using its usual names whatever format OOTP (or an archive script)
+# left in the folder.
+
+import gzip
+import lzma
+import os
+import zipfile
+from contextlib import contextmanager
+
+
+HTML_EXTENSION = ".html"
+CSV_EXTENSION = ".csv"
+EXPORT_EXTENSIONS = (CSV_EXTENSION, HTML_EXTENSION, ".htm")
+
+# Compression formats read by open_export, in order of preference on equal dates
+COMPRESSED_EXTENSIONS = (".gz", ".xz", ".zip")
+
+
+def compression_of(path):
+    """The compression extension of path (".gz", ".xz" or ".zip"), or None."""
+    ext = os.path.splitext(path)[1].lower()
+    return ext if ext in COMPRESSED_EXTENSIONS else None
+
+
+def is_compressed(path):
+    """True when path names a compressed export."""
+    return compression_of(path) is not None
+
+
+def _zip_member(archive, path):
+    # "Player List.zip" holds "Player List.html"; otherwise the first export inside
+    members = [info for info in archive.infolist()
+               if not info.is_dir() and os.path.splitext(info.filename)[1].lower() in EXPORT_EXTENSIONS]
+    if not members:
+        raise ValueError(f"No .html or .csv export found in {path}")
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for info in members:
+        if os.path.splitext(os.path.basename(info.filename))[0] == stem:
+            return info
+    return members[0]
+
+
+def export_format(path):
+    """
+    File format of an export once decompressed: ".csv" or ".html".
+    
+    Args:
+        path: Export path, compressed or not
+    
+    Returns:
+        CSV_EXTENSION or HTML_EXTENSION
+    """
+    compression = compression_of(path)
+    if compression == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            name = _zip_member(archive, path).filename
+    elif compression is not None:
+        name = path[:-len(compression)]
+    else:
+        name = path
+    return CSV_EXTENSION if os.path.splitext(name)[1].lower() == CSV_EXTENSION else HTML_EXTENSION
+
+
+@contextmanager
+def open_export(path):
+    """
+    Open an export for binary reading, decompressing gzip, xz and zip sources
+    as they are read.
+    
+    Args:
+        path: Export path, compressed or not
+    
+    Yields:
+        Binary file object positioned at the start of the (decompressed) export
+    """
+    compression = compression_of(path)
+    if compression == ".gz":
+        with gzip.open(path, "rb") as f:
+            yield f
+    elif compression == ".xz":
+        with lzma.open(path, "rb") as f:
+            yield f
+    elif compression == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            with archive.open(_zip_member(archive, path)) as f:
+                yield f
+    else:
+        with open(path, "rb") as f:
+            yield f
+
+
+def csv_export_path(path):
+    """The CSV counterpart of an export name ("Player List.html" -> "Player List.csv")."""
+    return os.path.splitext(path)[0] + CSV_EXTENSION
+
+
+def export_paths(path):
+    """
+    Every file an export name can be read from, most preferred first: CSV,
+    HTML, then their compressed versions (e.g., for watching the folder).
+    
+    Args:
+        path: Export path as named in the app (e.g., "Player List.html")
+    
+    Returns:
+        List of paths; a CSV or compressed path is returned on its own
+    """
+    if is_compressed(path) or os.path.splitext(path)[1].lower() == CSV_EXTENSION:
+        return [path]
+    base = os.path.splitext(path)[0]
+    plain = [base + CSV_EXTENSION, path]
+    compressed = [name + ext for name in plain for ext in COMPRESSED_EXTENSIONS]
+    return plain + compressed + [base + ".zip"]
+
+
+def find_export(path):
+    """
+    Pick the file to read for an export name.
+    
+    The newest existing file from export_paths() wins; on equal dates CSV is
+    preferred over HTML and plain files over compressed ones. When none of
+    them exists path is returned unchanged.
+    
+    Args:
+        path: Export path as named in the app (e.g., "Player List.html")
+    
+    Returns:
+        Path of the file to read
+    """
+    best = None
+    best_mtime = None
+    for candidate in export_paths(path):
+        try:
+            mtime = os.path.getmtime(candidate)
+        except OSError:
+            continue
+        if best_mtime is None or mtime > best_mtime:
+            best, best_mtime = candidate, mtime
+    return best or path
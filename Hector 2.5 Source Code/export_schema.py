@@ -0,0 +1,165 @@
+# Export Schema Module
+# Resolves the column layout of an OOTP player export once per file.
+#
+# OOTP writes some headers twice, once in the batting block and once in the
+# pitching block: CON (contact / control), CON P and WAR. Building a dict per
+# row silently kept only the last one, so every batter's CON was really the
+# pitcher control column. The schema renames each duplicate by the block it
+# sits in ("CON (Batter)", "CON (Pitcher)", "WAR (Batter)", ...) and adds role
+# aliases, so "CON" still works and means contact for batters and control for
+# pitchers. The result is a compiled plan of cell indices that turns every raw
+# row into a fixed tuple with one C-level itemgetter call.
+
+from operator import itemgetter
+
+from html_parser import PITCHER_POSITIONS
+
+
+ROLE_BATTER = "Batter"
+ROLE_PITCHER = "Pitcher"
+
+# Headers that exist once per role; duplicates are renamed "<header> (<role>)"
+ROLE_HEADERS = ("CON", "CON P", "WAR")
+
+# Role headers that stay readable under their plain name, resolved per player
+# by position. WAR keeps only its role names, as it always has.
+ROLE_ALIASES = ("CON", "CON P")
+
+# Neighbouring headers that identify the batting and pitching blocks
+BATTER_BLOCK_HEADERS = frozenset({
+    "GAP", "POW", "EYE", "K's", "GAP P", "POW P", "EYE P", "K P",
+    "OPS+", "wRC+", "AVG", "OBP", "SLG", "HR", "BABIP",
+})
+PITCHER_BLOCK_HEADERS = frozenset({
+    "STU", "MOV", "STU P", "MOV P", "PIT", "VELO", "STM",
+    "IP", "ERA", "ERA+", "FIP", "WHIP",
+})
+
+
+def _header_role(headers, i):
+    # The header just before decides (WAR follows wRC+ / ERA+), then the one after
+    for j in (i - 1, i + 1):
+        if 0 <= j < len(headers):
+            if headers[j] in BATTER_BLOCK_HEADERS:
+                return ROLE_BATTER
+            if headers[j] in PITCHER_BLOCK_HEADERS:
+                return ROLE_PITCHER
+    return None
+
+
+class ExportSchema:
+    """
+    Compiled column plan for one export.
+    
+    Attributes:
+        headers: Header cells exactly as exported
+        columns: Unique column names, in export order
+        aliases: Alias column -> {role: resolved column}
+    
+    project() turns raw cell lists into tuples ordered like columns.
+    """
+    
+    def __init__(self, headers, columns, indices, aliases, role_index=None):
+        self.headers = list(headers)
+        self.columns = list(columns)
+        self.aliases = aliases
+        self.width = len(self.headers)
+        self._role_index = role_index
+        
+        # One plan per role; they only differ in the cells the aliases read
+        self._plans = {}
+        for role in (ROLE_BATTER, ROLE_PITCHER):
+            plan = [indices[name] if name not in aliases else indices[aliases[name][role]]
+                    for name in self.columns]
+            self._plans[role] = self._getter(plan)
+    
+    @staticmethod
+    def _getter(plan):
+        if len(plan) == 1:
+            single = itemgetter(plan[0])
+            return lambda cells: (single(cells),)
+        return itemgetter(*plan)
+    
+    def project(self, rows):
+        """
+        Map raw rows onto the schema's columns.
+        
+        Args:
+            rows: Cell lists as read from the export; rows with the wrong
+                number of cells are skipped
+        
+        Returns:
+            List of tuples ordered like columns
+        """
+        width = self.width
+        batter = self._plans[ROLE_BATTER]
+        if self._role_index is None:
+            return [batter(cells) for cells in rows if len(cells) == width]
+        
+        pitcher = self._plans[ROLE_PITCHER]
+        pos = self._role_index
+        projected = []
+        for cells in rows:
+            if len(cells) != width:
+                continue  # skip junk
+            if cells[pos].strip().upper() in PITCHER_POSITIONS:
+                projected.append(pitcher(cells))
+            else:
+                projected.append(batter(cells))
+        return projected
+
+
+def compile_schema(headers):
+    """
+    Resolve an export's header row into an ExportSchema.
+    
+    Role headers (CON, CON P, WAR) are named after the block they sit in.
+    Any other repeated header keeps its plain name on the last occurrence,
+    as a dict per row did, and earlier ones become "<header> (<n>)".
+    
+    Args:
+        headers: Header cells of the export's table
+    
+    Returns:
+        ExportSchema
+    """
+    counts = {}
+    for header in headers:
+        counts[header] = counts.get(header, 0) + 1
+    
+    names = []
+    seen = {}
+    for i, header in enumerate(headers):
+        seen[header] = seen.get(header, 0) + 1
+        role = _header_role(headers, i) if header in ROLE_HEADERS else None
+        if role is None and header in ROLE_HEADERS and counts[header] > 1:
+            # Unlabelled duplicates: OOTP lists batting before pitching
+            role = ROLE_BATTER if seen[header] == 1 else ROLE_PITCHER
+        if role is not None:
+            names.append(f"{header} ({role})")
+        elif seen[header] < counts[header]:
+            names.append(f"{header} ({seen[header]})")
+        else:
+            names.append(header)
+    
+    indices = {}
+    for i, name in enumerate(names):
+        indices.setdefault(name, i)  # a role name can only repeat in malformed exports
+    
+    columns = []
+    aliases = {}
+    for i, (header, name) in enumerate(zip(headers, names)):
+        if indices[name] != i:
+            continue
+        if header in ROLE_ALIASES and name != header and header not in aliases and header not in indices:
+            batter = f"{header} ({ROLE_BATTER})"
+            pitcher = f"{header} ({ROLE_PITCHER})"
+            aliases[header] = {
+                ROLE_BATTER: batter if batter in indices else pitcher,
+                ROLE_PITCHER: pitcher if pitcher in indices else batter,
+            }
+            columns.append(header)
+        columns.append(name)
+    
+    role_index = indices.get("POS") if aliases else None
+    return ExportSchema(headers, columns, indices, aliases, role_index)
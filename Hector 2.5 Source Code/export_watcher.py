@@ -0,0 +1,172 @@
+# Export Watcher Module
+# Notices when OOTP has finished re-writing one of the league exports.
+#
+# A background thread checks the size and modification time of each watched
+# file. A change is only reported once the file has stopped changing for
+# SETTLE_SECONDS and can be opened, so a half-written export is never loaded.
+# On Linux, inotify (through the optional inotify_simple package) wakes the
+# thread as soon as the folder changes; everywhere else it polls.
+#
+# The watcher never touches the GUI: callers collect finished changes with
+# pending() from the Tk main loop (see gui/core.py).
+
+import os
+import sys
+import threading
+import time
+
+
+# Seconds between checks when polling
+POLL_INTERVAL = 1.0
+
+# A changed export must keep the same size and mtime this long before it is reported
+SETTLE_SECONDS = 1.5
+
+
+def _load_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import inotify_simple
+    except ImportError:
+        return None
+    return inotify_simple
+
+
+def _file_state(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _can_read(path):
+    # Windows keeps a file locked while OOTP is still writing it
+    try:
+        with open(path, "rb"):
+            return True
+    except OSError:
+        return False
+
+
+class ExportWatcher:
+    """
+    Watch a set of export files and report each finished rewrite once.
+    
+    Args:
+        paths: Files to watch (they may not exist yet)
+        interval: Seconds between checks when polling
+        settle: Seconds a changed file must stay unchanged before it is reported
+    """
+    
+    def __init__(self, paths, interval=POLL_INTERVAL, settle=SETTLE_SECONDS):
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.interval = interval
+        self.settle = settle
+        self._known = {path: _file_state(path) for path in self.paths}
+        self._changing = {}  # path -> (state, time it was first seen)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._inotify = None
+    
+    @property
+    def mode(self):
+        """Either "inotify" or "polling"."""
+        return "inotify" if self._inotify is not None else "polling"
+    
+    def start(self):
+        """Start watching in a daemon thread."""
+        if self._thread is not None:
+            return self
+        self._setup_inotify()
+        self._thread = threading.Thread(target=self._run, name="ExportWatcher", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop watching; pending changes are kept."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+            if self._thread.is_alive():
+                return  # Still inside a read; the daemon thread exits on its own
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+    
+    def pending(self):
+        """Return and clear the exports that finished changing since the last call."""
+        with self._lock:
+            changed, self._pending = self._pending, set()
+        return sorted(changed)
+    
+    def acknowledge(self, paths=None):
+        """
+        Treat the current state of paths (default: all) as already loaded, e.g.
+        after a manual reload, so it is not reported again.
+        """
+        paths = self.paths if paths is None else [os.path.abspath(path) for path in paths]
+        with self._lock:
+            for path in paths:
+                self._known[path] = _file_state(path)
+                self._changing.pop(path, None)
+            self._pending.difference_update(paths)
+    
+    def _setup_inotify(self):
+        inotify_simple = _load_inotify()
+        if inotify_simple is None:
+            return
+        try:
+            inotify = inotify_simple.INotify()
+            flags = inotify_simple.flags
+            mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE | flags.MODIFY
+            for folder in {os.path.dirname(path) for path in self.paths}:
+                inotify.add_watch(folder, mask)
+        except OSError as e:
+            print(f"Warning: inotify unavailable, polling exports instead: {e}")
+            return
+        self._inotify = inotify
+    
+    def _wait(self):
+        if self._inotify is not None:
+            # Returns early on any change in the folder
+            self._inotify.read(timeout=int(self.interval * 1000))
+        else:
+            self._stop.wait(self.interval)
+    
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._wait()
+            except OSError:
+                self._stop.wait(self.interval)
+            if self._stop.is_set():
+                break
+            self.check()
+    
+    def check(self, now=None):
+        """
+        Compare every watched file with its last known state once. Called by
+        the watcher thread; exposed so the debounce can be driven directly.
+        """
+        now = time.monotonic() if now is None else now
+        for path in self.paths:
+            state = _file_state(path)
+            with self._lock:
+                if state == self._known[path]:
+                    self._changing.pop(path, None)
+                    continue
+                seen = self._changing.get(path)
+                if seen is None or seen[0] != state:
+                    # Still being written (or just started): restart the settle timer
+                    self._changing[path] = (state, now)
+                    continue
+                if state is None or now - seen[1] < self.settle or not _can_read(path):
+                    continue
+                self._known[path] = state
+                del self._changing[path]
+                self._pending.add(path)
@@ -0,0 +1,163 @@
+# Field Types Module
+# Typed values for OOTP export cells, parsed once per distinct cell.
+#
+# Every cell is classified by its format and converted a single time:
+#     "3.5 Stars"    -> stars       3.5
+#     "65", "1,234"  -> number      65.0, 1234.0   (20-80 ratings and stats)
+#     "12.5%"        -> percent     12.5
+#     "89-91", "100+"-> velocity    90.0, 100.0
+#     "$9,000,000"   -> currency    9.0            (millions, like parse_salary)
+#     "1 (auto.)"    -> years_left  1.0 with status "pre_arb"
+#     "", "-"        -> missing     0.0
+#     anything else  -> text        0.0
+# PlayerTable normalises every column this way at load time; the get_*
+# accessors below read those typed values and fall back to parsing for
+# plain dict players.
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+
+KIND_MISSING = "missing"
+KIND_TEXT = "text"
+KIND_NUMBER = "number"
+KIND_STARS = "stars"
+KIND_PERCENT = "percent"
+KIND_VELOCITY = "velocity"
+KIND_CURRENCY = "currency"
+KIND_YEARS_LEFT = "years_left"
+
+# YL status markers and the contract status they map to (see parse_years_left)
+YEARS_LEFT_STATUS = {
+    "auto.": "pre_arb",
+    "arbitr.": "arbitration",
+}
+
+# Number of distinct cell strings whose typed value is kept for dict players
+TYPED_CACHE_SIZE = 65536
+
+_VELOCITY_RANGE_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)(?:\s*mph)?$")
+_VELOCITY_PLUS_RE = re.compile(r"^(\d+(?:\.\d+)?)\+(?:\s*mph)?$")
+_YEARS_LEFT_RE = re.compile(r"\((auto\.|arbitr\.)\)")
+_LEADING_INT_RE = re.compile(r"(\d+)")
+
+TypedCell = namedtuple("TypedCell", ["kind", "value", "status"])
+
+MISSING_CELL = TypedCell(KIND_MISSING, 0.0, None)
+
+
+@lru_cache(maxsize=TYPED_CACHE_SIZE)
+def _parse_text_cell(val):
+    val = val.strip()
+    if not val or val == "-":
+        return MISSING_CELL
+    try:
+        if val.endswith("Stars"):
+            return TypedCell(KIND_STARS, float(val.split()[0]), None)
+        if val.startswith("$"):
+            return TypedCell(KIND_CURRENCY, float(val[1:].replace(",", "")) / 1_000_000, None)
+        if val.endswith("%"):
+            return TypedCell(KIND_PERCENT, float(val[:-1].replace(",", "")), None)
+    except (ValueError, IndexError):
+        return TypedCell(KIND_TEXT, 0.0, None)
+    
+    match = _YEARS_LEFT_RE.search(val)
+    if match:
+        years = _LEADING_INT_RE.match(val)
+        return TypedCell(KIND_YEARS_LEFT, float(years.group(1)) if years else 1.0, YEARS_LEFT_STATUS[match.group(1)])
+    match = _VELOCITY_RANGE_RE.match(val)
+    if match:
+        return TypedCell(KIND_VELOCITY, (float(match.group(1)) + float(match.group(2))) / 2, None)
+    match = _VELOCITY_PLUS_RE.match(val)
+    if match:
+        return TypedCell(KIND_VELOCITY, float(match.group(1)), None)
+    
+    try:
+        return TypedCell(KIND_NUMBER, float(val.replace(",", "")), None)
+    except ValueError:
+        return TypedCell(KIND_TEXT, 0.0, None)
+
+
+def parse_cell(raw):
+    """
+    Convert one export cell into a TypedCell(kind, value, status).
+    
+    Args:
+        raw: Cell text (or a number / None, e.g. a .get() default)
+    
+    Returns:
+        TypedCell; value is always a float (0.0 for missing and text cells)
+    """
+    if raw is None:
+        return MISSING_CELL
+    if isinstance(raw, str):
+        return _parse_text_cell(raw)
+    try:
+        return TypedCell(KIND_NUMBER, float(raw), None)
+    except (TypeError, ValueError):
+        return TypedCell(KIND_TEXT, 0.0, None)
+
+
+def typed_value(raw):
+    """Numeric value of one export cell (see parse_cell)."""
+    return parse_cell(raw).value
+
+
+def _cell(player, key, default):
+    if type(player) is not dict:
+        typed_cell = getattr(player, "typed_cell", None)
+        if typed_cell is not None:
+            return typed_cell(key, default)
+    return parse_cell(player.get(key, default))
+
+
+def get_typed(player, key, default=None):
+    """
+    Typed value of a player field as a TypedCell.
+    
+    Works on PlayerTable rows (pre-parsed at load) and plain dicts. When the
+    field is absent, default is parsed instead, just like parse_x(player.get(key, default)).
+    """
+    return _cell(player, key, default)
+
+
+def get_number(player, key, default=0):
+    """
+    Numeric value of a player field: star ratings, 20-80 ratings, stats,
+    percents, velocity ranges (averaged) and currency (in millions).
+    Missing and text cells are 0.0.
+    """
+    if type(player) is not dict:
+        typed_number = getattr(player, "typed_number", None)
+        if typed_number is not None:
+            return typed_number(key, default)
+    return parse_cell(player.get(key, default)).value
+
+
+def get_salary(player, key="SLR", default=0):
+    """
+    Dollar amount of a player field in millions (e.g. $9,000,000 -> 9.0).
+    Plain numbers are treated as dollars, as parse_salary does.
+    """
+    cell = _cell(player, key, default)
+    if cell.kind == KIND_NUMBER:
+        return cell.value / 1_000_000
+    if cell.kind == KIND_CURRENCY:
+        return cell.value
+    return 0.0
+
+
+def get_years_left(player, key="YL", default=None):
+    """
+    Years left on a player's contract with its status.
+    
+    Returns a new dict with years (int) and status (str), the same shape as
+    trade_value.parse_years_left: "pre_arb", "arbitration", "signed" or "unknown".
+    """
+    cell = _cell(player, key, default)
+    if cell.kind == KIND_YEARS_LEFT:
+        return {"years": int(cell.value), "status": cell.status}
+    if cell.kind == KIND_NUMBER:
+        return {"years": int(cell.value), "status": "signed"}
+    return {"years": 0, "status": "unknown"}
@@ -6,11 +6,13 @@ from tkinter import ttk
 from .style import on_treeview_motion, on_leave, sort_treeview
 from .widgets import make_treeview_open_link_handler, load_player_url_template, bind_player_card_right_click
 from advanced_stats import (
-    add_advanced_stats_to_players,
+    calculate_advanced_stats,
     STAT_RANGES,
     BABIP_LUCKY_THRESHOLD,
     BABIP_UNLUCKY_THRESHOLD,
 )
+from progress import Progress, STAGE_ADVANCED_STATS
+from .background import get_background_tasks, PROGRESS_POLL_MS
 
 player_url_template = load_player_url_template()
 
@@ -531,16 +533,67 @@ def add_advanced_stats_tab(notebook, font):
     min_age_var.trace_add("write", on_age_change)
     max_age_var.trace_add("write", on_age_change)
     
+    compute_state = {"progress": None}  # Progress token while advanced stats are calculated
+    
+    def compute_advanced_stats(pitchers, batters, changes, progress):
+        """
+        Calculate advanced stats for the players that need them (runs on a
+        worker thread). After an incremental reload only inserted/changed
+        players (and any without stats yet) are recalculated.
+        
+        The players are shared with the other tabs and the loader, so nothing
+        is written to them here: the (player, stats) pairs are returned and
+        show_advanced_stats assigns them on the main thread.
+        """
+        if changes is not None:
+            pitchers_to_update = [p for p in pitchers if changes.affects(p) or "advanced_stats" not in p]
+            batters_to_update = [b for b in batters if changes.affects(b) or "advanced_stats" not in b]
+        else:
+            pitchers_to_update, batters_to_update = pitchers, batters
+        progress.start_stage(STAGE_ADVANCED_STATS, len(pitchers_to_update) + len(batters_to_update))
+        updates = calculate_advanced_stats(pitchers_to_update, "pitcher", progress)
+        updates += calculate_advanced_stats(batters_to_update, "batter", progress)
+        progress.finish()
+        return pitchers, batters, updates
+    
+    def show_advanced_stats(result):
+        compute_state["progress"] = None
+        pitchers, batters, updates = result
+        for player, stats in updates:
+            player["advanced_stats"] = stats
+        all_pitchers.clear()
+        all_batters.clear()
+        all_pitchers.extend(pitchers)
+        all_batters.extend(batters)
+        update_team_list()
+        update_table()
+    
+    def on_compute_error(error):
+        compute_state["progress"] = None
+        summary_var.set("")
+        print(f"Warning: Could not calculate advanced stats: {error}")
+    
+    def show_compute_progress(progress):
+        if compute_state["progress"] is not progress:
+            return  # Finished or superseded
+        _stage, fraction = progress.status()
+        summary_var.set(f"Calculating advanced stats... {fraction:.0%}")
+        summary_label.after(PROGRESS_POLL_MS, show_compute_progress, progress)
+    
     class AdvancedStatsTab:
-        def refresh(self, pitchers, batters):
-            all_pitchers.clear()
-            all_batters.clear()
-            
-            # Add advanced stats to all players
-            all_pitchers.extend(add_advanced_stats_to_players(list(pitchers), "pitcher"))
-            all_batters.extend(add_advanced_stats_to_players(list(batters), "batter"))
-            
-            update_team_list()
-            update_table()
+        def refresh(self, pitchers, batters, changes=None):
+            # Calculated in the background; the table keeps showing the
+            # previous players until the new ones are ready
+            if compute_state["progress"] is not None:
+                # The running calculation is superseded and its stats dropped,
+                # so this one can't rely on the players it would have updated
+                changes = None
+            progress = Progress()
+            compute_state["progress"] = progress
+            get_background_tasks().submit(
+                "advanced_stats.compute", compute_advanced_stats, list(pitchers), list(batters), changes, progress,
+                on_done=show_advanced_stats, on_error=on_compute_error, progress=progress
+            )
+            show_compute_progress(progress)
     
     return AdvancedStatsTab()
@@ -0,0 +1,156 @@
+# Background Tasks
+# Runs tab computations (searches, scans, roster generation) off the Tk main
+# thread and hands the results back to it
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from progress import OperationCancelled
+
+# Worker threads shared by every tab
+BACKGROUND_WORKERS = 2
+
+# How often the main loop collects finished results while tasks are running (ms)
+RESULT_POLL_MS = 30
+
+# How often tabs redraw a running task's progress (ms)
+PROGRESS_POLL_MS = 100
+
+
+class BackgroundTasks:
+    """
+    Shared executor for tab computations.
+    
+    Work is submitted on a named channel (e.g. "trade_builder.search"). Each
+    submit supersedes the previous request on the same channel: when an older
+    request finishes after a newer one was submitted, its result is dropped,
+    so a burst of filter changes only ever shows the latest result.
+    
+    Workers never touch Tk. They put results on a thread-safe queue that the
+    main loop drains with after() while tasks are outstanding; callbacks run
+    on the main thread.
+    
+    Functions run in threads, so they should be given copies of any lists the
+    tab may change while they run (e.g. list(all_batters)) and must not read
+    Tk variables; read filter values first and pass them in.
+    
+    A request can carry a Progress token (see progress). It is cancelled
+    when the request is superseded or cancel() is called, so a long
+    computation stops at its next step instead of running to a dropped result.
+    """
+    
+    def __init__(self, workers=BACKGROUND_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="TabWorker")
+        self._results = queue.SimpleQueue()
+        self._generations = {}  # channel -> latest request number
+        self._progress = {}  # channel -> Progress token of the latest request
+        self._outstanding = 0
+        self._lock = threading.Lock()
+        self._root = None
+        self._polling = False
+    
+    def attach(self, root):
+        """Deliver results through root's main loop."""
+        self._root = root
+    
+    def submit(self, channel, func, *args, on_done=None, on_error=None, progress=None, **kwargs):
+        """
+        Run func(*args, **kwargs) on a worker thread.
+        
+        Args:
+            channel: Name of the request stream; a newer submit on the same
+                channel makes this one stale
+            func: Computation to run; must not touch Tk
+            on_done: Called on the main thread with func's result, unless stale
+            on_error: Called on the main thread with the exception, unless stale;
+                defaults to printing a warning
+            progress: Progress token func reports on (pass it in args/kwargs
+                too); cancelled when this request is superseded
+        
+        Returns:
+            The request number (see is_current)
+        """
+        with self._lock:
+            generation = self._generations.get(channel, 0) + 1
+            self._generations[channel] = generation
+            previous = self._progress.pop(channel, None)
+            if progress is not None:
+                self._progress[channel] = progress
+            self._outstanding += 1
+        if previous is not None:
+            previous.cancel()
+        
+        def run():
+            try:
+                self._results.put((channel, generation, True, func(*args, **kwargs), on_done, on_error))
+            except OperationCancelled as e:  # Superseded; dropped as stale
+                self._results.put((channel, generation, False, e, on_done, on_error))
+            except Exception as e:  # Reported on the main thread
+                self._results.put((channel, generation, False, e, on_done, on_error))
+        
+        if self._root is None:
+            # Not attached to a main loop (tests, headless use): run inline
+            run()
+            self._deliver()
+            return generation
+        self._executor.submit(run)
+        self._start_polling()
+        return generation
+    
+    def cancel(self, channel):
+        """Drop the result of any request still running on channel and cancel its progress token."""
+        with self._lock:
+            self._generations[channel] = self._generations.get(channel, 0) + 1
+            progress = self._progress.pop(channel, None)
+        if progress is not None:
+            progress.cancel()
+    
+    def is_current(self, channel, generation):
+        """True while generation is the latest request on channel."""
+        with self._lock:
+            return self._generations.get(channel) == generation
+    
+    def shutdown(self):
+        """Stop accepting work; running tasks finish in the background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _start_polling(self):
+        if not self._polling:
+            self._polling = True
+            self._root.after(RESULT_POLL_MS, self._poll)
+    
+    def _poll(self):
+        self._polling = False
+        self._deliver()
+        if self._outstanding > 0:
+            self._start_polling()
+    
+    def _deliver(self):
+        while True:
+            try:
+                channel, generation, ok, value, on_done, on_error = self._results.get_nowait()
+            except queue.Empty:
+                return
+            with self._lock:
+                self._outstanding -= 1
+            if not self.is_current(channel, generation):
+                continue  # Superseded by a newer request
+            if ok:
+                if on_done is not None:
+                    on_done(value)
+            elif on_error is not None:
+                on_error(value)
+            else:
+                print(f"Warning: Background task '{channel}' failed: {value}")
+
+
+_background_tasks = None
+
+
+def get_background_tasks():
+    """The shared BackgroundTasks instance (created on first use)."""
+    global _background_tasks
+    if _background_tasks is None:
+        _background_tasks = BackgroundTasks()
+    return _background_tasks
@@ -15,7 +15,9 @@ from .tooltips import (
     add_search_tooltip, attach_treeview_heading_tooltips, BATTER_COL_TOOLTIPS,
     attach_treeview_row_tooltips, HIGHLIGHT_EXPLANATIONS, add_button_tooltip
 )
-from batters import calculate_batter_score
+from batters import get_batter_score_model
+from score_modes import ModeScores
+from weights import get_weights_module
 from trade_value import calculate_trade_value
 
 player_url_template = load_player_url_template()
@@ -221,81 +223,48 @@ def add_batter_tab(notebook, font):
     
     # Bind right-click for player card popup
     bind_player_card_right_click(table, player_data_map, lambda p: (p, "batter"))
-    # Import weights module to access and modify weights
-    import sys
-    import importlib.util
+    # Scores shown under the Draft/Stats modes, by id(batter); None while both
+    # modes are off. The players' own "Scores" stay as loaded: other tabs read them
+    mode_scores = {"source": None, "shown": None}
     
-    def get_weights_module():
-        """Get batter weights module - uses same logic as core.py for frozen apps"""
-        # Import here to avoid circular import
-        from .core import get_weights_dir
-        weights_path = get_weights_dir() / "batter_weights.py"
-        if "batter_weights" in sys.modules:
-            return sys.modules["batter_weights"]
-        spec = importlib.util.spec_from_file_location("batter_weights", str(weights_path))
-        weights_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(weights_module)
-        sys.modules["batter_weights"] = weights_module
-        return weights_module
+    def scores_of(b):
+        """The scores this tab shows for a batter under the current modes."""
+        shown = mode_scores["shown"]
+        if shown is None:
+            return b["Scores"]
+        return shown.get(id(b), b["Scores"])
     
-    def get_stat_weights_module():
-        """Get batter stat weights module for stats-based scoring"""
-        from .core import get_weights_dir
-        weights_path = get_weights_dir() / "batter_stat_weights.py"
-        if "batter_stat_weights" in sys.modules:
-            del sys.modules["batter_stat_weights"]  # Always reload to get fresh values
-        spec = importlib.util.spec_from_file_location("batter_stat_weights", str(weights_path))
-        stat_weights_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(stat_weights_module)
-        sys.modules["batter_stat_weights"] = stat_weights_module
-        return stat_weights_module
-    
-    # Store original meta values
-    original_meta_values = {
-        "overall": None,
-        "potential": None
-    }
-    
-    def recalculate_scores_with_modes():
-        """Recalculate all batter scores with draft mode and stats mode"""
-        weights_module = get_weights_module()
-        weights = weights_module.section_weights
-        
-        # Store original values on first call
-        if original_meta_values["overall"] is None:
-            original_meta_values["overall"] = weights["meta"].get("overall", 1.0)
-            original_meta_values["potential"] = weights["meta"].get("potential", 1.0)
+    def apply_score_modes():
+        """
+        Show batter scores for the current Draft and Stats modes and re-sort.
         
-        if draft_mode_var.get():
-            # Draft mode: emphasize potential
-            weights["meta"]["potential"] = 1.5
-            weights["meta"]["overall"] = 0.9
-        else:
-            # Normal mode: restore original weights
-            weights["meta"]["potential"] = original_meta_values["potential"]
-            weights["meta"]["overall"] = original_meta_values["overall"]
-        
-        # Get stat weights module if stats mode is enabled
+        The ratings are read into score components once per batter list (see
+        score_modes); toggling a mode only recombines them.
+        """
         stat_weights_module = None
-        use_stats = stats_mode_var.get()
-        if use_stats:
+        if stats_mode_var.get():
             try:
-                stat_weights_module = get_stat_weights_module()
+                stat_weights_module = get_weights_module("batter_stat_weights")
             except Exception as e:
                 print(f"Warning: Could not load stat weights: {e}")
-                use_stats = False
         
-        # Recalculate all batter scores
-        for batter in add_batter_tab.CURRENT_BATTERS:
-            batter['Scores'] = calculate_batter_score(
-                batter, weights, 
-                use_stats=use_stats, 
-                stat_weights_module=stat_weights_module
-            )
+        if not draft_mode_var.get() and stat_weights_module is None:
+            mode_scores["shown"] = None
+        else:
+            weights = get_weights_module("batter_weights").section_weights
+            model = get_batter_score_model(weights)
+            source = mode_scores["source"]
+            if source is None or source.model is not model:
+                source = mode_scores["source"] = ModeScores(add_batter_tab.CURRENT_BATTERS, model)
+            meta = None
+            if draft_mode_var.get():
+                # Draft mode: emphasize potential
+                meta = dict(weights.get("meta", {}), potential=1.5, overall=0.9)
+            mode_scores["shown"] = source.scores(meta, stat_weights_module)
         
-        # Re-sort by new total scores
+        # Re-sort by the shown total scores
         add_batter_tab.CURRENT_BATTERS.sort(
-            key=lambda b: b["Scores"].get("total", 0), reverse=True
+            key=lambda b: scores_of(b).get("total", 0), reverse=True
         )
         
         # Refresh display
@@ -307,12 +276,12 @@ def add_batter_tab(notebook, font):
     def on_draft_mode_toggle(*args):
         """Callback when draft mode toggle changes"""
         if add_batter_tab.CURRENT_BATTERS:  # Only recalculate if we have players
-            recalculate_scores_with_modes()
+            apply_score_modes()
     
     def on_stats_mode_toggle(*args):
         """Callback when stats mode toggle changes"""
         if add_batter_tab.CURRENT_BATTERS:  # Only recalculate if we have players
-            recalculate_scores_with_modes()
+            apply_score_modes()
     
     draft_mode_var.trace("w", on_draft_mode_toggle)
     stats_mode_var.trace("w", on_stats_mode_toggle)
@@ -375,8 +344,8 @@ def add_batter_tab(notebook, font):
             values = (
                 b.get("Name", ""), b.get("ORG", ""), age_raw, pos, b.get("B", ""), b.get("Prone", ""),
                 b.get("SctAcc", ""), b.get("OVR", "0 Stars"), b.get("POT", "0 Stars"),
-                b["Scores"].get("offense", 0), b["Scores"].get("offense_potential", 0),
-                b["Scores"].get("defense", 0), b["Scores"].get("total", 0), trade_value_display
+                scores_of(b).get("offense", 0), scores_of(b).get("offense_potential", 0),
+                scores_of(b).get("defense", 0), scores_of(b).get("total", 0), trade_value_display
             )
 
             iid = table.insert("", "end", values=values, tags=row_tags)
@@ -408,7 +377,7 @@ def add_batter_tab(notebook, font):
                 for b in all_batters:
                     already_in = b.get("ID") in used_ids_by_pos[pos]
                     if b.get("POS", "") == pos and not already_in:
-                        candidates.append((b["Scores"].get("total", 0), b))
+                        candidates.append((scores_of(b).get("total", 0), b))
                         used_ids_by_pos[pos].add(b.get("ID"))
                     elif b.get("POS", "") != pos:
                         try:
@@ -417,12 +386,12 @@ def add_batter_tab(notebook, font):
                             rating = 0
 
                         if rating >= threshold and not already_in:
-                            candidates.append((b["Scores"].get("total", 0), b))
+                            candidates.append((scores_of(b).get("total", 0), b))
                             used_ids_by_pos[pos].add(b.get("ID"))
             else:
                 for b in all_batters:
                     if b.get("POS", "") == pos and b.get("ID") not in used_ids_by_pos[pos]:
-                        candidates.append((b["Scores"].get("total", 0), b))
+                        candidates.append((scores_of(b).get("total", 0), b))
                         used_ids_by_pos[pos].add(b.get("ID"))
 
             if not candidates:
@@ -444,8 +413,8 @@ def add_batter_tab(notebook, font):
                     rank,
                     b.get("Name", ""), b.get("ORG", ""), b.get("Age", ""), b.get("POS", ""),
                     b.get("B", ""), b.get("Prone", ""), b.get("SctAcc", ""),
-                    b["Scores"].get("offense", 0), b["Scores"].get("offense_potential", 0),
-                    b["Scores"].get("defense", 0), b["Scores"].get("total", 0), trade_value_display
+                    scores_of(b).get("offense", 0), scores_of(b).get("offense_potential", 0),
+                    scores_of(b).get("defense", 0), scores_of(b).get("total", 0), trade_value_display
                 )
 
                 iid = table.insert("", "end", values=values, tags=row_tags)
@@ -471,30 +440,12 @@ def add_batter_tab(notebook, font):
     add_batter_tab.CURRENT_BATTERS = []
 
     class BatterTab:
-        def refresh(self, batters):
-            # Reset weights to original when refreshing
-            weights_module = get_weights_module()
-            weights = weights_module.section_weights
-            
-            # Reload weights module to get fresh original values
-            import sys
-            if "batter_weights" in sys.modules:
-                del sys.modules["batter_weights"]
-            
-            # Get fresh module with original values
-            fresh_weights_module = get_weights_module()
-            fresh_weights = fresh_weights_module.section_weights
-            
-            # Get original values from fresh module
-            original_overall = fresh_weights["meta"].get("overall", 1.0)
-            original_potential = fresh_weights["meta"].get("potential", 1.0)
-            
-            # Store original values (fresh_weights already has original values, so no need to modify)
-            original_meta_values["overall"] = original_overall
-            original_meta_values["potential"] = original_potential
-            
-            # Store batters and recalculate with current mode
+        def refresh(self, batters, changes=None):
+            # Store batters and show them with the current modes; mode scores
+            # are recombined from the new list's components, so a reload's
+            # changes need no special handling
             add_batter_tab.CURRENT_BATTERS = list(batters)
-            recalculate_scores_with_modes()
+            mode_scores["source"] = None
+            apply_score_modes()
 
     return BatterTab()
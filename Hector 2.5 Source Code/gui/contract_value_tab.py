@@ -7,6 +7,7 @@ from .widgets import (
     bind_player_card_right_click,
 )
 from .tooltips import add_button_tooltip
+from .background import get_background_tasks
 from trade_value import (
     calculate_dollars_per_war,
     calculate_surplus_value,
@@ -207,23 +208,13 @@ def add_contract_value_tab(notebook, font):
         else:
             return "fair_value"
     
-    def get_filtered_players():
-        """Get players matching current filters"""
-        type_filter = type_var.get()
-        pos_filter = pos_var.get()
-        category_filter = category_var.get()
-        status_filter = status_var.get()
-        
-        try:
-            min_war = float(min_war_var.get())
-        except ValueError:
-            min_war = 0
-        
+    def get_filtered_players(batters, pitchers, type_filter, pos_filter, category_filter, status_filter, min_war):
+        """Get players matching the given filters (runs on a worker thread)"""
         players = []
         
         # Process batters
         if type_filter in ["All", "Batters"]:
-            for b in all_batters:
+            for b in batters:
                 pos = b.get("POS", "")
                 if pos_filter != "All" and pos != pos_filter:
                     continue
@@ -281,7 +272,7 @@ def add_contract_value_tab(notebook, font):
         
         # Process pitchers
         if type_filter in ["All", "Pitchers"]:
-            for p in all_pitchers:
+            for p in pitchers:
                 pos = p.get("POS", "")
                 if pos == "CL":
                     pos = "RP"  # Treat CL as RP for filtering
@@ -343,13 +334,24 @@ def add_contract_value_tab(notebook, font):
         return players
     
     def update_table():
-        """Update the table with current filter settings"""
+        """Update the table with current filter settings (computed in the background)"""
+        try:
+            min_war = float(min_war_var.get())
+        except ValueError:
+            min_war = 0
+        
+        get_background_tasks().submit(
+            "contract_value.table", get_filtered_players, list(all_batters), list(all_pitchers),
+            type_var.get(), pos_var.get(), category_var.get(), status_var.get(), min_war,
+            on_done=show_table
+        )
+    
+    def show_table(players):
+        """Fill the table with filtered players"""
         table.delete(*table.get_children())
         id_map.clear()
         player_data_map.clear()
         
-        players = get_filtered_players()
-        
         for p in players:
             tag = get_tag_for_category(p["category"])
             
@@ -525,11 +527,8 @@ def add_contract_value_tab(notebook, font):
     # Bind right-click for player card popup (extension table)
     bind_player_card_right_click(ext_table, ext_player_data_map, lambda p: (p["player"], p["type"]))
     
-    def get_players_with_extensions():
-        """Get all players with extensions"""
-        grade_filter = ext_grade_var.get()
-        type_filter = ext_type_var.get()
-        
+    def get_players_with_extensions(batters, pitchers, grade_filter, type_filter):
+        """Get all players with extensions (runs on a worker thread)"""
         players = []
         
         def process_player(p, player_type):
@@ -566,14 +565,14 @@ def add_contract_value_tab(notebook, font):
         
         # Process batters
         if type_filter in ["All", "Batters"]:
-            for b in all_batters:
+            for b in batters:
                 result = process_player(b, "batter")
                 if result:
                     players.append(result)
         
         # Process pitchers
         if type_filter in ["All", "Pitchers"]:
-            for p in all_pitchers:
+            for p in pitchers:
                 result = process_player(p, "pitcher")
                 if result:
                     players.append(result)
@@ -583,13 +582,19 @@ def add_contract_value_tab(notebook, font):
         return players
     
     def update_extension_table():
-        """Update the extension watch table"""
+        """Update the extension watch table (computed in the background)"""
+        get_background_tasks().submit(
+            "contract_value.extensions", get_players_with_extensions, list(all_batters), list(all_pitchers),
+            ext_grade_var.get(), ext_type_var.get(),
+            on_done=show_extension_table
+        )
+    
+    def show_extension_table(players):
+        """Fill the extension watch table"""
         ext_table.delete(*ext_table.get_children())
         ext_id_map.clear()
         ext_player_data_map.clear()
         
-        players = get_players_with_extensions()
-        
         for p in players:
             tag = p["grade"]  # Use grade as tag
             
@@ -2,13 +2,12 @@ import tkinter as tk
 import sys
 import os
 from tkinter import ttk, messagebox, filedialog
-import importlib
-import importlib.util
+import configparser
+import queue
 import threading
-from pathlib import Path
-from pitchers import calculate_score
-from batters import calculate_batter_score
-from team_parser import parse_team_html, build_teams_by_abbr
+from pitchers import calculate_scores
+from batters import calculate_batter_scores
+from team_parser import build_teams_by_abbr
 from league_analytics import generate_league_report
 from .style import setup_theme
 from .pitcher_tab import add_pitcher_tab
@@ -25,13 +24,24 @@ from .roster_builder_tab import add_roster_builder_tab
 from .advanced_stats_tab import add_advanced_stats_tab
 from .auto_contract_tab import add_auto_contract_tab
 from .league_tab import add_league_tab
-from percentiles import initialize_percentiles
+from .tab_manager import TabManager
+from .background import get_background_tasks, PROGRESS_POLL_MS
+from percentiles import build_percentiles, set_percentile_calculator
 from advanced_stats import add_advanced_stats_to_players
 from .widgets import (
     create_title_label, create_summary_widgets, create_control_frame, update_summary_widgets,
     validate_fields, detect_wrong_import, show_loading_bar, set_app_icon
 )
-from html_parser import parse_players_from_html, split_players_by_type, PITCHER_POSITIONS, BATTER_POSITIONS
+from html_parser import split_players_by_type, PITCHER_POSITIONS, BATTER_POSITIONS
+from player_table import diff_tables
+from load_pipeline import ExportLoad, PLAYER_LIST_FILE, TEAM_LIST_FILE, FREE_AGENTS_FILE
+from export_files import find_export, export_paths
+from export_watcher import ExportWatcher
+from weights import get_weights_dir, weights_signature, load_section_weights
+from session_cache import load_session, save_session, export_sources, is_session_current
+from progress import (
+    Progress, OperationCancelled, STAGE_READ, STAGE_SCORE, STAGE_PERCENTILES, STAGE_TEAMS
+)
 
 REQUIRED_PITCHER_FIELDS = [
     "Name", "ORG", "POS", "Age", "T", "Prone", "SctAcc",
@@ -54,34 +64,52 @@ REQUIRED_BATTER_FIELDS = [
 NEON_GREEN = "#29ff9e"
 DARK_BG = "#2d2d2d"
 
-def get_weights_dir():
-    if getattr(sys, 'frozen', False):
-        return Path(sys.executable).parent
-    return Path(__file__).parent.parent
+# Tabs built on first visit, in notebook order after Pitchers and Batters: (key, title, factory)
+LAZY_TABS = (
+    ("teams", "Teams", add_teams_tab),
+    ("league", "League Analysis", add_league_tab),
+    ("trade", "Trade", add_trade_tab),
+    ("contract", "Contract", add_contract_tab),
+    ("trade_finder", "Trade Finder", add_trade_finder_tab),
+    ("trade_builder", "🔄 Trade Builder", add_trade_builder_tab),
+    ("contract_value", "Contract Value", add_contract_value_tab),
+    ("platoon_finder", "Platoon Finder", add_platoon_finder_tab),
+    ("hidden_gems", "Hidden Gems", add_hidden_gems_tab),
+    ("roster_builder", "Roster Builder", add_roster_builder_tab),
+    ("advanced_stats", "Advanced Stats", add_advanced_stats_tab),
+    ("auto_contract", "Autocontract", add_auto_contract_tab),
+)
+
+# Exports the app loads, watches and records in the session cache
+EXPORT_NAMES = (PLAYER_LIST_FILE, TEAM_LIST_FILE, FREE_AGENTS_FILE)
+
+# Stages of a load and their rough share of its running time, for the progress bars
+LOAD_STAGES = ((STAGE_READ, 16), (STAGE_SCORE, 4), (STAGE_PERCENTILES, 1), (STAGE_TEAMS, 1))
+
+# How often the Tk loop asks the export watcher for finished re-exports (ms)
+EXPORT_CHECK_MS = 500
 
-def import_weights_module(module_name):
-    module_path = get_weights_dir() / f"{module_name}.py"
-    if module_name in sys.modules:
-        del sys.modules[module_name]
-    spec = importlib.util.spec_from_file_location(module_name, str(module_path))
-    if spec is None or not module_path.exists():
-        raise ImportError(f"Could not find spec for {module_name} at {module_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    sys.modules[module_name] = module
-    return module
+# Virtual event the loader thread raises on the root window when a load finishes
+DATA_LOADED_EVENT = "<<DataLoaded>>"
+
+def load_auto_reload_setting():
+    """Whether config.ini turns on reloading when OOTP re-writes an export ([reload] watch_exports)."""
+    config = configparser.ConfigParser()
+    try:
+        config.read(get_weights_dir() / "config.ini")
+        return config.getboolean("reload", "watch_exports", fallback=False)
+    except (configparser.Error, ValueError) as e:
+        print(f"Warning: Could not read [reload] settings from config.ini: {e}")
+        return False
 
 def reload_weights():
     global section_weights, batter_section_weights
-    pitcher_weights_module = import_weights_module("pitcher_weights")
-    batter_weights_module  = import_weights_module("batter_weights")
-    global section_weights, batter_section_weights
-    section_weights = pitcher_weights_module.section_weights
-    batter_section_weights = batter_weights_module.section_weights
+    section_weights, batter_section_weights = load_section_weights()
 
 def build_gui():
     root = tk.Tk()
     set_app_icon(root)
+    get_background_tasks().attach(root)
     root.title("Rosterlytics 2.7")
     root.geometry("1800x950")
     root.configure(bg=DARK_BG)
@@ -89,12 +117,15 @@ def build_gui():
     font = ("Consolas", 11)
     large_font = (font[0], font[1] + 11, "bold")
     setup_theme(font, root)
+    loading_text = tk.StringVar(value="Loading data, please wait...")
     loading_frame, loading_bar = show_loading_bar(
-        root, label_text="Loading data, please wait...",
-        font=large_font, bar_color=NEON_GREEN, bg=DARK_BG)
+        root, label_text=loading_text.get(), textvariable=loading_text,
+        font=large_font, bar_color=NEON_GREEN, bg=DARK_BG, determinate=True)
     class DATA:
         pitchers = []
         batters = []
+        player_table = None  # Columnar store behind the pitcher/batter rows
+        weights_signature = None  # Weights files the current scores were calculated with
         teams_by_abbr = {}  # Team data keyed by abbreviation
         team_data_loaded = False  # Track if team data was successfully loaded
         free_agents = []  # Free agent data from Free Agents.html
@@ -102,10 +133,17 @@ def build_gui():
         league_analytics = {}  # League-wide analytics report
         teams_list = []  # Raw teams list for league analytics
 
-    def load_team_data():
+    # Messages from the loader thread, read on the main thread when it raises
+    # DATA_LOADED_EVENT: ("warning", (title, message)) and ("done", (result, on_loaded))
+    load_messages = queue.SimpleQueue()
+
+    def load_team_data(load):
         """
         Load team data from Team List.html.
         
+        Args:
+            load: ExportLoad parsing the exports in the background
+        
         Returns:
             tuple: (teams_by_abbr dict, team_data_loaded bool, teams_list list)
                 - teams_by_abbr: Dict mapping team abbreviation to team data
@@ -113,13 +151,13 @@ def build_gui():
                 - teams_list: Raw list of team dicts for league analytics
                 Returns ({}, False, []) if file not found or parsing fails
         """
-        team_file_path = "Team List.html"
+        team_file_path = find_export(TEAM_LIST_FILE)
         
         if not os.path.exists(team_file_path):
             return {}, False, []
         
         try:
-            teams_list = parse_team_html(team_file_path)
+            teams_list = load.teams()
             if teams_list:
                 teams_by_abbr = build_teams_by_abbr(teams_list)
                 return teams_by_abbr, True, teams_list
@@ -133,18 +171,19 @@ def build_gui():
             print(f"Warning: Unexpected error loading team data: {e}")
             return {}, False, []
 
-    def load_free_agents_data():
+    def load_free_agents_data(load):
         """
-        Load free agents from Free Agents.html.
+        Load free agents from Free Agents.html (parsed in the background by load).
         Returns list of free agents, or empty list if file not found.
         """
-        free_agents_file_path = "Free Agents.html"
+        free_agents_file_path = find_export(FREE_AGENTS_FILE)
         
         if not os.path.exists(free_agents_file_path):
             return [], False
         
         try:
-            free_agents = parse_players_from_html(free_agents_file_path)
+            free_agents_table = load.free_agents()
+            free_agents = free_agents_table.rows() if free_agents_table is not None else []
             if free_agents:
                 return free_agents, True
             return [], False
@@ -157,11 +196,26 @@ def build_gui():
             print(f"Warning: Unexpected error loading free agents data: {e}")
             return [], False
 
-    def choose_and_load_file(result):
+    def choose_and_load_file(result, progress=None):
+        """
+        Load, score and analyse the exports into result (runs on the loader thread).
+        
+        result is the second buffer of a reload: DATA and the percentile
+        calculator are only read here, and the tabs keep using them until
+        swap_in_data() replaces them on the main thread.
+        
+        progress (a Progress token with LOAD_STAGES) gets each stage as it
+        starts; once it is cancelled the load stops at the next step and
+        result["cancelled"] is set instead of an exception.
+        """
+        if progress is None:
+            progress = Progress(LOAD_STAGES)
         reload_weights()
+        signature = weights_signature()
+        sources = export_sources(EXPORT_NAMES)
         # Use simple relative path like old working version
         # PyInstaller sets working directory to exe location, so this works
-        file_path = "Player List.html"
+        file_path = find_export(PLAYER_LIST_FILE)
         
         # Debug: Show file path info when compiled (temporary for diagnosis)
         if getattr(sys, 'frozen', False):
@@ -175,8 +229,24 @@ def build_gui():
             # Show debug info in messagebox (comment out after testing)
             # messagebox.showinfo("Debug Info", debug_info)
         
+        # Parse all three exports concurrently; team and free agent data are
+        # joined below, once the players have been scored
+        load = None
         try:
-            all_players = parse_players_from_html(file_path)
+            load = ExportLoad(file_path, TEAM_LIST_FILE, FREE_AGENTS_FILE, progress=progress)
+            previous_table, previous_signature = DATA.player_table, DATA.weights_signature
+            player_table = load.players()
+            all_players = player_table.rows()
+            
+            # Incremental reload: match players to the previous load by ID and keep
+            # the scores and derived data of unchanged players. Anything that cannot
+            # be matched (first load, new columns, edited weights) is fully rebuilt.
+            changes = None
+            if signature == previous_signature:
+                changes = diff_tables(previous_table, player_table)
+            if changes is not None:
+                changes.carry_over()
+            result["changes"] = changes
             
             # Debug: Show parsing results
             if getattr(sys, 'frozen', False):
@@ -185,36 +255,41 @@ def build_gui():
             
             if not all_players:
                 result["exception"] = ValueError(
-                    f"No player data found in 'Player List.html'.\n"
+                    f"No player data found in '{os.path.basename(file_path)}'.\n"
                     f"File location: {os.path.abspath(file_path) if getattr(sys, 'frozen', False) else file_path}\n"
                     f"Please check that the file contains valid player data."
                 )
                 return
                 
             pitchers, batters = split_players_by_type(all_players)
-            DATA.pitchers = pitchers
-            DATA.batters = batters
             
             # Debug: Show split results
             if getattr(sys, 'frozen', False):
-                debug_split = f"Split results:\nPitchers: {len(DATA.pitchers)}\nBatters: {len(DATA.batters)}\n"
+                debug_split = f"Split results:\nPitchers: {len(pitchers)}\nBatters: {len(batters)}\n"
                 # messagebox.showinfo("Split Debug", debug_split)
             
-            for pitcher in DATA.pitchers:
-                pitcher['Scores'] = calculate_score(pitcher, section_weights)
-            for batter in DATA.batters:
-                batter['Scores'] = calculate_batter_score(batter, batter_section_weights)
+            pitchers_to_score = pitchers if changes is None else changes.select(pitchers)
+            batters_to_score = batters if changes is None else changes.select(batters)
+            progress.start_stage(STAGE_SCORE, len(pitchers_to_score) + len(batters_to_score))
+            for pitcher, scores in zip(pitchers_to_score, calculate_scores(pitchers_to_score, section_weights)):
+                pitcher['Scores'] = scores
+            progress.step(len(pitchers_to_score))
+            for batter, scores in zip(batters_to_score, calculate_batter_scores(batters_to_score, batter_section_weights)):
+                batter['Scores'] = scores
+            progress.step(len(batters_to_score))
+            result["player_table"] = player_table
+            result["weights_signature"] = signature
             
             # Restore validation - check for missing fields but warn instead of error
-            missing_pitcher_fields = validate_fields(DATA.pitchers, REQUIRED_PITCHER_FIELDS)
-            missing_batter_fields = validate_fields(DATA.batters, REQUIRED_BATTER_FIELDS)
+            missing_pitcher_fields = validate_fields(pitchers, REQUIRED_PITCHER_FIELDS)
+            missing_batter_fields = validate_fields(batters, REQUIRED_BATTER_FIELDS)
             
             # Check if we actually have any players first
-            if not DATA.pitchers and not DATA.batters:
+            if not pitchers and not batters:
                 result["exception"] = RuntimeError(
                     f"No players found in file.\n\n"
                     f"Parsed {len(all_players)} total players.\n"
-                    f"Pitchers: {len(DATA.pitchers)}, Batters: {len(DATA.batters)}\n"
+                    f"Pitchers: {len(pitchers)}, Batters: {len(batters)}\n"
                     f"File: {os.path.abspath(file_path) if getattr(sys, 'frozen', False) else file_path}"
                 )
                 return
@@ -227,37 +302,41 @@ def build_gui():
                 if missing_batter_fields:
                     warning_msg += "Batters missing: " + ", ".join(sorted(missing_batter_fields)) + "\n"
                 warning_msg += "\nThe app will continue, but some features may not work correctly."
-                messagebox.showwarning("Field Warning", warning_msg)
+                load_messages.put(("warning", ("Field Warning", warning_msg)))
             
-            if detect_wrong_import(DATA.pitchers, PITCHER_POSITIONS, BATTER_POSITIONS):
+            if detect_wrong_import(pitchers, PITCHER_POSITIONS, BATTER_POSITIONS):
                 result["exception"] = RuntimeError("Could not find any pitchers in file. Is this the batter export?")
-            elif detect_wrong_import(DATA.batters, BATTER_POSITIONS, PITCHER_POSITIONS):
+            elif detect_wrong_import(batters, BATTER_POSITIONS, PITCHER_POSITIONS):
                 result["exception"] = RuntimeError("Could not find any batters in file. Is this the pitcher export?")
             else:
-                result["pitchers"] = sorted(DATA.pitchers, key=lambda p: p["Scores"].get("total", 0), reverse=True)
-                result["batters"] = sorted(DATA.batters, key=lambda b: b["Scores"].get("total", 0), reverse=True)
+                result["pitchers"] = sorted(pitchers, key=lambda p: p["Scores"].get("total", 0), reverse=True)
+                result["batters"] = sorted(batters, key=lambda b: b["Scores"].get("total", 0), reverse=True)
+                
+                # Percentile distributions for the new data (swapped in with it)
+                result["percentiles"] = build_percentiles(result["batters"], result["pitchers"], progress)
                 
                 # Load team data (optional - app continues if not found)
-                DATA.teams_by_abbr, DATA.team_data_loaded, DATA.teams_list = load_team_data()
-                result["teams_by_abbr"] = DATA.teams_by_abbr
-                result["team_data_loaded"] = DATA.team_data_loaded
-                result["teams_list"] = DATA.teams_list
+                progress.start_stage(STAGE_TEAMS)
+                teams_by_abbr, team_data_loaded, teams_list = load_team_data(load)
+                result["teams_by_abbr"] = teams_by_abbr
+                result["team_data_loaded"] = team_data_loaded
+                result["teams_list"] = teams_list
                 
                 # Generate league analytics if team data loaded
-                if DATA.team_data_loaded and DATA.teams_list:
-                    DATA.league_analytics = generate_league_report(DATA.teams_list)
-                    result["league_analytics"] = DATA.league_analytics
+                if team_data_loaded and teams_list:
+                    result["league_analytics"] = generate_league_report(teams_list)
                 else:
-                    DATA.league_analytics = {}
                     result["league_analytics"] = {}
                 
                 # Load free agents data (optional - app continues if not found)
-                DATA.free_agents, DATA.free_agents_loaded = load_free_agents_data()
-                result["free_agents"] = DATA.free_agents
-                result["free_agents_loaded"] = DATA.free_agents_loaded
+                result["free_agents"], result["free_agents_loaded"] = load_free_agents_data(load)
+                
+                # Shown at the next start while the exports are checked
+                save_session(player_table, teams_list, load.free_agents() if result["free_agents_loaded"] else None,
+                             sources, signature)
                 
                 # Show warning if team data not loaded (don't crash, just reduced functionality)
-                if not DATA.team_data_loaded:
+                if not team_data_loaded:
                     # Queue warning to show after main thread is available
                     result["team_warning"] = (
                         "Team List.html not found or could not be loaded.\n\n"
@@ -267,9 +346,13 @@ def build_gui():
                         "To enable these features, export 'Team List.html' from OOTP\n"
                         "and place it in the same folder as Player List.html."
                     )
+                progress.finish()
+        except OperationCancelled:
+            result.clear()
+            result["cancelled"] = True
         except Exception as e:
             # Provide more detailed error information
-            error_msg = f"Error loading 'Player List.html':\n\n{str(e)}\n\n"
+            error_msg = f"Error loading '{os.path.basename(file_path)}':\n\n{str(e)}\n\n"
             error_msg += f"File path attempted: {file_path}\n"
             error_msg += f"Absolute path: {os.path.abspath(file_path)}\n"
             error_msg += f"Working directory: {os.getcwd()}\n"
@@ -277,7 +360,109 @@ def build_gui():
             if os.path.exists(file_path):
                 error_msg += f"File size: {os.path.getsize(file_path)} bytes"
             result["exception"] = RuntimeError(error_msg)
+        finally:
+            if load is not None:
+                load.close()
+
+    def restore_session(result, progress=None):
+        """
+        Fill result from the last session's cache (runs on the loader thread),
+        so the window can show it before the exports are checked. Falls back to
+        loading the exports (reporting on progress) when there is no usable session.
+        """
+        session = load_session()
+        if session is not None:
+            try:
+                player_table = session["player_table"]
+                pitchers, batters = split_players_by_type(player_table.rows())
+                result["player_table"] = player_table
+                result["weights_signature"] = session["weights_signature"]
+                result["changes"] = None
+                result["pitchers"] = sorted(pitchers, key=lambda p: p["Scores"].get("total", 0), reverse=True)
+                result["batters"] = sorted(batters, key=lambda b: b["Scores"].get("total", 0), reverse=True)
+                result["percentiles"] = build_percentiles(result["batters"], result["pitchers"])
+                teams_list = session["teams_list"]
+                result["teams_by_abbr"] = build_teams_by_abbr(teams_list) if teams_list else {}
+                result["team_data_loaded"] = bool(teams_list)
+                result["teams_list"] = teams_list
+                result["league_analytics"] = generate_league_report(teams_list) if teams_list else {}
+                free_agents_table = session["free_agents_table"]
+                result["free_agents"] = free_agents_table.rows() if free_agents_table is not None else []
+                result["free_agents_loaded"] = bool(result["free_agents"])
+                result["session"] = session
+                return
+            except Exception as e:
+                print(f"Warning: Could not restore the last session, loading exports: {e}")
+                result.clear()
+        choose_and_load_file(result, progress)
 
+    def swap_in_data(result):
+        """
+        Make a finished load the app's data (main thread only). Everything is
+        replaced in one step, between two main loop events, so no tab or
+        player card ever sees half of the old data and half of the new.
+        """
+        DATA.player_table = result["player_table"]
+        DATA.weights_signature = result["weights_signature"]
+        DATA.pitchers = result["pitchers"]
+        DATA.batters = result["batters"]
+        DATA.teams_by_abbr = result["teams_by_abbr"]
+        DATA.team_data_loaded = result["team_data_loaded"]
+        DATA.teams_list = result["teams_list"]
+        DATA.league_analytics = result["league_analytics"]
+        DATA.free_agents = result["free_agents"]
+        DATA.free_agents_loaded = result["free_agents_loaded"]
+        set_percentile_calculator(result["percentiles"])
+
+    def start_load(on_loaded, loader=choose_and_load_file, progress=None):
+        """
+        Load the exports on a worker thread.
+        
+        The worker never touches Tk widgets: warnings and the result go through
+        load_messages, and completion is signalled with DATA_LOADED_EVENT,
+        which tkinter hands to the main loop. on_loaded(result) and any
+        warning dialogs then run on the main thread.
+        
+        Args:
+            on_loaded: Called on the main thread with the result dict
+            loader: Fills the result dict (choose_and_load_file or restore_session)
+            progress: Progress token the loader reports on and can be cancelled with
+        """
+        result = {}
+        def run():
+            try:
+                loader(result, progress)
+            finally:
+                load_messages.put(("done", (result, on_loaded)))
+                try:
+                    root.event_generate(DATA_LOADED_EVENT, when="tail")
+                except (tk.TclError, RuntimeError):
+                    pass  # Window closed while loading
+        threading.Thread(target=run, name="ExportLoader", daemon=True).start()
+
+    def on_data_loaded(event=None):
+        while True:
+            try:
+                kind, payload = load_messages.get_nowait()
+            except queue.Empty:
+                return
+            if kind == "warning":
+                messagebox.showwarning(*payload)
+            else:
+                result, on_loaded = payload
+                on_loaded(result)
+    root.bind(DATA_LOADED_EVENT, on_data_loaded)
+
+
+    def show_load_progress(progress):
+        # Fill the start-up loading bar until the loader is done
+        if not loading_frame.winfo_ismapped():
+            return
+        stage, fraction = progress.status()
+        loading_bar["value"] = fraction * 100
+        if stage is not None:
+            loading_text.set(f"{stage}...")
+        root.after(PROGRESS_POLL_MS, show_load_progress, progress)
 
     def finish_load_and_init(result, after_reload=False):
         loading_bar.stop()
@@ -302,136 +487,141 @@ def build_gui():
             control_frame.pack(fill="x", padx=10, pady=5)
             notebook = ttk.Notebook(root)
             notebook.pack(fill="both", expand=True, padx=10, pady=10)
-            pitcher_tab = add_pitcher_tab(notebook, font)
-            batter_tab = add_batter_tab(notebook, font)
-            teams_tab = add_teams_tab(notebook, font)
-            league_tab = add_league_tab(notebook, font)
-            trade_tab = add_trade_tab(notebook, font)
-            contract_tab = add_contract_tab(notebook, font)
-            trade_finder_tab = add_trade_finder_tab(notebook, font)
-            trade_builder_tab = add_trade_builder_tab(notebook, font)
-            contract_value_tab = add_contract_value_tab(notebook, font)
-            platoon_finder_tab = add_platoon_finder_tab(notebook, font)
-            hidden_gems_tab = add_hidden_gems_tab(notebook, font)
-            roster_builder_tab = add_roster_builder_tab(notebook, font)
-            advanced_stats_tab = add_advanced_stats_tab(notebook, font)
-            auto_contract_tab = add_auto_contract_tab(notebook, font)
+            # Pitchers and Batters are built now; every other tab is built, and
+            # computes its data, the first time it is selected
+            tabs = TabManager(notebook, font)
+            pitcher_tab = tabs.add("pitchers", "Pitchers", add_pitcher_tab, lazy=False)
+            batter_tab = tabs.add("batters", "Batters", add_batter_tab, lazy=False)
+            for key, title, factory in LAZY_TABS:
+                tabs.add(key, title, factory)
             root._gui_vars = {
                 "summary_left_var": summary_left_var,
                 "summary_right_var": summary_right_var,
                 "pitcher_tab": pitcher_tab,
                 "batter_tab": batter_tab,
-                "teams_tab": teams_tab,
-                "league_tab": league_tab,
-                "trade_tab": trade_tab,
-                "contract_tab": contract_tab,
-                "trade_finder_tab": trade_finder_tab,
-                "trade_builder_tab": trade_builder_tab,
-                "contract_value_tab": contract_value_tab,
-                "platoon_finder_tab": platoon_finder_tab,
-                "hidden_gems_tab": hidden_gems_tab,
-                "roster_builder_tab": roster_builder_tab,
-                "advanced_stats_tab": advanced_stats_tab,
-                "auto_contract_tab": auto_contract_tab,
+                "tabs": tabs,
                 "font": font,
                 "notebook": notebook
             }
-            def refresh_all_tabs():
-                reload_frame, reload_bar = show_loading_bar(
-                    root, label_text="Loading data, please wait...", font=large_font, bg=DARK_BG)
-                result_reload = {}
-                thread = threading.Thread(target=choose_and_load_file, args=(result_reload,))
-                thread.start()
-                def check_reload():
-                    if thread.is_alive():
-                        root.after(65, check_reload)
+            def refresh_tabs(data, changes=None):
+                """
+                Hand a loaded dataset to every tab. Only the visible tab refreshes now;
+                the others when selected or idle (unbuilt tabs on first visit).
+                """
+                pitchers, batters = data["pitchers"], data["batters"]
+                tabs.refresh("pitchers", pitchers, changes=changes)
+                tabs.refresh("batters", batters, changes=changes)
+                tabs.refresh("teams", pitchers, batters)
+                tabs.refresh("league", data.get("teams_list", []), data.get("league_analytics", {}))
+                tabs.refresh("trade", pitchers, batters)
+                tabs.refresh("contract", pitchers, batters)
+                # Trade Finder and Trade Builder also use the team data
+                tabs.refresh("trade_finder", pitchers, batters, data.get("teams_by_abbr", {}))
+                tabs.refresh("trade_builder", pitchers, batters, data.get("teams_by_abbr", {}))
+                tabs.refresh("contract_value", pitchers, batters)
+                tabs.refresh("platoon_finder", pitchers, batters)
+                tabs.refresh("hidden_gems", pitchers, batters)
+                tabs.refresh("roster_builder", pitchers, batters)
+                tabs.refresh("advanced_stats", pitchers, batters, changes=changes)
+                tabs.refresh("auto_contract", pitchers, batters, data.get("free_agents", []))
+                update_summary_widgets(DATA, summary_left_var, summary_right_var)
+            reload_state = {"running": False, "again": False, "progress": None}
+            watch_state = {"watcher": None}
+            # Shown next to the controls while a reload runs
+            reload_status_var = tk.StringVar()
+            reload_status = tk.Label(control_frame, textvariable=reload_status_var, font=font,
+                                     fg="#d4d4d4", bg=DARK_BG)
+            reload_bar = ttk.Progressbar(control_frame, mode="determinate", maximum=100, length=200,
+                                         style="Neon.Horizontal.TProgressbar")
+            def show_reload_progress(progress, status_text):
+                if reload_state["progress"] is not progress:
+                    return  # Finished or cancelled
+                stage, fraction = progress.status()
+                reload_bar["value"] = fraction * 100
+                reload_status_var.set(f"{status_text} {stage or ''}".strip())
+                root.after(PROGRESS_POLL_MS, show_reload_progress, progress, status_text)
+            def refresh_all_tabs(status_text="Reloading..."):
+                # One reload at a time; a re-export during a reload queues another
+                if reload_state["running"]:
+                    reload_state["again"] = True
+                    return
+                reload_state["running"] = True
+                if watch_state["watcher"] is not None:
+                    watch_state["watcher"].acknowledge()
+                # The new data is built in the background while every tab keeps
+                # working on the current data; it is swapped in when complete
+                progress = Progress(LOAD_STAGES)
+                reload_state["progress"] = progress
+                reload_btn.config(text="Cancel Reload")
+                reload_bar["value"] = 0
+                reload_bar.pack(side="left", padx=5)
+                reload_status.pack(side="left", padx=5)
+                show_reload_progress(progress, status_text)
+                def finish_reload(result_reload):
+                    reload_state["progress"] = None
+                    reload_bar.pack_forget()
+                    reload_status.pack_forget()
+                    reload_btn.config(text="Reload Data")
+                    if result_reload.get("cancelled"):
+                        # Cancelled from the button: the current data stays in place
+                        reload_state["again"] = False
+                    elif result_reload.get("exception"):
+                        # The current data stays in place
+                        messagebox.showerror("Data Load Error", str(result_reload["exception"]))
                     else:
-                        reload_bar.stop()
-                        reload_frame.place_forget()
-                        reload_frame.destroy()
-                        if result_reload.get("exception"):
-                            messagebox.showerror("Data Load Error", str(result_reload["exception"]))
-                        else:
-                            # Initialize percentiles for the new data
-                            initialize_percentiles(result_reload["batters"], result_reload["pitchers"])
-                            pitcher_tab.refresh(result_reload["pitchers"])
-                            batter_tab.refresh(result_reload["batters"])
-                            teams_tab.refresh(result_reload["pitchers"], result_reload["batters"])
-                            league_tab.refresh(
-                                result_reload.get("teams_list", []),
-                                result_reload.get("league_analytics", {})
-                            )
-                            trade_tab.refresh(result_reload["pitchers"], result_reload["batters"])
-                            contract_tab.refresh(result_reload["pitchers"], result_reload["batters"])
-                            # Pass team data to trade_finder_tab
-                            trade_finder_tab.refresh(
-                                result_reload["pitchers"], 
-                                result_reload["batters"],
-                                result_reload.get("teams_by_abbr", {})
-                            )
-                            # Pass team data to trade_builder_tab
-                            trade_builder_tab.refresh(
-                                result_reload["pitchers"], 
-                                result_reload["batters"],
-                                result_reload.get("teams_by_abbr", {})
-                            )
-                            contract_value_tab.refresh(result_reload["pitchers"], result_reload["batters"])
-                            platoon_finder_tab.refresh(result_reload["pitchers"], result_reload["batters"])
-                            hidden_gems_tab.refresh(result_reload["pitchers"], result_reload["batters"])
-                            roster_builder_tab.refresh(result_reload["pitchers"], result_reload["batters"])
-                            advanced_stats_tab.refresh(result_reload["pitchers"], result_reload["batters"])
-                            auto_contract_tab.refresh(
-                                result_reload["pitchers"], 
-                                result_reload["batters"],
-                                result_reload.get("free_agents", [])
-                            )
-                            update_summary_widgets(DATA, summary_left_var, summary_right_var)
-                check_reload()
-            reload_btn.config(command=refresh_all_tabs)
-            # Initialize percentiles for the initial data
-            initialize_percentiles(result["batters"], result["pitchers"])
+                        swap_in_data(result_reload)
+                        refresh_tabs(result_reload, changes=result_reload.get("changes"))
+                    reload_state["running"] = False
+                    if reload_state["again"]:
+                        reload_state["again"] = False
+                        refresh_all_tabs()
+                start_load(finish_reload, progress=progress)
+            def on_reload_click():
+                # The button starts a reload, or cancels the one running
+                if reload_state["progress"] is not None:
+                    reload_state["progress"].cancel()
+                    reload_btn.config(text="Cancelling...")
+                else:
+                    refresh_all_tabs()
+            reload_btn.config(command=on_reload_click)
+            
+            # Optional auto-reload when OOTP re-writes one of the exports
+            def check_exports(watcher):
+                if watch_state["watcher"] is not watcher:
+                    return  # Auto-reload was switched off (or restarted)
+                if watcher.pending():
+                    refresh_all_tabs()
+                root.after(EXPORT_CHECK_MS, check_exports, watcher)
+            def toggle_auto_reload():
+                if auto_reload_var.get():
+                    if watch_state["watcher"] is None:
+                        watched = [path for name in EXPORT_NAMES for path in export_paths(name)]
+                        watcher = ExportWatcher(watched).start()
+                        watch_state["watcher"] = watcher
+                        root.after(EXPORT_CHECK_MS, check_exports, watcher)
+                elif watch_state["watcher"] is not None:
+                    watch_state["watcher"].stop()
+                    watch_state["watcher"] = None
+            auto_reload_var = tk.BooleanVar(value=load_auto_reload_setting())
+            ttk.Checkbutton(
+                control_frame, text="Auto-reload on export",
+                variable=auto_reload_var, command=toggle_auto_reload
+            ).pack(side="left", padx=5)
+            toggle_auto_reload()
             # Show initial data
-            pitcher_tab.refresh(result["pitchers"])
-            batter_tab.refresh(result["batters"])
-            teams_tab.refresh(result["pitchers"], result["batters"])
-            league_tab.refresh(
-                result.get("teams_list", []),
-                result.get("league_analytics", {})
-            )
-            trade_tab.refresh(result["pitchers"], result["batters"])
-            contract_tab.refresh(result["pitchers"], result["batters"])
-            # Pass team data to trade_finder_tab
-            trade_finder_tab.refresh(
-                result["pitchers"], 
-                result["batters"],
-                result.get("teams_by_abbr", {})
-            )
-            # Pass team data to trade_builder_tab
-            trade_builder_tab.refresh(
-                result["pitchers"], 
-                result["batters"],
-                result.get("teams_by_abbr", {})
-            )
-            contract_value_tab.refresh(result["pitchers"], result["batters"])
-            platoon_finder_tab.refresh(result["pitchers"], result["batters"])
-            hidden_gems_tab.refresh(result["pitchers"], result["batters"])
-            roster_builder_tab.refresh(result["pitchers"], result["batters"])
-            advanced_stats_tab.refresh(result["pitchers"], result["batters"])
-            auto_contract_tab.refresh(
-                result["pitchers"], 
-                result["batters"],
-                result.get("free_agents", [])
-            )
-            update_summary_widgets(DATA, summary_left_var, summary_right_var)
+            swap_in_data(result)
+            refresh_tabs(result)
+            # A restored session is shown as it was saved; if the exports or
+            # weights changed since, the current data is loaded in the background
+            session = result.get("session")
+            if session is not None and not is_session_current(session, EXPORT_NAMES, weights_signature()):
+                refresh_all_tabs(status_text="Updating...")
 
-    # Initial threaded load (while showing the loader)
-    result = {}
-    thread = threading.Thread(target=choose_and_load_file, args=(result,))
-    thread.start()
-    def check_main_load():
-        if thread.is_alive():
-            root.after(60, check_main_load)
-        else:
-            finish_load_and_init(result, after_reload=False)
-    check_main_load()
+    # Initial threaded load (while showing the loader): the last session when
+    # there is one, else the exports. Started from the main loop so the loader
+    # thread's completion event always has a loop to go to
+    initial_progress = Progress(LOAD_STAGES)
+    root.after_idle(start_load, finish_load_and_init, restore_session, initial_progress)
+    show_load_progress(initial_progress)
     root.mainloop()
+    get_background_tasks().shutdown()
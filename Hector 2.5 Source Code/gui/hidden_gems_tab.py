@@ -7,6 +7,7 @@ from .style import on_treeview_motion, on_leave, sort_treeview
 from .widgets import make_treeview_open_link_handler, load_player_url_template, bind_player_card_right_click
 from hidden_gems import find_all_hidden_gems, HIDDEN_GEM_CATEGORIES, get_hidden_gems_summary
 from archetypes import ARCHETYPES, get_best_archetype
+from .background import get_background_tasks
 
 player_url_template = load_player_url_template()
 
@@ -315,9 +316,16 @@ def add_hidden_gems_tab(notebook, font):
         make_treeview_open_link_handler(table, id_map, lambda pid: player_url_template.format(pid=pid))
     
     def refresh_data():
-        """Refresh hidden gems data from player lists"""
+        """Refresh hidden gems data from player lists (scanned in the background)"""
+        summary_var.set("Scanning for hidden gems...")
+        get_background_tasks().submit(
+            "hidden_gems.scan", find_all_hidden_gems, list(all_batters), list(all_pitchers),
+            on_done=show_hidden_gems
+        )
+    
+    def show_hidden_gems(gems):
         nonlocal hidden_gems_data
-        hidden_gems_data = find_all_hidden_gems(all_batters, all_pitchers)
+        hidden_gems_data = gems
         create_category_cards()
         update_table()
     
@@ -3,8 +3,13 @@
 
 import tkinter as tk
 from tkinter import ttk
+from history_store import load_team_history
+from .background import get_background_tasks
 from .style import on_treeview_motion, on_leave, sort_treeview
 
+# Most recent exports shown in the selected team's history line
+LEAGUE_TEAM_HISTORY_ENTRIES = 6
+
 
 def add_league_tab(notebook, font):
     """
@@ -22,6 +27,7 @@ def add_league_tab(notebook, font):
     
     # Data storage
     league_report = {"value": {}}
+    team_abbrs = {}  # (table, item id) -> (team abbr, team name) of the talent and YoY rows
     
     # Create scrollable canvas
     canvas = tk.Canvas(league_frame, bg="#2d2d2d", highlightthickness=0)
@@ -291,6 +297,46 @@ def add_league_tab(notebook, font):
     yoy_table.bind("<Motion>", on_treeview_motion)
     yoy_table.bind("<Leave>", on_leave)
     
+    # Selected team's record across ingested exports (see history_store.py)
+    team_history_var = tk.StringVar(value="Select a team to see its record across ingested exports.")
+    tk.Label(
+        yoy_frame,
+        textvariable=team_history_var,
+        font=font,
+        bg="#2d2d2d",
+        fg="#888888",
+        anchor="w",
+        justify="left",
+        wraplength=900
+    ).pack(fill="x", padx=10, pady=(0, 10))
+    
+    def show_team_history(table):
+        """Load the selected team's history on a worker thread and show it when it arrives"""
+        selection = table.selection()
+        if not selection:
+            return
+        abbr, team_name = team_abbrs.get((str(table), selection[0]), ("", ""))
+        if not abbr:
+            return
+        team_history_var.set(f"{team_name}: loading history...")
+        
+        def show(history):
+            if not history:
+                team_history_var.set(f"{team_name}: no history (run history_store.py ingest after each export)")
+                return
+            records = "  ->  ".join(
+                f"{h['export_date']} {h.get('W', '-')}-{h.get('L', '-')} ({h.get('%', '-')})"
+                for h in history[-LEAGUE_TEAM_HISTORY_ENTRIES:]
+            )
+            team_history_var.set(f"{team_name}: {records}")
+        
+        get_background_tasks().submit(
+            "league.team_history", load_team_history, abbr, ["W", "L", "%"], on_done=show
+        )
+    
+    talent_table.bind("<<TreeviewSelect>>", lambda e: show_team_history(talent_table))
+    yoy_table.bind("<<TreeviewSelect>>", lambda e: show_team_history(yoy_table))
+    
     def update_display():
         """Update all display sections with current report data"""
         report = league_report["value"]
@@ -394,6 +440,7 @@ def add_league_tab(notebook, font):
         
         # Update talent table
         talent_table.delete(*talent_table.get_children())
+        team_abbrs.clear()
         
         talent_data = report.get("talent_distribution", {})
         super_teams = {t["team"] for t in talent_data.get("super_teams", [])}
@@ -401,13 +448,14 @@ def add_league_tab(notebook, font):
         for rank, team in enumerate(talent_data.get("top_teams", []), 1):
             tag = "super_team" if team["team"] in super_teams else ""
             
-            talent_table.insert("", "end", values=(
+            item = talent_table.insert("", "end", values=(
                 rank,
                 team.get("team_name", ""),
                 f"{team.get('batting_war', 0):.1f}",
                 f"{team.get('pitching_war', 0):.1f}",
                 f"{team.get('total_war', 0):.1f}"
             ), tags=(tag,))
+            team_abbrs[(str(talent_table), item)] = (team.get("team", ""), team.get("team_name", ""))
         
         # Update division breakdown
         division_text.config(state="normal")
@@ -436,13 +484,14 @@ def add_league_tab(notebook, font):
         for team in all_changes[:20]:  # Show top 20
             tag = "improver" if team.get("pct_change", 0) > 0 else "decliner"
             
-            yoy_table.insert("", "end", values=(
+            item = yoy_table.insert("", "end", values=(
                 team.get("team_name", ""),
                 f"{team.get('current_pct', 0):.3f}",
                 f"{team.get('ly_pct', 0):.3f}",
                 f"{team.get('pct_change', 0):+.3f}",
                 f"{team.get('wins_change', 0):+.0f}"
             ), tags=(tag,))
+            team_abbrs[(str(yoy_table), item)] = (team.get("team", ""), team.get("team_name", ""))
     
     class LeagueTab:
         def refresh(self, teams_list, league_analytics_report):
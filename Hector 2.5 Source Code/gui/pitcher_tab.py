@@ -14,7 +14,9 @@ from .tooltips import (
     add_search_tooltip, attach_treeview_heading_tooltips, PITCHER_COL_TOOLTIPS,
     attach_treeview_row_tooltips, HIGHLIGHT_EXPLANATIONS, add_button_tooltip
 )
-from pitchers import calculate_score
+from pitchers import get_pitcher_score_model
+from score_modes import ModeScores
+from weights import get_weights_module
 from trade_value import calculate_trade_value
 
 player_url_template = load_player_url_template()
@@ -215,81 +217,48 @@ def add_pitcher_tab(notebook, font):
 
     add_pitcher_tab.CURRENT_PITCHERS = []
     
-    # Import weights module to access and modify weights
-    import sys
-    import importlib.util
+    # Scores shown under the Draft/Stats modes, by id(pitcher); None while both
+    # modes are off. The players' own "Scores" stay as loaded: other tabs read them
+    mode_scores = {"source": None, "shown": None}
     
-    def get_weights_module():
-        """Get pitcher weights module - uses same logic as core.py for frozen apps"""
-        # Import here to avoid circular import
-        from .core import get_weights_dir
-        weights_path = get_weights_dir() / "pitcher_weights.py"
-        if "pitcher_weights" in sys.modules:
-            return sys.modules["pitcher_weights"]
-        spec = importlib.util.spec_from_file_location("pitcher_weights", str(weights_path))
-        weights_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(weights_module)
-        sys.modules["pitcher_weights"] = weights_module
-        return weights_module
+    def scores_of(p):
+        """The scores this tab shows for a pitcher under the current modes."""
+        shown = mode_scores["shown"]
+        if shown is None:
+            return p["Scores"]
+        return shown.get(id(p), p["Scores"])
     
-    def get_stat_weights_module():
-        """Get pitcher stat weights module for stats-based scoring"""
-        from .core import get_weights_dir
-        weights_path = get_weights_dir() / "pitcher_stat_weights.py"
-        if "pitcher_stat_weights" in sys.modules:
-            del sys.modules["pitcher_stat_weights"]  # Always reload to get fresh values
-        spec = importlib.util.spec_from_file_location("pitcher_stat_weights", str(weights_path))
-        stat_weights_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(stat_weights_module)
-        sys.modules["pitcher_stat_weights"] = stat_weights_module
-        return stat_weights_module
-    
-    # Store original meta values
-    original_meta_values = {
-        "core_attributes": None,
-        "core_potentials": None
-    }
-    
-    def recalculate_scores_with_modes():
-        """Recalculate all pitcher scores with draft mode and stats mode"""
-        weights_module = get_weights_module()
-        weights = weights_module.section_weights
-        
-        # Store original values on first call
-        if original_meta_values["core_attributes"] is None:
-            original_meta_values["core_attributes"] = weights["meta"].get("core_attributes", 1.0)
-            original_meta_values["core_potentials"] = weights["meta"].get("core_potentials", 1.0)
+    def apply_score_modes():
+        """
+        Show pitcher scores for the current Draft and Stats modes and re-sort.
         
-        if draft_mode_var.get():
-            # Draft mode: emphasize potential
-            weights["meta"]["core_potentials"] = 1.5
-            weights["meta"]["core_attributes"] = 0.9
-        else:
-            # Normal mode: restore original weights
-            weights["meta"]["core_potentials"] = original_meta_values["core_potentials"]
-            weights["meta"]["core_attributes"] = original_meta_values["core_attributes"]
-        
-        # Get stat weights module if stats mode is enabled
+        The ratings are read into score components once per pitcher list (see
+        score_modes); toggling a mode only recombines them.
+        """
         stat_weights_module = None
-        use_stats = stats_mode_var.get()
-        if use_stats:
+        if stats_mode_var.get():
             try:
-                stat_weights_module = get_stat_weights_module()
+                stat_weights_module = get_weights_module("pitcher_stat_weights")
             except Exception as e:
                 print(f"Warning: Could not load stat weights: {e}")
-                use_stats = False
         
-        # Recalculate all pitcher scores
-        for pitcher in add_pitcher_tab.CURRENT_PITCHERS:
-            pitcher['Scores'] = calculate_score(
-                pitcher, weights,
-                use_stats=use_stats,
-                stat_weights_module=stat_weights_module
-            )
+        if not draft_mode_var.get() and stat_weights_module is None:
+            mode_scores["shown"] = None
+        else:
+            weights = get_weights_module("pitcher_weights").section_weights
+            model = get_pitcher_score_model(weights)
+            source = mode_scores["source"]
+            if source is None or source.model is not model:
+                source = mode_scores["source"] = ModeScores(add_pitcher_tab.CURRENT_PITCHERS, model)
+            meta = None
+            if draft_mode_var.get():
+                # Draft mode: emphasize potential
+                meta = dict(weights.get("meta", {}), core_potentials=1.5, core_attributes=0.9)
+            mode_scores["shown"] = source.scores(meta, stat_weights_module)
         
-        # Re-sort by new total scores
+        # Re-sort by the shown total scores
         add_pitcher_tab.CURRENT_PITCHERS.sort(
-            key=lambda p: p["Scores"].get("total", 0), reverse=True
+            key=lambda p: scores_of(p).get("total", 0), reverse=True
         )
         
         # Refresh display
@@ -301,12 +270,12 @@ def add_pitcher_tab(notebook, font):
     def on_draft_mode_toggle(*args):
         """Callback when draft mode toggle changes"""
         if add_pitcher_tab.CURRENT_PITCHERS:  # Only recalculate if we have players
-            recalculate_scores_with_modes()
+            apply_score_modes()
     
     def on_stats_mode_toggle(*args):
         """Callback when stats mode toggle changes"""
         if add_pitcher_tab.CURRENT_PITCHERS:  # Only recalculate if we have players
-            recalculate_scores_with_modes()
+            apply_score_modes()
     
     draft_mode_var.trace("w", on_draft_mode_toggle)
     stats_mode_var.trace("w", on_stats_mode_toggle)
@@ -357,11 +326,11 @@ def add_pitcher_tab(notebook, font):
                 p.get("Name", ""), p.get("ORG", ""), p.get("Age", ""), pos,
                 p.get("Prone", ""), p.get("SctAcc", ""), p.get("T", ""),
                 p.get("VELO", ""), p.get("PIT", ""), p.get("G/F", ""),
-                p["Scores"].get("pitches", 0),
-                p["Scores"].get("pitches_potential", 0),
-                p["Scores"].get("core_potential", 0) + p["Scores"].get("pitches_potential", 0),
-                p["Scores"].get("curr_total", 0),
-                p["Scores"].get("total", 0),
+                scores_of(p).get("pitches", 0),
+                scores_of(p).get("pitches_potential", 0),
+                scores_of(p).get("core_potential", 0) + scores_of(p).get("pitches_potential", 0),
+                scores_of(p).get("curr_total", 0),
+                scores_of(p).get("total", 0),
                 trade_value_display
             )
 
@@ -382,7 +351,7 @@ def add_pitcher_tab(notebook, font):
         by_pos = {}
         for p in get_filtered_pitchers():
             pos = "RP" if p.get("POS") == "CL" else p.get("POS")
-            total = p["Scores"].get("total", 0)
+            total = scores_of(p).get("total", 0)
             by_pos.setdefault(pos, []).append((total, p))
 
         for pos in pitcher_positions:
@@ -404,11 +373,11 @@ def add_pitcher_tab(notebook, font):
                 values = (
                     rank, p.get("Name", ""), p.get("ORG", ""), p.get("Age", ""), pos,
                     p.get("T", ""), p.get("VELO", ""), p.get("PIT", ""), p.get("G/F", ""),
-                    p["Scores"].get("pitches", 0),
-                    p["Scores"].get("pitches_potential", 0),
-                    p["Scores"].get("core_potential", 0) + p["Scores"].get("pitches_potential", 0),
-                    p["Scores"].get("curr_total", 0),
-                    p["Scores"].get("total", 0),
+                    scores_of(p).get("pitches", 0),
+                    scores_of(p).get("pitches_potential", 0),
+                    scores_of(p).get("core_potential", 0) + scores_of(p).get("pitches_potential", 0),
+                    scores_of(p).get("curr_total", 0),
+                    scores_of(p).get("total", 0),
                     trade_value_display
                 )
 
@@ -429,30 +398,12 @@ def add_pitcher_tab(notebook, font):
     search_var.trace_add("write", lambda *_: debounced_filter())
 
     class PitcherTab:
-        def refresh(self, pitchers):
-            # Reset weights to original when refreshing
-            weights_module = get_weights_module()
-            weights = weights_module.section_weights
-            
-            # Reload weights module to get fresh original values
-            import sys
-            if "pitcher_weights" in sys.modules:
-                del sys.modules["pitcher_weights"]
-            
-            # Get fresh module with original values
-            fresh_weights_module = get_weights_module()
-            fresh_weights = fresh_weights_module.section_weights
-            
-            # Get original values from fresh module
-            original_core_attributes = fresh_weights["meta"].get("core_attributes", 1.0)
-            original_core_potentials = fresh_weights["meta"].get("core_potentials", 1.0)
-            
-            # Store original values (fresh_weights already has original values, so no need to modify)
-            original_meta_values["core_attributes"] = original_core_attributes
-            original_meta_values["core_potentials"] = original_core_potentials
-            
-            # Store pitchers and recalculate with current mode
+        def refresh(self, pitchers, changes=None):
+            # Store pitchers and show them with the current modes; mode scores
+            # are recombined from the new list's components, so a reload's
+            # changes need no special handling
             add_pitcher_tab.CURRENT_PITCHERS = list(pitchers)
-            recalculate_scores_with_modes()
+            mode_scores["source"] = None
+            apply_score_modes()
 
     return PitcherTab()
@@ -5,15 +5,20 @@ import tkinter as tk
 from tkinter import ttk
 from percentiles import get_percentile_calculator, PERCENTILE_TIERS
 from archetypes import get_player_archetype_fits, get_best_archetype, ARCHETYPES
+from history_store import load_player_history
 from advanced_stats import (
     calculate_all_batter_advanced_stats,
     calculate_all_pitcher_advanced_stats,
 )
+from .background import get_background_tasks
 
 # Player card window dimensions
 PLAYER_CARD_WIDTH = 700
 PLAYER_CARD_HEIGHT = 780
 
+# Most recent exports shown in the OVR/POT history line
+PLAYER_CARD_HISTORY_ENTRIES = 4
+
 
 def show_player_card(parent, player, player_type="batter"):
     """
@@ -82,6 +87,32 @@ def show_player_card(parent, player, player_type="batter"):
         fg="#9775fa"
     ).pack(side="left")
     
+    # OVR/POT trend across ingested exports (see history_store.py), read on a
+    # worker thread and filled in when it arrives
+    history_label = tk.Label(
+        header_frame,
+        text="",
+        font=("Consolas", 9),
+        bg="#2d2d2d",
+        fg="#888888",
+        wraplength=PLAYER_CARD_WIDTH - 40,
+        justify="left"
+    )
+    
+    def show_history(history):
+        if len(history) < 2 or not history_label.winfo_exists():
+            return
+        trend = "  ->  ".join(
+            f"{h['export_date']} {h['OVR']}/{h['POT']}" for h in history[-PLAYER_CARD_HISTORY_ENTRIES:]
+        )
+        history_label.config(text=f"History (OVR/POT): {trend}")
+        history_label.pack(anchor="w", pady=(6, 0))
+    
+    get_background_tasks().submit(
+        "player_card.history", load_player_history, player.get("ID", ""), ["OVR", "POT"],
+        on_done=show_history
+    )
+    
     # Separator
     ttk.Separator(popup, orient="horizontal").pack(fill="x", padx=20, pady=10)
     
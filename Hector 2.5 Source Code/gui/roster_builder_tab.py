@@ -10,10 +10,22 @@ from roster_builder import (
     find_trade_targets_by_position, get_availability_tier
 )
 from archetypes import ARCHETYPES, find_players_by_archetype
+from philosophy_profiles import PHILOSOPHY_PROFILES
 from trade_value import parse_salary
+from .background import get_background_tasks, PROGRESS_POLL_MS
+from progress import Progress
 
 player_url_template = load_player_url_template()
 
+GENERATE_TEXT = "🎲 Generate!"
+CANCEL_GENERATE_TEXT = "✖ Cancel"
+
+# Philosophy choice that generates with the Level/Salary/Identity/Expansion options
+CLASSIC_PHILOSOPHY = "Classic"
+
+# Most alternate rosters one philosophy run may generate
+MAX_ALTERNATES = 50
+
 
 def add_roster_builder_tab(notebook, font):
     roster_frame = ttk.Frame(notebook)
@@ -145,21 +157,174 @@ def add_roster_builder_tab(notebook, font):
     )
     expansion_combo.pack(side="left", padx=5, pady=5)
     
+    # Philosophy-weighted generation (RosterBuilder.auto_generate_roster_v2),
+    # with any number of alternates to choose from
+    philosophy_frame = tk.Frame(roster_frame, bg="#2a2a2a", relief="raised", bd=1)
+    philosophy_frame.pack(fill="x", padx=10, pady=(0, 5))
+    
+    tk.Label(
+        philosophy_frame,
+        text="Philosophy:",
+        font=font,
+        bg="#2a2a2a",
+        fg="#d4d4d4"
+    ).pack(side="left", padx=(10, 5), pady=5)
+    
+    philosophy_keys = {profile["name"]: key for key, profile in PHILOSOPHY_PROFILES.items()}
+    philosophy_var = tk.StringVar(value=CLASSIC_PHILOSOPHY)
+    philosophy_combo = ttk.Combobox(
+        philosophy_frame,
+        textvariable=philosophy_var,
+        values=[CLASSIC_PHILOSOPHY] + list(philosophy_keys),
+        state="readonly",
+        width=20
+    )
+    philosophy_combo.pack(side="left", padx=5, pady=5)
+    
+    tk.Label(
+        philosophy_frame,
+        text="Alternates:",
+        font=font,
+        bg="#2a2a2a",
+        fg="#d4d4d4"
+    ).pack(side="left", padx=(15, 5), pady=5)
+    
+    alternates_var = tk.StringVar(value="1")
+    ttk.Spinbox(
+        philosophy_frame,
+        textvariable=alternates_var,
+        from_=1,
+        to=MAX_ALTERNATES,
+        width=4
+    ).pack(side="left", padx=5, pady=5)
+    
+    tk.Label(
+        philosophy_frame,
+        text="Show:",
+        font=font,
+        bg="#2a2a2a",
+        fg="#d4d4d4"
+    ).pack(side="left", padx=(15, 5), pady=5)
+    
+    alternate_var = tk.StringVar()
+    alternate_combo = ttk.Combobox(
+        philosophy_frame,
+        textvariable=alternate_var,
+        values=[],
+        state="readonly",
+        width=30
+    )
+    alternate_combo.pack(side="left", padx=5, pady=5)
+    
+    tk.Label(
+        philosophy_frame,
+        text="(Classic uses the options above; a philosophy replaces them)",
+        font=(font[0], font[1] - 1),
+        bg="#2a2a2a",
+        fg="#aaaaaa"
+    ).pack(side="left", padx=(10, 5), pady=5)
+    
     # Generate button
-    def do_auto_generate():
-        """Execute auto-generate with current settings"""
-        roster_builder.auto_generate_roster(
-            competitive_level=competitive_var.get(),
-            salary_tier=salary_var.get(),
-            identity=identity_var.get(),
-            expansion_mode=expansion_var.get()
-        )
+    generate_state = {"progress": None, "builds": []}  # Progress token while generating; alternates of the last run
+    
+    def generate_roster(batters, pitchers, settings, philosophy, alternates, progress):
+        """
+        Generate a roster on a scratch builder (runs on a worker thread).
+        
+        Returns:
+            Tuple of (builder holding the best roster, list of alternate builds
+            from auto_generate_roster_v2, best first; empty for Classic)
+        """
+        builder = RosterBuilder()
+        builder.set_player_pools(batters, pitchers)
+        if philosophy is None:
+            builder.auto_generate_roster(**settings, progress=progress)
+            return builder, []
+        builds = builder.auto_generate_roster_v2(philosophy, num_alternates=alternates, progress=progress)
+        if builds:
+            builder.import_roster(builds[0]["roster"])
+        return builder, builds
+    
+    def end_generate():
+        generate_state["progress"] = None
+        generate_btn.config(text=GENERATE_TEXT)
+    
+    def show_generate_progress(progress):
+        if generate_state["progress"] is not progress:
+            return  # Finished or cancelled
+        stage, fraction = progress.status()
+        text = CANCEL_GENERATE_TEXT if stage is None else f"{CANCEL_GENERATE_TEXT} {fraction:.0%}"
+        generate_btn.config(text=text)
+        generate_btn.after(PROGRESS_POLL_MS, show_generate_progress, progress)
+    
+    def show_alternates(builds):
+        generate_state["builds"] = builds
+        alternate_combo["values"] = [
+            f"#{i} {build['philosophy']} ({build['score']:.1f})" for i, build in enumerate(builds, 1)
+        ]
+        alternate_var.set(alternate_combo["values"][0] if builds else "")
+    
+    def show_generated_roster(result):
+        """Copy a generated roster into the tab's builder and redraw."""
+        end_generate()
+        builder, builds = result
+        roster_builder.lineup = builder.lineup
+        roster_builder.bench = builder.bench
+        roster_builder.rotation = builder.rotation
+        roster_builder.bullpen = builder.bullpen
+        show_alternates(builds)
+        update_roster_display()
+        update_pool_table()
+    
+    def on_alternate_selected(event=None):
+        """Show the chosen alternate of the last philosophy run."""
+        index = alternate_combo.current()
+        builds = generate_state["builds"]
+        if not 0 <= index < len(builds):
+            return
+        roster_builder.import_roster(builds[index]["roster"])
         update_roster_display()
         update_pool_table()
     
+    alternate_combo.bind("<<ComboboxSelected>>", on_alternate_selected)
+    
+    def on_generate_error(error):
+        end_generate()
+        print(f"Warning: Could not generate roster: {error}")
+    
+    def do_auto_generate():
+        """
+        Execute auto-generate with current settings (generated in the background).
+        While a roster is being generated the button cancels it instead.
+        """
+        if generate_state["progress"] is not None:
+            get_background_tasks().cancel("roster_builder.generate")
+            end_generate()
+            return
+        settings = {
+            "competitive_level": competitive_var.get(),
+            "salary_tier": salary_var.get(),
+            "identity": identity_var.get(),
+            "expansion_mode": expansion_var.get(),
+        }
+        philosophy = philosophy_keys.get(philosophy_var.get())  # None for Classic
+        try:
+            alternates = min(max(int(alternates_var.get()), 1), MAX_ALTERNATES)
+        except ValueError:
+            alternates = 1
+        progress = Progress()
+        generate_state["progress"] = progress
+        generate_btn.config(text=CANCEL_GENERATE_TEXT)
+        get_background_tasks().submit(
+            "roster_builder.generate", generate_roster, list(all_batters), list(all_pitchers), settings,
+            philosophy, alternates, progress,
+            on_done=show_generated_roster, on_error=on_generate_error, progress=progress
+        )
+        show_generate_progress(progress)
+    
     generate_btn = ttk.Button(
         auto_gen_frame, 
-        text="🎲 Generate!", 
+        text=GENERATE_TEXT, 
         command=do_auto_generate
     )
     generate_btn.pack(side="left", padx=15, pady=5)
@@ -634,20 +799,12 @@ def add_roster_builder_tab(notebook, font):
         except (ValueError, TypeError):
             return 0
     
-    def update_pool_table():
-        """Update the player pool table"""
-        pool_table.delete(*pool_table.get_children())
-        pool_id_map.clear()
-        pool_player_data_map.clear()
-        
-        pos_filter = pos_var.get()
-        team_filter = team_var.get()
-        search_filter = search_var.get().lower()
-        
+    def filter_pool(batters, pitchers, pos_filter, team_filter, search_filter):
+        """Players matching the pool filters, best OVR first (runs on a worker thread)."""
         # Combine batters and pitchers
         all_players = []
         
-        for b in all_batters:
+        for b in batters:
             pos = b.get("POS", "")
             if pos_filter != "All" and pos != pos_filter:
                 continue
@@ -658,7 +815,7 @@ def add_roster_builder_tab(notebook, font):
                 continue
             all_players.append((b, "batter"))
         
-        for p in all_pitchers:
+        for p in pitchers:
             pos = p.get("POS", "")
             if pos_filter == "RP" and pos not in ["RP", "CL"]:
                 continue
@@ -673,6 +830,21 @@ def add_roster_builder_tab(notebook, font):
         
         # Sort by OVR
         all_players.sort(key=lambda x: get_ovr(x[0]), reverse=True)
+        return all_players
+    
+    def update_pool_table():
+        """Update the player pool table (filtered in the background)"""
+        get_background_tasks().submit(
+            "roster_builder.pool", filter_pool, list(all_batters), list(all_pitchers),
+            pos_var.get(), team_var.get(), search_var.get().lower(),
+            on_done=show_pool
+        )
+    
+    def show_pool(all_players):
+        """Fill the player pool table with filtered players."""
+        pool_table.delete(*pool_table.get_children())
+        pool_id_map.clear()
+        pool_player_data_map.clear()
         
         for player, ptype in all_players:
             tags = []
@@ -790,6 +962,9 @@ def add_roster_builder_tab(notebook, font):
             all_batters.clear()
             all_pitchers.extend(pitchers)
             all_batters.extend(batters)
+            get_background_tasks().cancel("roster_builder.generate")
+            end_generate()
+            show_alternates([])  # Built from the previous players
             roster_builder.set_player_pools(batters, pitchers)
             update_team_filter()
             create_roster_slots()
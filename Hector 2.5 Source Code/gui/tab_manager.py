@@ -0,0 +1,157 @@
+# Tab Manager
+# Builds notebook tabs on their first visit instead of all at start-up, and
+# refreshes them lazily: only the visible tab recomputes straight away
+
+from tkinter import ttk
+
+# Delay between showing a tab's placeholder and building the tab (ms), so the
+# "Loading..." text is drawn before the build blocks the main loop
+BUILD_DELAY_MS = 10
+
+
+class TabManager:
+    """
+    Owns the main notebook's tabs and builds the lazy ones on first visit.
+    
+    Each tab is registered with its add_X_tab factory. Eager tabs are built
+    right away; lazy tabs get an empty placeholder page with the same title
+    and are only built (and given their data) when the user first selects
+    them.
+    
+    Refreshes are scheduled rather than run: refresh() marks the tab dirty
+    and keeps its latest arguments. The visible tab is refreshed at once;
+    other built tabs are refreshed when selected or, one per idle callback,
+    while the main loop has nothing else to do. Several refreshes of the same
+    tab before it runs coalesce into one.
+    
+    Args:
+        notebook: The main ttk.Notebook
+        font: Font passed to every tab factory
+    """
+    
+    def __init__(self, notebook, font):
+        self.notebook = notebook
+        self.font = font
+        self._tabs = {}  # key -> state dict
+        self._placeholders = {}  # placeholder widget name -> key
+        self._idle_scheduled = False
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+    
+    def add(self, key, title, factory, lazy=True):
+        """
+        Register a tab, in notebook order.
+        
+        Args:
+            key: Name used for refresh()/get()
+            title: Tab title; must match the one the factory gives the tab
+            factory: add_X_tab(notebook, font) function returning the tab object
+            lazy: Build on first visit (True) or now (False)
+        
+        Returns:
+            The tab object when built now, else None
+        """
+        state = {"title": title, "factory": factory, "tab": None, "page": None, "placeholder": None,
+                 "pending": None}
+        self._tabs[key] = state
+        if not lazy:
+            state["tab"] = factory(self.notebook, self.font)
+            state["page"] = self.notebook.tabs()[-1]
+            return state["tab"]
+        
+        placeholder = ttk.Frame(self.notebook)
+        ttk.Label(placeholder, text=f"Loading {title}...").pack(pady=40)
+        self.notebook.add(placeholder, text=title)
+        state["placeholder"] = placeholder
+        self._placeholders[str(placeholder)] = key
+        return None
+    
+    def get(self, key):
+        """The tab object, or None while the tab has not been built."""
+        return self._tabs[key]["tab"]
+    
+    def is_built(self, key):
+        return self._tabs[key]["tab"] is not None
+    
+    def is_dirty(self, key):
+        """True while the tab has a refresh that has not run yet."""
+        return self._tabs[key]["pending"] is not None
+    
+    def refresh(self, key, *args, **kwargs):
+        """
+        Schedule the tab's refresh(*args, **kwargs): now if it is the visible
+        tab, else when it is selected or the main loop is idle (unbuilt tabs
+        wait until they are built).
+        
+        A refresh can carry the Changeset of an incremental reload (changes=).
+        It is dropped when refreshes coalesce or the tab is not built yet, as
+        the tab then needs more than the latest reload's differences.
+        """
+        state = self._tabs[key]
+        if "changes" in kwargs and (state["tab"] is None or state["pending"] is not None):
+            kwargs = dict(kwargs, changes=None)
+        state["pending"] = (args, kwargs)
+        if state["tab"] is None:
+            return
+        if self._is_visible(key):
+            self._run(key)
+        else:
+            self._schedule_idle()
+    
+    def _is_visible(self, key):
+        page = self._tabs[key]["page"]
+        return page is not None and page == self.notebook.select()
+    
+    def _run(self, key):
+        state = self._tabs[key]
+        if state["pending"] is None or state["tab"] is None:
+            return
+        args, kwargs = state["pending"]
+        state["pending"] = None
+        state["tab"].refresh(*args, **kwargs)
+    
+    def _schedule_idle(self):
+        if not self._idle_scheduled:
+            self._idle_scheduled = True
+            self.notebook.after_idle(self._run_idle)
+    
+    def _run_idle(self):
+        # One tab per idle callback, so events are handled between refreshes
+        self._idle_scheduled = False
+        for key, state in self._tabs.items():
+            if state["tab"] is not None and state["pending"] is not None:
+                self._run(key)
+                break
+        if any(state["tab"] is not None and state["pending"] is not None for state in self._tabs.values()):
+            self._schedule_idle()
+    
+    def _on_tab_changed(self, event=None):
+        selected = self.notebook.select()
+        key = self._placeholders.get(selected)
+        if key is not None:
+            self.notebook.after(BUILD_DELAY_MS, self._build, key)
+            return
+        for key, state in self._tabs.items():
+            if state["page"] == selected:
+                self._run(key)  # No-op unless the tab is dirty
+                break
+    
+    def _build(self, key):
+        state = self._tabs[key]
+        placeholder = state["placeholder"]
+        if state["tab"] is not None or placeholder is None:
+            return
+        
+        # The factory appends its page; move it into the placeholder's slot
+        index = self.notebook.index(placeholder)
+        state["tab"] = state["factory"](self.notebook, self.font)
+        page = self.notebook.tabs()[-1]
+        state["page"] = page
+        self.notebook.insert(index, page)
+        if self.notebook.select() == str(placeholder):
+            self.notebook.select(page)
+        self.notebook.forget(placeholder)
+        del self._placeholders[str(placeholder)]
+        placeholder.destroy()
+        state["placeholder"] = None
+        
+        self._run(key)
@@ -11,6 +11,7 @@ from .widgets import (
     bind_player_card_right_click,
 )
 from .tooltips import add_button_tooltip
+from .background import get_background_tasks
 from trade_value import parse_number, parse_years_left, get_contract_status, parse_salary
 from team_parser import (
     calculate_surplus_value, get_surplus_tier, get_park_factor_context,
@@ -723,36 +724,18 @@ def add_trade_builder_tab(notebook, font):
         
         total_offered_var.set(f"Total Value Offered: {total_value:.1f}")
     
-    def find_matching_players():
-        """Find players matching the trade criteria."""
-        results_table.delete(*results_table.get_children())
-        results_id_map.clear()
-        
-        # Get filter values
-        pos_filter = position_var.get()
-        status_filter = team_status_var.get().lower()
-        trade_mode = trade_mode_var.get()
-        your_team = your_team_var.get()
-        
-        try:
-            min_age = int(min_age_var.get())
-        except ValueError:
-            min_age = 18
-        
-        try:
-            max_age = int(max_age_var.get())
-        except ValueError:
-            max_age = 40
-        
-        try:
-            min_ovr = float(min_ovr_var.get())
-        except ValueError:
-            min_ovr = 0
+    def search_players(pitchers, batters, assets, teams, your_team, pos_filter, status_filter,
+                       trade_mode, min_age, max_age, min_ovr):
+        """
+        Score every player against the trade criteria (runs on a worker thread).
         
+        Returns:
+            Matching players, best match first
+        """
         # Calculate total offered value
         total_offered = sum(
-            get_player_trade_value(p, p.get("_type", "batter")).get("total_trade_value", 0)
-            for p in selected_assets
+            calculate_comprehensive_trade_value(p, teams, p.get("_type", "batter")).get("total_trade_value", 0)
+            for p in assets
         )
         
         # Get mode tolerance
@@ -761,12 +744,12 @@ def add_trade_builder_tab(notebook, font):
         
         # Combine all players
         all_players = []
-        for p in all_pitchers:
+        for p in pitchers:
             player_data = p.copy()
             player_data["_type"] = "pitcher"
             all_players.append(player_data)
         
-        for b in all_batters:
+        for b in batters:
             player_data = b.copy()
             player_data["_type"] = "batter"
             all_players.append(player_data)
@@ -782,7 +765,7 @@ def add_trade_builder_tab(notebook, font):
             # Skip players already in selected assets
             if any(
                 a.get("Name") == player.get("Name") and a.get("ORG") == player.get("ORG")
-                for a in selected_assets
+                for a in assets
             ):
                 continue
             
@@ -807,7 +790,7 @@ def add_trade_builder_tab(notebook, font):
             
             # Team status filter
             team_abbr = player.get("ORG", "")
-            team_info = teams_data.get(team_abbr, {})
+            team_info = teams.get(team_abbr, {})
             team_status = team_info.get("status", "neutral")
             
             if status_filter == "sellers" and team_status != "seller":
@@ -819,7 +802,7 @@ def add_trade_builder_tab(notebook, font):
             
             # Calculate player value
             player_type = player.get("_type", "batter")
-            trade_val = get_player_trade_value(player, player_type)
+            trade_val = calculate_comprehensive_trade_value(player, teams, player_type)
             player_value = trade_val.get("total_trade_value", 0)
             
             # Check if value matches based on mode
@@ -876,6 +859,42 @@ def add_trade_builder_tab(notebook, font):
         
         # Sort by match score
         matching_players.sort(key=lambda x: x["match_score"], reverse=True)
+        return matching_players
+    
+    def find_matching_players():
+        """Find players matching the trade criteria (searched in the background)."""
+        # Get filter values
+        pos_filter = position_var.get()
+        status_filter = team_status_var.get().lower()
+        trade_mode = trade_mode_var.get()
+        your_team = your_team_var.get()
+        
+        try:
+            min_age = int(min_age_var.get())
+        except ValueError:
+            min_age = 18
+        
+        try:
+            max_age = int(max_age_var.get())
+        except ValueError:
+            max_age = 40
+        
+        try:
+            min_ovr = float(min_ovr_var.get())
+        except ValueError:
+            min_ovr = 0
+        
+        get_background_tasks().submit(
+            "trade_builder.search", search_players,
+            list(all_pitchers), list(all_batters), list(selected_assets), dict(teams_data),
+            your_team, pos_filter, status_filter, trade_mode, min_age, max_age, min_ovr,
+            on_done=show_matching_players
+        )
+    
+    def show_matching_players(matching_players):
+        """Display search results."""
+        results_table.delete(*results_table.get_children())
+        results_id_map.clear()
         
         # Display results
         for mp in matching_players[:MAX_SEARCH_RESULTS]:
@@ -1118,6 +1137,7 @@ def add_trade_builder_tab(notebook, font):
             if teams_by_abbr:
                 teams_data.update(teams_by_abbr)
             
+            get_background_tasks().cancel("trade_builder.search")
             update_team_dropdown()
             update_player_list()
             clear_trade()
@@ -6,6 +6,7 @@ import os
 import re
 from collections import defaultdict
 import sys
+from player_table import column_mask
 
 ### -------- UI Factories and Utility Widgets -------- ###
 
@@ -262,12 +263,15 @@ def add_grouped_position_filters(parent, pos_vars, on_change):
 
 ### --------- (Optional) Data Validation --------- ###
 
+def _is_blank(val):
+    return val in [None, ""]
+
 def validate_fields(players, required_fields):
     missing_fields = set()
-    for player in players:
-        for field in required_fields:
-            if field not in player or player[field] in [None, ""]:
-                missing_fields.add(field)
+    for field in required_fields:
+        # Column-wise so PlayerTable rows are checked without touching each row
+        if column_mask(players, field, _is_blank, default=None).any():
+            missing_fields.add(field)
     return missing_fields
 
 def detect_wrong_import(players, valid_positions, wrong_positions):
@@ -330,13 +334,27 @@ def show_loading_bar(
     label_text="Loading data, please wait...",
     font=None,
     bar_color="#09ff00",
-    bg="#000000"
+    bg="#000000",
+    textvariable=None,
+    determinate=False
 ):
+    """
+    Show a centred loading message with a progress bar.
+    
+    Args:
+        textvariable: Optional StringVar for the message, to update it while loading
+        determinate: Show a 0-100 bar that the caller fills in (bar["value"])
+            instead of an animated one
+    
+    Returns:
+        Tuple of (frame, progress bar)
+    """
     frame = tk.Frame(root, bg=bg)
     frame.place(relx=0.5, rely=0.47, anchor="center")
     loading_label = tk.Label(
         frame,
         text=label_text,
+        textvariable=textvariable,
         font=font if font else ("Consolas", 20, "bold"),
         fg="#09ff00",
         bg=bg,
@@ -344,12 +362,14 @@ def show_loading_bar(
     loading_label.pack(padx=70, pady=(44, 18))
     progress = ttk.Progressbar(
         frame,
-        mode="indeterminate",
+        mode="determinate" if determinate else "indeterminate",
+        maximum=100,
         length=420,
         style="Neon.Horizontal.TProgressbar"
     )
     progress.pack(padx=70, pady=(0, 40))
-    progress.start(8)
+    if not determinate:
+        progress.start(8)
     root.update_idletasks()
     root.update()
     return frame, progress
@@ -1,9 +1,9 @@
 # Hidden Gems / AAAA Finder
 # Detects overlooked players who deserve a second look
 
-from trade_value import parse_number, parse_salary, parse_years_left
+from field_types import get_number, get_salary, get_years_left
 from player_utils import (
-    parse_star_rating, get_age, get_war, is_star_scale, 
+    get_age, get_war, is_star_scale, 
     RATING_SCALE_THRESHOLD
 )
 
@@ -69,7 +69,7 @@ def find_aaaa_players(batters, pitchers):
     
     # Process batters
     for batter in batters:
-        ovr = parse_star_rating(batter.get("OVR", "0"))
+        ovr = get_number(batter, "OVR", "0")
         
         # Check if OVR is in range (handle both 20-80 scale and star scale)
         if is_star_scale(ovr):  # Star scale (1-5)
@@ -79,7 +79,7 @@ def find_aaaa_players(batters, pitchers):
             if not (45 <= ovr <= 55):
                 continue
         
-        wrc_plus = parse_number(batter.get("wRC+", 0))
+        wrc_plus = get_number(batter, "wRC+", 0)
         
         if wrc_plus < 100:
             continue
@@ -94,7 +94,7 @@ def find_aaaa_players(batters, pitchers):
             "pos": batter.get("POS", ""),
             "age": get_age(batter),
             "ovr": ovr,
-            "pot": parse_star_rating(batter.get("POT", "0")),
+            "pot": get_number(batter, "POT", "0"),
             "key_stat": f"wRC+ {wrc_plus:.0f}",
             "why_hidden": "Solid OVR, producing well",
             "upside": "Could be everyday starter",
@@ -102,7 +102,7 @@ def find_aaaa_players(batters, pitchers):
     
     # Process pitchers
     for pitcher in pitchers:
-        ovr = parse_star_rating(pitcher.get("OVR", "0"))
+        ovr = get_number(pitcher, "OVR", "0")
         
         # Check if OVR is in range
         if is_star_scale(ovr):  # Star scale (1-5)
@@ -112,7 +112,7 @@ def find_aaaa_players(batters, pitchers):
             if not (45 <= ovr <= 55):
                 continue
         
-        era_plus = parse_number(pitcher.get("ERA+", 0))
+        era_plus = get_number(pitcher, "ERA+", 0)
         
         if era_plus < 100:
             continue
@@ -126,7 +126,7 @@ def find_aaaa_players(batters, pitchers):
             "pos": pitcher.get("POS", ""),
             "age": get_age(pitcher),
             "ovr": ovr,
-            "pot": parse_star_rating(pitcher.get("POT", "0")),
+            "pot": get_number(pitcher, "POT", "0"),
             "key_stat": f"ERA+ {era_plus:.0f}",
             "why_hidden": "Solid OVR, producing well",
             "upside": "Could be rotation/bullpen piece",
@@ -151,8 +151,8 @@ def find_late_bloomers(batters, pitchers):
         if not (26 <= age <= 28):
             continue
         
-        ovr = parse_star_rating(batter.get("OVR", "0"))
-        pot = parse_star_rating(batter.get("POT", "0"))
+        ovr = get_number(batter, "OVR", "0")
+        pot = get_number(batter, "POT", "0")
         
         # Calculate remaining upside using appropriate threshold for scale type
         upside_gap = pot - ovr
@@ -163,7 +163,7 @@ def find_late_bloomers(batters, pitchers):
             if upside_gap < UPSIDE_GAP_THRESHOLD_20_80:
                 continue
         
-        wrc_plus = parse_number(batter.get("wRC+", 0))
+        wrc_plus = get_number(batter, "wRC+", 0)
         if wrc_plus < 95:  # Still producing reasonably
             continue
         
@@ -187,8 +187,8 @@ def find_late_bloomers(batters, pitchers):
         if not (26 <= age <= 28):
             continue
         
-        ovr = parse_star_rating(pitcher.get("OVR", "0"))
-        pot = parse_star_rating(pitcher.get("POT", "0"))
+        ovr = get_number(pitcher, "OVR", "0")
+        pot = get_number(pitcher, "POT", "0")
         
         # Calculate remaining upside using appropriate threshold for scale type
         upside_gap = pot - ovr
@@ -199,7 +199,7 @@ def find_late_bloomers(batters, pitchers):
             if upside_gap < UPSIDE_GAP_THRESHOLD_20_80:
                 continue
         
-        era_plus = parse_number(pitcher.get("ERA+", 0))
+        era_plus = get_number(pitcher, "ERA+", 0)
         if era_plus < 95:
             continue
         
@@ -237,29 +237,29 @@ def find_miscast_players(batters):
             continue
         
         # Get batting ratings
-        con = parse_number(batter.get("CON", 0))
-        pow_ = parse_number(batter.get("POW", 0))
-        eye = parse_number(batter.get("EYE", 0))
+        con = get_number(batter, "CON", 0)
+        pow_ = get_number(batter, "POW", 0)
+        eye = get_number(batter, "EYE", 0)
         bat_avg = (con + pow_ + eye) / 3
         
         # Get defensive ratings based on position
         if pos == "C":
             def_ratings = [
-                parse_number(batter.get("C ABI", 0)),
-                parse_number(batter.get("C ARM", 0)),
-                parse_number(batter.get("C FRM", 0)),
+                get_number(batter, "C ABI", 0),
+                get_number(batter, "C ARM", 0),
+                get_number(batter, "C FRM", 0),
             ]
         elif pos == "SS":
             def_ratings = [
-                parse_number(batter.get("IF RNG", 0)),
-                parse_number(batter.get("IF ARM", 0)),
-                parse_number(batter.get("IF ERR", 0)),
+                get_number(batter, "IF RNG", 0),
+                get_number(batter, "IF ARM", 0),
+                get_number(batter, "IF ERR", 0),
             ]
         else:  # CF
             def_ratings = [
-                parse_number(batter.get("OF RNG", 0)),
-                parse_number(batter.get("OF ARM", 0)),
-                parse_number(batter.get("OF ERR", 0)),
+                get_number(batter, "OF RNG", 0),
+                get_number(batter, "OF ARM", 0),
+                get_number(batter, "OF ERR", 0),
             ]
         
         def_avg = sum(def_ratings) / len(def_ratings) if def_ratings else 0
@@ -274,8 +274,8 @@ def find_miscast_players(batters):
                 "team": batter.get("ORG", ""),
                 "pos": pos,
                 "age": get_age(batter),
-                "ovr": parse_star_rating(batter.get("OVR", "0")),
-                "pot": parse_star_rating(batter.get("POT", "0")),
+                "ovr": get_number(batter, "OVR", "0"),
+                "pot": get_number(batter, "POT", "0"),
                 "key_stat": f"Bat {bat_avg:.0f}, Def {def_avg:.0f}",
                 "why_hidden": f"Good bat stuck at {pos}",
                 "upside": "Would thrive at DH/corner",
@@ -299,13 +299,13 @@ def find_undervalued_veterans(batters, pitchers):
         if age < 30:
             continue
         
-        wrc_plus = parse_number(batter.get("wRC+", 0))
+        wrc_plus = get_number(batter, "wRC+", 0)
         if wrc_plus < 95:
             continue
         
         # Check contract
-        salary = parse_salary(batter.get("SLR", 0))
-        yl_data = parse_years_left(batter.get("YL", ""))
+        salary = get_salary(batter, "SLR", 0)
+        yl_data = get_years_left(batter, "YL", "")
         years_left = yl_data.get("years", 99)
         
         # Cheap (< $5M) or expiring
@@ -329,8 +329,8 @@ def find_undervalued_veterans(batters, pitchers):
             "team": batter.get("ORG", ""),
             "pos": batter.get("POS", ""),
             "age": age,
-            "ovr": parse_star_rating(batter.get("OVR", "0")),
-            "pot": parse_star_rating(batter.get("POT", "0")),
+            "ovr": get_number(batter, "OVR", "0"),
+            "pot": get_number(batter, "POT", "0"),
             "key_stat": f"wRC+ {wrc_plus:.0f}",
             "why_hidden": contract_note,
             "upside": "Productive veteran depth",
@@ -341,12 +341,12 @@ def find_undervalued_veterans(batters, pitchers):
         if age < 30:
             continue
         
-        era_plus = parse_number(pitcher.get("ERA+", 0))
+        era_plus = get_number(pitcher, "ERA+", 0)
         if era_plus < 95:
             continue
         
-        salary = parse_salary(pitcher.get("SLR", 0))
-        yl_data = parse_years_left(pitcher.get("YL", ""))
+        salary = get_salary(pitcher, "SLR", 0)
+        yl_data = get_years_left(pitcher, "YL", "")
         years_left = yl_data.get("years", 99)
         
         is_cheap = salary < 5
@@ -369,8 +369,8 @@ def find_undervalued_veterans(batters, pitchers):
             "team": pitcher.get("ORG", ""),
             "pos": pitcher.get("POS", ""),
             "age": age,
-            "ovr": parse_star_rating(pitcher.get("OVR", "0")),
-            "pot": parse_star_rating(pitcher.get("POT", "0")),
+            "ovr": get_number(pitcher, "OVR", "0"),
+            "pot": get_number(pitcher, "POT", "0"),
             "key_stat": f"ERA+ {era_plus:.0f}",
             "why_hidden": contract_note,
             "upside": "Productive veteran depth",
@@ -396,10 +396,10 @@ def find_toolsy_gambles(batters, pitchers):
         
         # Get all tool ratings
         tools = {
-            "CON": parse_number(batter.get("CON", 0)),
-            "POW": parse_number(batter.get("POW", 0)),
-            "EYE": parse_number(batter.get("EYE", 0)),
-            "SPE": parse_number(batter.get("SPE", 0)),
+            "CON": get_number(batter, "CON", 0),
+            "POW": get_number(batter, "POW", 0),
+            "EYE": get_number(batter, "EYE", 0),
+            "SPE": get_number(batter, "SPE", 0),
         }
         
         # Count elite tools (65+) and mediocre tools (40-50)
@@ -422,8 +422,8 @@ def find_toolsy_gambles(batters, pitchers):
             "team": batter.get("ORG", ""),
             "pos": batter.get("POS", ""),
             "age": age,
-            "ovr": parse_star_rating(batter.get("OVR", "0")),
-            "pot": parse_star_rating(batter.get("POT", "0")),
+            "ovr": get_number(batter, "OVR", "0"),
+            "pot": get_number(batter, "POT", "0"),
             "key_stat": f"Elite: {elite_names}",
             "why_hidden": "Uneven profile, high variance",
             "upside": "Elite tools could emerge",
@@ -435,9 +435,9 @@ def find_toolsy_gambles(batters, pitchers):
             continue
         
         tools = {
-            "STU": parse_number(pitcher.get("STU", 0)),
-            "MOV": parse_number(pitcher.get("MOV", 0)),
-            "CON": parse_number(pitcher.get("CON", 0)),
+            "STU": get_number(pitcher, "STU", 0),
+            "MOV": get_number(pitcher, "MOV", 0),
+            "CON": get_number(pitcher, "CON", 0),
         }
         
         elite_tools = [(name, val) for name, val in tools.items() if val >= 65]
@@ -458,8 +458,8 @@ def find_toolsy_gambles(batters, pitchers):
             "team": pitcher.get("ORG", ""),
             "pos": pitcher.get("POS", ""),
             "age": age,
-            "ovr": parse_star_rating(pitcher.get("OVR", "0")),
-            "pot": parse_star_rating(pitcher.get("POT", "0")),
+            "ovr": get_number(pitcher, "OVR", "0"),
+            "pot": get_number(pitcher, "POT", "0"),
             "key_stat": f"Elite: {elite_names}",
             "why_hidden": "Uneven profile, high variance",
             "upside": "Elite tools could emerge",
@@ -483,12 +483,12 @@ def find_reliever_converts(pitchers):
         if pos != "SP":
             continue
         
-        stamina = parse_number(pitcher.get("STM", 0))
+        stamina = get_number(pitcher, "STM", 0)
         if stamina >= 45:
             continue
         
-        stuff = parse_number(pitcher.get("STU", 0))
-        movement = parse_number(pitcher.get("MOV", 0))
+        stuff = get_number(pitcher, "STU", 0)
+        movement = get_number(pitcher, "MOV", 0)
         
         if stuff < 55 and movement < 55:
             continue
@@ -504,8 +504,8 @@ def find_reliever_converts(pitchers):
             "team": pitcher.get("ORG", ""),
             "pos": pos,
             "age": get_age(pitcher),
-            "ovr": parse_star_rating(pitcher.get("OVR", "0")),
-            "pot": parse_star_rating(pitcher.get("POT", "0")),
+            "ovr": get_number(pitcher, "OVR", "0"),
+            "pot": get_number(pitcher, "POT", "0"),
             "key_stat": f"STM {stamina:.0f}, {best_pitch} {best_value:.0f}",
             "why_hidden": "Listed as SP, low stamina",
             "upside": "High-leverage reliever potential",
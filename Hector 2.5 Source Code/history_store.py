@@ -0,0 +1,339 @@
+# History Store Module
+# Keeps every ingested export in a local SQLite database, so trends across
+# exports (ratings, WAR, salaries, team records) can be read without
+# re-parsing old HTML files.
+#
+# One row per player (or team) per export, keyed by player ID / team abbreviation
+# and export date. The full row is kept as JSON; ID, ORG, POS, name and the
+# export date are real indexed columns for fast lookups. Re-ingesting an export
+# for the same date replaces it; ingesting an unchanged file again is a no-op.
+#
+# Usage (run from the folder that holds your exports):
+#     python history_store.py ingest                   # date = export file date
+#     python history_store.py ingest --date 2031-04-01
+#     python history_store.py list
+#     python history_store.py player <ID>
+#     python history_store.py team <ABBR>
+
+import argparse
+import datetime
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+from export_files import find_export
+from load_pipeline import PLAYER_LIST_FILE, TEAM_LIST_FILE, FREE_AGENTS_FILE
+from snapshot_cache import file_hash, load_player_table_cached, load_teams_cached
+
+
+HISTORY_DB_FILE = "Rosterlytics History.sqlite"
+
+# Kinds of export kept in the store
+EXPORT_KINDS = ("players", "free_agents", "teams")
+
+# Bump when the table layout changes
+SCHEMA_VERSION = 1
+
+# How long a GUI lookup waits for a database an ingest is writing (seconds);
+# the lookup then shows no history rather than holding up the window
+HISTORY_READ_TIMEOUT = 0.25
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exports (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    export_date TEXT NOT NULL,
+    source TEXT,
+    file_hash TEXT,
+    ingested_at TEXT NOT NULL,
+    UNIQUE (kind, export_date)
+);
+CREATE TABLE IF NOT EXISTS players (
+    export_id INTEGER NOT NULL REFERENCES exports(id) ON DELETE CASCADE,
+    export_date TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    name TEXT,
+    org TEXT,
+    pos TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS teams (
+    export_id INTEGER NOT NULL REFERENCES exports(id) ON DELETE CASCADE,
+    export_date TEXT NOT NULL,
+    abbr TEXT NOT NULL,
+    name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_players_id ON players (player_id, export_date);
+CREATE INDEX IF NOT EXISTS idx_players_org ON players (org, export_date);
+CREATE INDEX IF NOT EXISTS idx_players_pos ON players (pos, export_date);
+CREATE INDEX IF NOT EXISTS idx_players_date ON players (export_date);
+CREATE INDEX IF NOT EXISTS idx_players_export ON players (export_id);
+CREATE INDEX IF NOT EXISTS idx_teams_abbr ON teams (abbr, export_date);
+CREATE INDEX IF NOT EXISTS idx_teams_date ON teams (export_date);
+CREATE INDEX IF NOT EXISTS idx_teams_export ON teams (export_id);
+"""
+
+
+def export_date_of(path):
+    """Default export date of a file: the day it was last written (YYYY-MM-DD)."""
+    return datetime.date.fromtimestamp(os.path.getmtime(path)).isoformat()
+
+
+class HistoryStore:
+    """
+    SQLite database of ingested exports.
+    
+    Args:
+        path: Database file (created on first use, unless read_only)
+        read_only: Open for queries only: the file is opened read-only and the
+            schema is left alone, so a lookup never takes the write lock
+        timeout: Seconds to wait for a lock held by another connection
+    """
+    
+    def __init__(self, path=HISTORY_DB_FILE, read_only=False, timeout=5.0):
+        self.path = path
+        if read_only:
+            self.conn = sqlite3.connect(f"{Path(path).absolute().as_uri()}?mode=ro", uri=True, timeout=timeout)
+        else:
+            self.conn = sqlite3.connect(path, timeout=timeout)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if self.version not in (0, SCHEMA_VERSION):
+            raise ValueError(f"{path} was written by a newer version of Rosterlytics (schema {self.version}).")
+        if read_only:
+            return
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.version = SCHEMA_VERSION
+    
+    def close(self):
+        self.conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    # ---------------- Ingestion ----------------
+    
+    def _begin_export(self, kind, export_date, source, digest):
+        """Replace any export of this kind on the same date. Returns the new export id, or None if unchanged."""
+        row = self.conn.execute(
+            "SELECT id, file_hash FROM exports WHERE kind = ? AND export_date = ?", (kind, export_date)
+        ).fetchone()
+        if row is not None:
+            if digest and row["file_hash"] == digest:
+                return None
+            self.conn.execute("DELETE FROM exports WHERE id = ?", (row["id"],))
+        cursor = self.conn.execute(
+            "INSERT INTO exports (kind, export_date, source, file_hash, ingested_at) VALUES (?, ?, ?, ?, ?)",
+            (kind, export_date, source, digest, datetime.datetime.now().isoformat(timespec="seconds")),
+        )
+        return cursor.lastrowid
+    
+    def ingest_players(self, players, export_date, kind="players", source=None, digest=None):
+        """
+        Store one player export.
+        
+        Args:
+            players: Player rows (PlayerTable rows or dicts)
+            export_date: Date of the export (YYYY-MM-DD)
+            kind: "players" or "free_agents"
+            source: File the players came from
+            digest: Content hash of that file; an identical re-ingest is skipped
+        
+        Returns:
+            Number of players stored (0 when the export was already stored)
+        """
+        with self.conn:
+            export_id = self._begin_export(kind, export_date, source, digest)
+            if export_id is None:
+                return 0
+            self.conn.executemany(
+                "INSERT INTO players (export_id, export_date, kind, player_id, name, org, pos, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (export_id, export_date, kind, str(player.get("ID", "")), player.get("Name"),
+                     player.get("ORG"), player.get("POS"), json.dumps(dict(player)))
+                    for player in players
+                ),
+            )
+        return len(players)
+    
+    def ingest_teams(self, teams, export_date, source=None, digest=None):
+        """Store one Team List export. Returns the number of teams stored."""
+        with self.conn:
+            export_id = self._begin_export("teams", export_date, source, digest)
+            if export_id is None:
+                return 0
+            self.conn.executemany(
+                "INSERT INTO teams (export_id, export_date, abbr, name, data) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (export_id, export_date, team.get("Abbr", ""), team.get("Team Name"), json.dumps(team))
+                    for team in teams
+                ),
+            )
+        return len(teams)
+    
+    def ingest_folder(self, folder=".", export_date=None):
+        """
+        Ingest Player List, Free Agents and Team List from a folder (whichever exist,
+        HTML or CSV, plain or compressed).
+        Exports are read through their snapshots, so unchanged files are not re-parsed.
+        
+        Args:
+            folder: Folder holding the exports
+            export_date: Date for every export; defaults to each file's modification date
+        
+        Returns:
+            Dict of kind -> number of rows stored
+        """
+        stored = {}
+        for kind, name in (("players", PLAYER_LIST_FILE), ("free_agents", FREE_AGENTS_FILE),
+                           ("teams", TEAM_LIST_FILE)):
+            path = find_export(os.path.join(folder, name))
+            if not os.path.exists(path):
+                continue
+            date = export_date or export_date_of(path)
+            digest = file_hash(path)
+            source = os.path.abspath(path)
+            if kind == "teams":
+                stored[kind] = self.ingest_teams(load_teams_cached(path), date, source, digest)
+            else:
+                rows = load_player_table_cached(path).rows()
+                stored[kind] = self.ingest_players(rows, date, kind, source, digest)
+        return stored
+    
+    # ---------------- Queries ----------------
+    
+    def exports(self, kind=None):
+        """Ingested exports, oldest first, as dicts (kind, export_date, source, ...)."""
+        sql = "SELECT kind, export_date, source, file_hash, ingested_at FROM exports"
+        params = ()
+        if kind:
+            sql += " WHERE kind = ?"
+            params = (kind,)
+        return [dict(row) for row in self.conn.execute(sql + " ORDER BY export_date, kind", params)]
+    
+    def player_history(self, player_id, fields=None, kind=None):
+        """
+        Every stored row of one player, oldest export first.
+        
+        Args:
+            player_id: Player ID (the export's ID column)
+            fields: Columns to return (default: all)
+            kind: Only "players" or "free_agents" exports (default: both)
+        
+        Returns:
+            List of dicts with export_date, kind and the requested fields
+        """
+        sql = "SELECT export_date, kind, data FROM players WHERE player_id = ?"
+        params = [str(player_id)]
+        if kind:
+            sql += " AND kind = ?"
+            params.append(kind)
+        return [self._record(row, fields) for row in self.conn.execute(sql + " ORDER BY export_date", params)]
+    
+    def team_history(self, abbr, fields=None):
+        """Every stored row of one team (by abbreviation / ORG), oldest export first."""
+        rows = self.conn.execute(
+            "SELECT export_date, data FROM teams WHERE abbr = ? ORDER BY export_date", (abbr,)
+        )
+        return [self._record(row, fields) for row in rows]
+    
+    def players_at(self, export_date, org=None, pos=None, kind="players"):
+        """All players of one export, optionally filtered by ORG and/or POS."""
+        sql = "SELECT export_date, kind, data FROM players WHERE export_date = ? AND kind = ?"
+        params = [export_date, kind]
+        if org:
+            sql += " AND org = ?"
+            params.append(org)
+        if pos:
+            sql += " AND pos = ?"
+            params.append(pos)
+        return [self._record(row) for row in self.conn.execute(sql, params)]
+    
+    @staticmethod
+    def _record(row, fields=None):
+        data = json.loads(row["data"])
+        if fields is not None:
+            data = {field: data.get(field) for field in fields}
+        record = {"export_date": row["export_date"]}
+        if "kind" in row.keys():
+            record["kind"] = row["kind"]
+        record.update(data)
+        return record
+
+
+def _read_history(path, query):
+    """Run query(store) on a read-only HistoryStore; [] when there is no history or it can't be read."""
+    if not os.path.exists(path):
+        return []
+    try:
+        with HistoryStore(path, read_only=True, timeout=HISTORY_READ_TIMEOUT) as store:
+            if store.version == 0:
+                return []  # Nothing ingested yet
+            return query(store)
+    except (sqlite3.Error, ValueError) as e:
+        print(f"Warning: Could not read history from {path}: {e}")
+        return []
+
+
+def load_player_history(player_id, fields=None, path=HISTORY_DB_FILE):
+    """
+    History of one player for the GUI, or [] when no history has been ingested.
+    
+    The database is opened read-only and a lookup gives up after
+    HISTORY_READ_TIMEOUT while an ingest is writing; errors are reported and
+    treated as no history. Call it off the Tk main thread (see gui.background).
+    """
+    return _read_history(path, lambda store: store.player_history(player_id, fields, kind="players"))
+
+
+def load_team_history(abbr, fields=None, path=HISTORY_DB_FILE):
+    """History of one team for the GUI, or [] when no history has been ingested (see load_player_history)."""
+    return _read_history(path, lambda store: store.team_history(abbr, fields))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rosterlytics export history")
+    parser.add_argument("--db", default=HISTORY_DB_FILE, help="History database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("ingest", help="Store the exports in a folder")
+    ingest.add_argument("folder", nargs="?", default=".")
+    ingest.add_argument("--date", help="Export date (YYYY-MM-DD); defaults to each file's date")
+    commands.add_parser("list", help="List ingested exports")
+    player = commands.add_parser("player", help="Show a player's history")
+    player.add_argument("player_id")
+    team = commands.add_parser("team", help="Show a team's history")
+    team.add_argument("abbr")
+    args = parser.parse_args(argv)
+    if getattr(args, "date", None):
+        try:
+            args.date = datetime.date.fromisoformat(args.date).isoformat()
+        except ValueError:
+            parser.error(f"--date must be YYYY-MM-DD, got '{args.date}'")
+    
+    with HistoryStore(args.db) as store:
+        if args.command == "ingest":
+            for kind, count in store.ingest_folder(args.folder, args.date).items():
+                print(f"{kind:<12} {count:>6} rows" if count else f"{kind:<12} unchanged, skipped")
+        elif args.command == "list":
+            for export in store.exports():
+                print(f"{export['export_date']}  {export['kind']:<12} {export['source']}")
+        elif args.command == "player":
+            for row in store.player_history(args.player_id, ["Name", "ORG", "POS", "Age", "OVR", "POT", "SLR"]):
+                print("  ".join(f"{value}" for value in row.values()))
+        elif args.command == "team":
+            for row in store.team_history(args.abbr, ["Team Name", "W", "L", "%", "WAR"]):
+                print("  ".join(f"{value}" for value in row.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,277 @@
 """
 HTML Parser for OOTP exports.
 Parses Player List.html, Free Agents.html, and other OOTP HTML exports.
+
+The export table can be read by one of several interchangeable backends:
+    "stream" - stdlib HTMLParser state machine specialised to OOTP's table.data layout
+    "lxml"   - libxml2 based parser, used when lxml is installed
+    "bs4"    - the original BeautifulSoup path, kept as a fallback
+All backends return identical rows. "auto" picks the fastest one available.
+
+Very large exports (multi-level universes) can also be read with the "parallel"
+mode: the <tbody> byte range is split into row-aligned chunks that worker
+processes parse with the fastest backend, and the rows are merged back in order.
+"auto" switches to it for exports over PARALLEL_MIN_BYTES on multi-core machines.
+
+Exports saved as CSV are read by csv_parser instead (see read_export_table);
+they go through the same schema and give the same rows. Either kind can also
+be gzip, xz or zip compressed; it is decompressed while it is parsed (see
+export_files.open_export).
 """
 
-from bs4 import BeautifulSoup
+import io
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+
+from export_files import is_compressed, open_export
 
 # Position constants
 PITCHER_POSITIONS = {"P", "SP", "RP", "CL"}
 BATTER_POSITIONS = {"C", "1B", "2B", "3B", "SS", "LF", "CF", "RF", "DH"}
 
+# Parser backends, in order of preference for "auto"
+PARSER_BACKENDS = ("lxml", "stream", "bs4")
+DEFAULT_BACKEND = "auto"
+
+# Bytes fed to the streaming parser per read
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Row-chunked multiprocess reading (see read_html_table_parallel)
+PARALLEL_BACKEND = "parallel"
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024  # "auto" uses it for exports at least this big
+PARALLEL_CHUNKS_PER_WORKER = 2  # Extra chunks keep every core busy when rows vary in size
+
+# Bump whenever parsing output changes; invalidates snapshot caches (see snapshot_cache)
+PARSER_VERSION = 2
 
-def parse_players_from_html(html_path):
+
+def available_backends():
+    """Return the parser backends that can run in this environment, fastest first."""
+    backends = []
+    for name in PARSER_BACKENDS:
+        if name == "lxml":
+            try:
+                import lxml.html  # noqa: F401
+            except ImportError:
+                continue
+        elif name == "bs4":
+            try:
+                import bs4  # noqa: F401
+            except ImportError:
+                continue
+        backends.append(name)
+    return backends
+
+
+def resolve_backend(backend=DEFAULT_BACKEND):
     """
-    Parse players from an OOTP HTML export file.
+    Map a backend name to a concrete backend that can run here.
     
-    Args:
-        html_path: Path to the HTML file (e.g., "Player List.html" or "Free Agents.html")
+    "auto" picks the fastest available backend. Asking for lxml when it is not
+    installed falls back to the streaming parser, which is always available.
+    """
+    backend = (backend or DEFAULT_BACKEND).lower()
+    if backend == "auto":
+        return available_backends()[0]
+    if backend == PARALLEL_BACKEND:
+        return backend
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend '{backend}'. "
+            f"Choose from: auto, {', '.join(PARSER_BACKENDS)}, {PARALLEL_BACKEND}"
+        )
+    if backend not in available_backends():
+        return "stream"
+    return backend
+
+
+class _DataTableParser(HTMLParser):
+    """
+    Streaming state machine that extracts the first table.data from an OOTP export.
     
-    Returns:
-        List of player dictionaries with all columns from the HTML table
+    Mirrors what the BeautifulSoup path sees: cell text is every text node in the
+    cell stripped and joined, and rows are tagged with whether they sit in the
+    <thead> or the first <tbody> so the same header/body rules can be applied.
+    Parsing stops as soon as the data table is closed.
     """
-    with open(html_path, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f, "html.parser")
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.found = False
+        self.done = False
+        self.saw_thead = False
+        self.saw_tbody = False
+        self.rows = []  # (in_thead, in_first_tbody, th_cells, td_cells)
+        self._table_depth = 0
+        self._in_thead = False
+        self._in_first_tbody = False
+        self._row = None
+        self._cell = None
+        self._text = []
+    
+    def _flush_text(self):
+        if self._text:
+            text = "".join(self._text).strip()
+            self._text = []
+            if text and self._cell is not None:
+                self._cell[1].append(text)
+    
+    def _close_cell(self):
+        if self._cell is not None:
+            tag, parts = self._cell
+            self._cell = None
+            if self._row is not None:
+                self._row[2 if tag == "th" else 3].append("".join(parts))
+    
+    def _close_row(self):
+        self._close_cell()
+        if self._row is not None:
+            self.rows.append(self._row)
+            self._row = None
+    
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        self._flush_text()
+        if not self.found:
+            if tag == "table":
+                for name, value in attrs:
+                    if name == "class" and value and "data" in value.split():
+                        self.found = True
+                        self._table_depth = 1
+                        break
+            return
+        if tag in ("td", "th"):
+            self._close_cell()
+            if self._row is None:
+                self._row = (self._in_thead, self._in_first_tbody, [], [])
+            self._cell = (tag, [])
+        elif tag == "tr":
+            self._close_row()
+            self._row = (self._in_thead, self._in_first_tbody, [], [])
+        elif tag == "thead":
+            self.saw_thead = True
+            self._in_thead = True
+        elif tag == "tbody":
+            self._in_first_tbody = not self.saw_tbody
+            self.saw_tbody = True
+        elif tag == "table":
+            self._table_depth += 1
+    
+    def handle_endtag(self, tag):
+        if self.done or not self.found:
+            return
+        self._flush_text()
+        if tag in ("td", "th"):
+            self._close_cell()
+        elif tag == "tr":
+            self._close_row()
+        elif tag == "thead":
+            self._close_row()
+            self._in_thead = False
+        elif tag == "tbody":
+            self._close_row()
+            self._in_first_tbody = False
+        elif tag == "table":
+            self._table_depth -= 1
+            if self._table_depth == 0:
+                self._close_row()
+                self.done = True
+    
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._text.append(data)
+    
+    def handle_comment(self, data):
+        # Comments split text nodes, exactly like they do for BeautifulSoup
+        self._flush_text()
+    
+    def close(self):
+        super().close()
+        self._flush_text()
+        self._close_row()
+
+
+def _read_table_stream(html_path):
+    parser = _DataTableParser()
+    with open_export(html_path) as raw:
+        f = io.TextIOWrapper(raw, encoding='utf-8')
+        while not parser.done:
+            chunk = f.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    parser.close()
+    return _stream_table(parser, html_path)
+
+
+def _stream_table(parser, html_path):
+    if not parser.found:
+        raise ValueError(f"No table with class 'data' found in {html_path}")
+    
+    rows = parser.rows
+    if parser.saw_thead:
+        header_rows = [row for row in rows if row[0]]
+        header_row = header_rows[0] if header_rows else None
+    else:
+        header_row = rows[0] if rows else None
+    if header_row is None:
+        raise ValueError(f"No header row found in the table in {html_path}.")
+    
+    if parser.saw_tbody:
+        body_rows = [row[3] for row in rows if row[1]]
+    else:
+        body_rows = [row[3] for row in rows[1:]]
+    return header_row[2], body_rows
+
+
+def _lxml_cell_text(cell):
+    if not len(cell):
+        # Plain text cell, the common case in OOTP exports
+        return (cell.text or "").strip()
+    return "".join(text.strip() for text in cell.itertext())
+
+
+def _read_table_lxml(html_path):
+    from lxml import html as lxml_html
+    
+    parser = lxml_html.HTMLParser(encoding="utf-8", huge_tree=True)
+    if is_compressed(html_path):
+        # lxml pulls from the decompressing stream in small blocks
+        with open_export(html_path) as f:
+            tree = lxml_html.parse(f, parser)
+    else:
+        tree = lxml_html.parse(html_path, parser)
+    tables = tree.xpath('//table[contains(concat(" ", normalize-space(@class), " "), " data ")]')
+    if not tables:
+        raise ValueError(f"No table with class 'data' found in {html_path}")
+    table = tables[0]
+    
+    thead = table.find(".//thead")
+    if thead is not None:
+        header_row = thead.find(".//tr")
+    else:
+        header_row = table.find(".//tr")
+    if header_row is None:
+        raise ValueError(f"No header row found in the table in {html_path}.")
+    headers = [_lxml_cell_text(th) for th in header_row.iter("th")]
+    
+    tbody = table.find(".//tbody")
+    if tbody is not None:
+        rows = list(tbody.iter("tr"))
+    else:
+        rows = list(table.iter("tr"))[1:]
+    return headers, [[_lxml_cell_text(td) for td in row.iter("td")] for row in rows]
+
+
+def _read_table_bs4(html_path):
+    from bs4 import BeautifulSoup
+    
+    with open_export(html_path) as raw:
+        soup = BeautifulSoup(io.TextIOWrapper(raw, encoding='utf-8'), "html.parser")
     
     table = soup.find("table", class_="data")
     if not table:
@@ -39,21 +289,6 @@ def parse_players_from_html(html_path):
     
     headers = [th.get_text(strip=True) for th in header_row.find_all("th")]
     
-    # Handle duplicate header names by checking context
-    # WAR appears twice: once for batters (after wRC+) and once for pitchers (after ERA+)
-    processed_headers = []
-    for i, header in enumerate(headers):
-        if header == "WAR":
-            # Check previous headers to determine which WAR this is
-            if i > 0 and headers[i-1] == "wRC+":
-                processed_headers.append("WAR (Batter)")
-            elif i > 0 and headers[i-1] == "ERA+":
-                processed_headers.append("WAR (Pitcher)")
-            else:
-                processed_headers.append(header)
-        else:
-            processed_headers.append(header)
-    
     # Data rows
     tbody = table.find("tbody")
     if tbody:
@@ -61,15 +296,213 @@ def parse_players_from_html(html_path):
     else:
         rows = table.find_all("tr")[1:]  # skip header row
     
-    players = []
-    for row in rows:
-        cells = row.find_all("td")
-        if len(cells) != len(processed_headers):
-            continue  # skip junk
-        player_data = {processed_headers[i]: cells[i].get_text(strip=True) for i in range(len(processed_headers))}
-        players.append(player_data)
+    return headers, [[td.get_text(strip=True) for td in row.find_all("td")] for row in rows]
+
+
+_TABLE_READERS = {
+    "stream": _read_table_stream,
+    "lxml": _read_table_lxml,
+    "bs4": _read_table_bs4,
+}
+
+# <table> whose class attribute has "data" as one of its whitespace-separated
+# names (not data-grid, no-data, ...), quoted or not
+_DATA_TABLE_RE = re.compile(
+    rb'<table\b[^>]*\sclass\s*=\s*(?:'
+    rb'"(?:[^"]*\s)?data(?:\s[^"]*)?"'
+    rb"|'(?:[^']*\s)?data(?:\s[^']*)?'"
+    rb'|data(?=[\s/>]))',
+    re.IGNORECASE
+)
+_TBODY_OPEN_RE = re.compile(rb'<tbody\b[^>]*>', re.IGNORECASE)
+_TBODY_CLOSE_RE = re.compile(rb'</tbody\s*>', re.IGNORECASE)
+_TABLE_TAG_RE = re.compile(rb'</?table\b', re.IGNORECASE)
+_ROW_START_RE = re.compile(rb'<tr\b', re.IGNORECASE)
+
+# Wrapper that turns a run of <tr> rows into a document every backend can read
+_CHUNK_PREFIX = '<table class="data"><tbody>'
+_CHUNK_SUFFIX = '</tbody></table>'
+
+
+def _body_row_chunks(data, chunks):
+    """
+    Find the first <tbody> of the data table and split it into row-aligned
+    byte ranges. Returns (header_end, ranges), or None when the layout is not
+    the plain one OOTP writes (no tbody, nested tables) and the export has to
+    be read in one piece.
+    """
+    table = _DATA_TABLE_RE.search(data)
+    if table is None:
+        return None
+    tbody = _TBODY_OPEN_RE.search(data, table.end())
+    if tbody is None:
+        return None
+    close = _TBODY_CLOSE_RE.search(data, tbody.end())
+    if close is None or _TABLE_TAG_RE.search(data, table.end(), close.start()) is not None:
+        return None
+    
+    start, end = tbody.end(), close.start()
+    step = max((end - start) // max(chunks, 1), 1)
+    bounds = [start]
+    while True:
+        row = _ROW_START_RE.search(data, min(bounds[-1] + step, end), end)
+        if row is None or row.start() >= end:
+            break
+        bounds.append(row.start())
+    bounds.append(end)
+    return tbody.start(), list(zip(bounds[:-1], bounds[1:]))
+
+
+def _read_row_chunk(html_path, start, end, backend):
+    # Runs in a worker process: parse one row-aligned slice of the <tbody>
+    with open(html_path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+    fragment = _CHUNK_PREFIX + text + _CHUNK_SUFFIX
+    if backend == "lxml":
+        from lxml import html as lxml_html
+        parser = lxml_html.HTMLParser(encoding="utf-8", huge_tree=True)
+        root = lxml_html.document_fromstring(fragment.encode('utf-8'), parser)
+        tbody = root.find(".//tbody")
+        if tbody is None:
+            return []
+        return [[_lxml_cell_text(td) for td in row.iter("td")] for row in tbody.iter("tr")]
+    parser = _DataTableParser()
+    parser.feed(fragment)
+    parser.close()
+    return [row[3] for row in parser.rows if row[1]]
+
+
+def read_html_table_parallel(html_path, workers=None, backend=DEFAULT_BACKEND):
+    """
+    Read an export's table.data by parsing row chunks in worker processes.
+    
+    The header is read in-process; the first <tbody> is split into row-aligned
+    byte ranges (never inside a row, so multi-byte characters are never cut)
+    that workers parse with the given backend. Rows come back in file order and
+    are identical to read_html_table. Exports whose layout cannot be split are
+    read in one piece.
+    
+    Args:
+        html_path: Path to the HTML file
+        workers: Worker processes (defaults to the number of CPUs)
+        backend: Backend used on each chunk ("auto", "stream" or "lxml")
+    
+    Returns:
+        Tuple of (headers, rows), as read_html_table
+    """
+    backend = resolve_backend(backend)
+    if backend in (PARALLEL_BACKEND, "bs4"):
+        backend = resolve_backend("auto")
+    workers = workers or os.cpu_count() or 1
+    if is_compressed(html_path) or not os.path.getsize(html_path):
+        # Byte ranges only exist in an uncompressed file
+        return _TABLE_READERS[backend](html_path)
+    
+    with open(html_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            layout = _body_row_chunks(data, workers * PARALLEL_CHUNKS_PER_WORKER)
+            if layout is None:
+                return _TABLE_READERS[backend](html_path)
+            header_end, ranges = layout
+            head = data[:header_end].decode('utf-8')
+    
+    parser = _DataTableParser()
+    parser.feed(head + "</table>")
+    parser.close()
+    if not parser.saw_thead:
+        # Without a <thead> the header row sits among the body rows
+        return _TABLE_READERS[backend](html_path)
+    headers, _ = _stream_table(parser, html_path)
+    
+    rows = []
+    if workers < 2 or len(ranges) < 2:
+        for start, end in ranges:
+            rows.extend(_read_row_chunk(html_path, start, end, backend))
+        return headers, rows
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        futures = [pool.submit(_read_row_chunk, html_path, start, end, backend) for start, end in ranges]
+        for future in futures:
+            rows.extend(future.result())
+    return headers, rows
+
+
+def read_html_table(html_path, backend=DEFAULT_BACKEND):
+    """
+    Read the header and body cells of the table.data in an OOTP HTML export.
+    
+    Args:
+        html_path: Path to the HTML file (gzip, xz and zip files are decompressed as read)
+        backend: "auto", "stream", "lxml", "bs4" or "parallel"
+    
+    Returns:
+        Tuple of (headers, rows) where rows is a list of cell text lists.
+        Rows are returned as found; callers skip rows with the wrong cell count.
+    """
+    resolved = resolve_backend(backend)
+    if resolved == PARALLEL_BACKEND:
+        return read_html_table_parallel(html_path)
+    if ((backend or DEFAULT_BACKEND).lower() == "auto" and (os.cpu_count() or 1) > 1
+            and not is_compressed(html_path) and os.path.getsize(html_path) >= PARALLEL_MIN_BYTES):
+        return read_html_table_parallel(html_path, backend=resolved)
+    return _TABLE_READERS[resolved](html_path)
+
+
+def read_export_table(path, backend=DEFAULT_BACKEND):
+    """
+    Read the header and body cells of an OOTP export, HTML or CSV.
+    
+    Args:
+        path: Path to the export; CSV exports (compressed or not) are read with csv_parser
+        backend: HTML parser backend, ignored for CSV exports
+    
+    Returns:
+        Tuple of (headers, rows), as read_html_table
+    """
+    from csv_parser import is_csv_export, read_csv_table
+    
+    if is_csv_export(path):
+        return read_csv_table(path)
+    return read_html_table(path, backend)
+
+
+def parse_player_rows(html_path, backend=DEFAULT_BACKEND):
+    """
+    Read the player table of an OOTP export through its compiled schema.
+    
+    Duplicate headers (the batter and pitcher CON, CON P and WAR) are resolved
+    once per file (see export_schema) and rows with the wrong number of cells
+    are dropped.
+    
+    Args:
+        html_path: Path to the HTML (or CSV) export
+        backend: Parser backend ("auto", "stream", "lxml", "bs4" or "parallel")
+    
+    Returns:
+        Tuple of (schema, rows) where rows are tuples ordered like schema.columns
+    """
+    from export_schema import compile_schema
+    
+    headers, rows = read_export_table(html_path, backend)
+    schema = compile_schema(headers)
+    return schema, schema.project(rows)
+
+
+def parse_players_from_html(html_path, backend=DEFAULT_BACKEND):
+    """
+    Parse players from an OOTP HTML export file.
+    
+    Args:
+        html_path: Path to the HTML file (e.g., "Player List.html" or "Free Agents.html"),
+            or its CSV version
+        backend: Parser backend ("auto", "stream", "lxml", "bs4" or "parallel")
     
-    return players
+    Returns:
+        List of player dictionaries with all columns from the HTML table
+    """
+    schema, rows = parse_player_rows(html_path, backend)
+    columns = schema.columns
+    return [dict(zip(columns, row)) for row in rows]
 
 
 def split_players_by_type(players):
@@ -0,0 +1,189 @@
+# Load Pipeline Module
+# Parses the Player List, Team List and Free Agents exports concurrently.
+#
+# Parsing is CPU-bound, so threads would take turns on the GIL; exports that
+# need a real parse are handed to a process pool instead and parsed side by
+# side. Exports with a valid snapshot (see snapshot_cache) are read in-process,
+# which is faster than starting a worker. Results are joined in order: callers
+# take the players first and only then join the team and free-agent data, so
+# scoring can start while the smaller files are still being parsed.
+#
+# If worker processes cannot be started (restricted environments, broken pool)
+# every export is parsed in-process instead, exactly as before.
+#
+# Each export is read from its newest CSV, HTML or compressed version
+# (see export_files.find_export).
+#
+# Given a Progress token, a load reports one STAGE_READ step per export as it
+# becomes ready, and a cancel stops the wait for the worker processes.
+
+import os
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from export_files import find_export
+from html_parser import DEFAULT_BACKEND
+from player_table import PlayerTable
+from progress import OperationCancelled, STAGE_READ
+from snapshot_cache import cached_player_table, cached_teams, load_player_table_cached, load_teams_cached
+
+
+PLAYER_LIST_FILE = "Player List.html"
+TEAM_LIST_FILE = "Team List.html"
+FREE_AGENTS_FILE = "Free Agents.html"
+
+# Exports one load reads, and so the steps of its STAGE_READ
+EXPORT_COUNT = 3
+
+# How often a wait for a worker's parse checks for cancellation (seconds)
+CANCEL_POLL_S = 0.1
+
+
+def _parse_player_export(html_path, backend):
+    # Runs in a worker process; PlayerTable travels back as plain arrays
+    return load_player_table_cached(html_path, backend).to_arrays()
+
+
+def _parse_team_export(html_path, backend):
+    return load_teams_cached(html_path, backend)
+
+
+class ExportLoad:
+    """
+    One load of the league exports, parsed concurrently.
+    
+    Parsing starts as soon as the load is created; players(), teams() and
+    free_agents() block until their own export is ready. Use as a context
+    manager (or call close()) so the worker processes are released.
+    
+    Args:
+        player_path: Path to Player List.html
+        team_path: Path to Team List.html (optional export)
+        free_agents_path: Path to Free Agents.html (optional export)
+        backend: Parser backend used when an export has to be parsed
+        progress: Optional Progress token; the load starts STAGE_READ on it and
+            reports a step per export. Once it is cancelled, waiting for a
+            worker raises OperationCancelled and the workers are released
+            (an export parsed in-process finishes its parse first)
+    
+    Each path may also name a CSV or compressed export, and a newer CSV or
+    compressed version next to an HTML export is read in its place.
+    """
+    
+    def __init__(self, player_path=PLAYER_LIST_FILE, team_path=TEAM_LIST_FILE,
+                 free_agents_path=FREE_AGENTS_FILE, backend=DEFAULT_BACKEND, progress=None):
+        self.backend = backend
+        self.progress = progress
+        self._pool = None
+        self._jobs = {}
+        self._results = {}
+        if progress is not None:
+            progress.start_stage(STAGE_READ, EXPORT_COUNT)
+        
+        pending = {}
+        for name, path, kind in (("players", player_path, "players"),
+                                 ("teams", team_path, "teams"),
+                                 ("free_agents", free_agents_path, "players")):
+            path = find_export(path) if path else path
+            if name != "players" and (not path or not os.path.exists(path)):
+                self._results[name] = None
+                self._advance()
+                continue
+            cached = None
+            if os.path.exists(path):
+                cached = cached_player_table(path) if kind == "players" else cached_teams(path)
+            if cached is not None:
+                self._results[name] = cached
+                self._advance()
+            else:
+                pending[name] = (path, kind)
+        
+        # A single export parses just as fast in-process as in a worker
+        if len(pending) > 1:
+            self._pool = self._start_pool(len(pending))
+        for name, (path, kind) in pending.items():
+            func = _parse_player_export if kind == "players" else _parse_team_export
+            future = None
+            if self._pool is not None:
+                try:
+                    future = self._pool.submit(func, path, backend)
+                    future.add_done_callback(lambda _future: self._advance())
+                except Exception as e:
+                    print(f"Warning: Could not start parsing {path} in a worker process: {e}")
+            self._jobs[name] = (future, func, path, kind)
+    
+    @staticmethod
+    def _start_pool(workers):
+        workers = min(workers, os.cpu_count() or 1)
+        if workers < 2:
+            return None
+        try:
+            return ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError, ImportError) as e:
+            print(f"Warning: Parsing exports one at a time, worker processes unavailable: {e}")
+            return None
+    
+    def _advance(self):
+        # Safe from the pool's callback thread; ignored once reading is over
+        if self.progress is not None:
+            self.progress.advance(STAGE_READ)
+    
+    def _wait(self, future):
+        """future.result(), checking the progress token while it runs."""
+        if self.progress is None:
+            return future.result()
+        while True:
+            try:
+                return future.result(timeout=CANCEL_POLL_S)
+            except FuturesTimeoutError:
+                if self.progress.cancelled:
+                    self.close()
+                    raise OperationCancelled()
+    
+    def _result(self, name):
+        if name not in self._results:
+            if self.progress is not None:
+                self.progress.check()
+            future, func, path, kind = self._jobs.pop(name)
+            result = None
+            if future is not None:
+                try:
+                    result = self._wait(future)
+                    if kind == "players":
+                        result = PlayerTable.from_arrays(*result)
+                except (BrokenProcessPool, OSError) as e:
+                    print(f"Warning: Worker failed parsing {path}, parsing in-process: {e}")
+            if result is None:
+                load = load_player_table_cached if kind == "players" else load_teams_cached
+                result = load(path, self.backend)
+                if future is None:
+                    self._advance()
+            self._results[name] = result
+        return self._results[name]
+    
+    def players(self):
+        """PlayerTable for Player List.html. Parse errors are raised here."""
+        return self._result("players")
+    
+    def teams(self):
+        """List of team dicts from Team List.html, or None when it does not exist."""
+        return self._result("teams")
+    
+    def free_agents(self):
+        """PlayerTable for Free Agents.html, or None when it does not exist."""
+        return self._result("free_agents")
+    
+    def close(self):
+        """Release the worker processes; unfinished parses are cancelled."""
+        if self._pool is not None:
+            for future, _func, _path, _kind in self._jobs.values():
+                if future is not None:
+                    future.cancel()
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
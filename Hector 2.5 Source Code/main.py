@@ -1,6 +1,10 @@
-from gui.core import build_gui
+import multiprocessing
 
 if __name__ == "__main__":
+    # Exports are parsed in worker processes; required for the frozen Windows build
+    multiprocessing.freeze_support()
+    # Imported here so worker processes don't load the GUI
+    from gui.core import build_gui
     try:
         build_gui()
     except Exception as e:
@@ -1,7 +1,11 @@
 # Percentile Rankings Calculator
 # Calculates league-wide percentiles for player metrics
 
+import numpy as np
+
 from player_utils import parse_star_rating
+from player_table import column_values, column_mask
+from progress import STAGE_PERCENTILES, track
 
 # Percentile Tier Definitions
 PERCENTILE_TIERS = {
@@ -68,6 +72,20 @@ def get_metric_value(player, metric_config):
     return parse_star_rating(val)
 
 
+def get_metric_values(players, metric_config):
+    """Get the values for a metric for a list of players, as a NumPy array"""
+    key = metric_config.get("key", "")
+    fallback = metric_config.get("fallback", "")
+    
+    values = column_values(players, key)
+    if fallback:
+        missing = column_mask(players, key)
+        if missing.any():
+            values = np.where(missing, column_values(players, fallback), values)
+    
+    return values
+
+
 def calculate_percentile(value, all_values, inverse=False):
     """
     Calculate the percentile rank for a value within a distribution.
@@ -127,30 +145,32 @@ class PercentileCalculator:
         self.pitcher_distributions = {}  # metric -> list of values
         self._cache_valid = False
     
-    def build_distributions(self, batters, pitchers):
+    def build_distributions(self, batters, pitchers, progress=None):
         """
         Build distributions for all metrics from player data.
         Call this once after loading data.
+        
+        Args:
+            batters: Batter rows
+            pitchers: Pitcher rows
+            progress: Optional Progress token; reports one step per metric
         """
+        if progress is not None:
+            progress.start_stage(STAGE_PERCENTILES, len(BATTER_METRICS) + len(PITCHER_METRICS))
+        
         # Build batter distributions
         self.batter_distributions = {}
-        for metric_name, config in BATTER_METRICS.items():
-            values = []
-            for batter in batters:
-                val = get_metric_value(batter, config)
-                if val != 0:  # Only include non-zero values
-                    values.append(val)
-            self.batter_distributions[metric_name] = sorted(values)
+        for metric_name, config in track(BATTER_METRICS.items(), progress):
+            values = get_metric_values(batters, config)
+            # Only include non-zero values
+            self.batter_distributions[metric_name] = np.sort(values[values != 0]).tolist()
         
         # Build pitcher distributions
         self.pitcher_distributions = {}
-        for metric_name, config in PITCHER_METRICS.items():
-            values = []
-            for pitcher in pitchers:
-                val = get_metric_value(pitcher, config)
-                if val != 0:  # Only include non-zero values
-                    values.append(val)
-            self.pitcher_distributions[metric_name] = sorted(values)
+        for metric_name, config in track(PITCHER_METRICS.items(), progress):
+            values = get_metric_values(pitchers, config)
+            # Only include non-zero values
+            self.pitcher_distributions[metric_name] = np.sort(values[values != 0]).tolist()
         
         self._cache_valid = True
     
@@ -285,3 +305,16 @@ def initialize_percentiles(batters, pitchers):
     calc = get_percentile_calculator()
     calc.build_distributions(batters, pitchers)
     return calc
+
+
+def build_percentiles(batters, pitchers, progress=None):
+    """Build percentile distributions in a new calculator, leaving the global one in use"""
+    calc = PercentileCalculator()
+    calc.build_distributions(batters, pitchers, progress)
+    return calc
+
+
+def set_percentile_calculator(calc):
+    """Replace the global percentile calculator (e.g., with one from build_percentiles)"""
+    global _percentile_calculator
+    _percentile_calculator = calc
@@ -2,6 +2,44 @@ import sys
 import importlib.util
 from pathlib import Path 
 
+import numpy as np
+
+from field_types import get_number, typed_value
+from player_table import column_matrix, column_values, common_table
+from stat_scores import calculate_stat_scores, stat_score_pairs
+from weights import on_weights_changed
+
+
+# Pitch rating columns and their pitch_arsenal weights
+PITCH_KEY_MAP = {
+    "FB": "Fastball", "CH": "Changeup", "CB": "Curveball", "SL": "Slider", "SI": "Sinker",
+    "SP": "Splitter", "CT": "Cutter", "FO": "Forkball", "CC": "Circle Change",
+    "SC": "Screwball", "KC": "Knuckle Curve", "KN": "Knuckleball"
+}
+
+# Pitch potential columns; their pitch_arsenal_potential weight is the name in snake case
+PITCH_POTENTIAL_KEY_MAP = {
+    "FBP": "Fastball Potential", "CHP": "Changeup Potential", "CBP": "Curveball Potential",
+    "SLP": "Slider Potential", "SIP": "Sinker Potential", "SPP": "Splitter Potential",
+    "CTP": "Cutter Potential", "FOP": "Forkball Potential", "CCP": "Circle Change Potential",
+    "SCP": "Screwball Potential", "KCP": "Knuckle Curve Potential", "KNP": "Knuckleball Potential"
+}
+
+# Other rating columns and their weight names
+PITCHER_HEADER_WEIGHTS = {
+    'STU': 'stuff', 'MOV': 'movement', 'CON': 'control',
+    'STU P': 'stuff_potential', 'MOV P': 'movement_potential', 'CON P': 'control_potential',
+    'PIT': 'number_of_pitches', 'VELO': 'velocity', 'STM': 'stamina',
+    'G/F': 'ground_fly_ratio', 'HLD': 'holds', 'SctAcc': 'scout_accuracy'
+}
+
+CORE_WEIGHTS = ("stuff", "movement", "control", "overall_rating")
+CORE_POTENTIAL_WEIGHTS = ("stuff_potential", "movement_potential", "control_potential", "potential_rating")
+
+# Score sections, with the section_weights (and meta) entry each one uses
+PITCHER_SECTIONS = ("core_attributes", "core_potentials", "pitch_arsenal", "pitch_arsenal_potential",
+                    "other_attributes")
+
 
 def parse_stat_value(val):
     """Parse a stat value from HTML export, handling various formats"""
@@ -28,7 +66,7 @@ def calculate_pitcher_stat_score(player, stat_weights_module):
     min_ip = getattr(stat_weights_module, 'MIN_INNINGS_PITCHED', 20)
     
     # Check sample size - use IP (innings pitched)
-    ip = parse_stat_value(player.get("IP", 0))
+    ip = get_number(player, "IP", 0)
     has_sufficient_sample = ip >= min_ip
     
     if not has_sufficient_sample:
@@ -50,7 +88,7 @@ def calculate_pitcher_stat_score(player, stat_weights_module):
         if applies_to is not None and pos not in applies_to:
             continue
             
-        raw_value = parse_stat_value(player.get(stat_name, 0))
+        raw_value = get_number(player, stat_name, 0)
         
         # Apply scale factor if present
         scale_factor = config.get("scale_factor", 1.0)
@@ -73,6 +111,17 @@ def calculate_pitcher_stat_score(player, stat_weights_module):
     return round(stat_score, 2), True
 
 
+def calculate_pitcher_stat_scores(pitchers, stat_weights_module):
+    """
+    calculate_pitcher_stat_score of every pitcher at once (see stat_scores).
+    
+    Returns:
+        Tuple of (stat_score, used_stats) arrays over pitchers
+    """
+    min_ip = getattr(stat_weights_module, 'MIN_INNINGS_PITCHED', 20)
+    return calculate_stat_scores(pitchers, stat_weights_module, "IP", min_ip, position_stats=True)
+
+
 def calculate_score(player, section_weights, use_stats=False, stat_weights_module=None):
     total_core = 0
     total_core_potential = 0
@@ -80,39 +129,6 @@ def calculate_score(player, section_weights, use_stats=False, stat_weights_modul
     total_pitch_potential = 0
     total_other = 0
     penalties = 0
-    pitch_key_map_actual = {
-        "FB": "Fastball", "CH": "Changeup", "CB": "Curveball", "SL": "Slider", "SI": "Sinker",
-        "SP": "Splitter", "CT": "Cutter", "FO": "Forkball", "CC": "Circle Change",
-        "SC": "Screwball", "KC": "Knuckle Curve", "KN": "Knuckleball"
-    }
-    pitch_key_map_potential = {
-        "FBP": "Fastball Potential", "CHP": "Changeup Potential", "CBP": "Curveball Potential",
-        "SLP": "Slider Potential", "SIP": "Sinker Potential", "SPP": "Splitter Potential",
-        "CTP": "Cutter Potential", "FOP": "Forkball Potential", "CCP": "Circle Change Potential",
-        "SCP": "Screwball Potential", "KCP": "Knuckle Curve Potential", "KNP": "Knuckleball Potential"
-    }
-
-    def parse_value(raw_value):
-        raw_value = str(raw_value).strip()
-        if "Stars" in raw_value:
-            try: return float(raw_value.split()[0])
-            except Exception: return 0
-        elif "-" in raw_value and raw_value != "-" and not raw_value.startswith("-"):
-            parts = [p.strip() for p in raw_value.replace("mph", "").split("-")]
-            nums = []
-            for p in parts:
-                try: nums.append(float(p))
-                except Exception: pass
-            return sum(nums) / len(nums) if nums else 0
-        elif raw_value == "-" or raw_value == "":
-            return 0
-        else:
-            import re
-            match = re.search(r"\d+(\.\d+)?", raw_value)
-            if match:
-                return float(match.group(0))
-            else:
-                return 0
 
     meta = section_weights.get("meta", {})
     meta_core = meta.get("core_attributes", 1.0)
@@ -123,33 +139,27 @@ def calculate_score(player, section_weights, use_stats=False, stat_weights_modul
     meta_penalties = meta.get("penalties", 1.0)
 
     pitch_values = []
-    for header, value in player.items():
-        val = parse_value(value)
-        if header in pitch_key_map_actual:
-            key = pitch_key_map_actual[header]
+    for header in player:
+        # Typed value parsed once at load (velocity ranges averaged, stars as numbers)
+        val = get_number(player, header)
+        if header in PITCH_KEY_MAP:
+            key = PITCH_KEY_MAP[header]
             weight = section_weights["pitch_arsenal"].get(key, 0)
             total_pitch_arsenal += val * weight * meta_pitch
             if val > 0:
                 pitch_values.append(val)
-        elif header in pitch_key_map_potential:
-            key = pitch_key_map_potential[header]
+        elif header in PITCH_POTENTIAL_KEY_MAP:
+            key = PITCH_POTENTIAL_KEY_MAP[header]
             weight_key = key.lower().replace(" ", "_")
             weight = section_weights["pitch_arsenal_potential"].get(weight_key, 0)
             total_pitch_potential += val * weight * meta_pitch_potential
         else:
-            header_to_weight = {
-                'STU': 'stuff', 'MOV': 'movement', 'CON': 'control',
-                'STU P': 'stuff_potential', 'MOV P': 'movement_potential', 'CON P': 'control_potential',
-                'PIT': 'number_of_pitches', 'VELO': 'velocity', 'STM': 'stamina',
-                'G/F': 'ground_fly_ratio', 'HLD': 'holds', 'SctAcc': 'scout_accuracy'
-            }
-
-            weight_key = header_to_weight.get(header)
+            weight_key = PITCHER_HEADER_WEIGHTS.get(header)
             if weight_key:
-                if weight_key in ["stuff", "movement", "control", "overall_rating"]:
+                if weight_key in CORE_WEIGHTS:
                     weight = section_weights["core_attributes"].get(weight_key, 0)
                     total_core += val * weight * meta_core
-                elif weight_key in ["stuff_potential", "movement_potential", "control_potential", "potential_rating"]:
+                elif weight_key in CORE_POTENTIAL_WEIGHTS:
                     weight_key_norm = weight_key.lower().replace(" ", "_")
                     weight = section_weights["core_potentials"].get(weight_key_norm, 0)
                     total_core_potential += val * weight * meta_core_potential
@@ -163,7 +173,7 @@ def calculate_score(player, section_weights, use_stats=False, stat_weights_modul
                 penalties += section_weights["penalties"].get("penalty_sp_low_pitches", 0)
             if int(player.get("STM", 0)) < 50:
                 penalties += section_weights["penalties"].get("penalty_sp_low_stamina", 0)
-            control_potential = parse_value(player.get("CON P", 0))
+            control_potential = get_number(player, "CON P", 0)
             if control_potential < 50:
                 penalties += section_weights["penalties"].get("penalty_sp_low_control_potential", 0)
     except Exception:
@@ -194,6 +204,249 @@ def calculate_score(player, section_weights, use_stats=False, stat_weights_modul
         'stat_score': stat_score,  # None if not calculated or insufficient sample
         'used_stats': used_stats   # True if stat-based scoring was used
     }
+
+
+def _int_cell(val):
+    """int() of a cell as the SP penalty checks read it, NaN where int() fails."""
+    try:
+        return int(val)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+class PitcherScoreModel:
+    """
+    section_weights compiled for scoring a whole pitcher table at once.
+    
+    Each rating column of the table gets its section and its weight once, and
+    is read once for all pitchers. Column products are added per section in
+    the table's column order, which is the order calculate_score visits a
+    row's headers, so the scores are identical to the last bit. The SP
+    penalties and the no-pitch-above-50 penalty become boolean masks over
+    all pitchers.
+    
+    Pitchers that are not rows of one PlayerTable (plain dicts, mixed tables)
+    have no shared column order and are scored one at a time with
+    calculate_score.
+    
+    The meta multipliers are read on every call, and can be replaced for one
+    call (Draft Mode) without touching section_weights. Scoring is split in
+    two: components() reads the ratings into per-column products (rating x
+    weight) and the penalties, and combine() applies the meta multipliers and
+    adds them up. The products are kept per column rather than per section
+    because calculate_score multiplies every product by its section's
+    multiplier before adding it; that keeps any recombination exact.
+    
+    Args:
+        section_weights: pitcher_weights.section_weights; each table layout's
+            column weights are looked up once, so build a new model (see
+            get_pitcher_score_model) after changing anything but meta
+    """
+    
+    def __init__(self, section_weights):
+        self.section_weights = section_weights
+        self._plans = {}  # table columns -> [(header, section, weight)] of the scored ones
+    
+    def multipliers(self, meta=None):
+        """
+        Meta multiplier of every PITCHER_SECTIONS entry, then of the penalties,
+        from meta or else section_weights['meta'].
+        """
+        if meta is None:
+            meta = self.section_weights.get("meta", {})
+        return (
+            meta.get("core_attributes", 1.0),
+            meta.get("core_potentials", 1.0),
+            meta.get("pitch_arsenal", 1.0),
+            meta.get("pitch_arsenal_potential", 1.0),
+            meta.get("other_attributes", 1.0),
+            meta.get("penalties", 1.0),
+        )
+    
+    def column_weight(self, header):
+        """(index into PITCHER_SECTIONS, weight) a column is scored with, or None."""
+        weights = self.section_weights
+        if header in PITCH_KEY_MAP:
+            return 2, weights["pitch_arsenal"].get(PITCH_KEY_MAP[header], 0)
+        if header in PITCH_POTENTIAL_KEY_MAP:
+            weight_key = PITCH_POTENTIAL_KEY_MAP[header].lower().replace(" ", "_")
+            return 3, weights["pitch_arsenal_potential"].get(weight_key, 0)
+        weight_key = PITCHER_HEADER_WEIGHTS.get(header)
+        if not weight_key:
+            return None
+        if weight_key in CORE_WEIGHTS:
+            return 0, weights["core_attributes"].get(weight_key, 0)
+        if weight_key in CORE_POTENTIAL_WEIGHTS:
+            return 1, weights["core_potentials"].get(weight_key.lower().replace(" ", "_"), 0)
+        return 4, weights["other_attributes"].get(weight_key, 0)
+    
+    def column_plan(self, columns):
+        """(header, section, weight) of every scored column, in the order of columns."""
+        key = tuple(columns)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = []
+            for header in columns:
+                found = self.column_weight(header)
+                if found is not None:
+                    plan.append((header,) + found)
+            self._plans[key] = plan
+        return plan
+    
+    def penalties(self, pitchers, pitch_values):
+        """Penalty of every pitcher (before the penalties meta multiplier)."""
+        starters = column_values(pitchers, "POS", str.upper, "", object) == "SP"
+        pitches = column_values(pitchers, "PIT", _int_cell, 0)
+        stamina = column_values(pitchers, "STM", _int_cell, 0)
+        control_potential = column_values(pitchers, "CON P", typed_value, 0)
+        
+        # A PIT or STM cell int() can't read skips the SP checks after it, as in calculate_score
+        reads_pitches = starters & ~np.isnan(pitches)
+        reads_stamina = reads_pitches & ~np.isnan(stamina)
+        if pitch_values.shape[1]:
+            no_pitch_50 = (pitch_values > 0).any(axis=1) & (pitch_values.max(axis=1) < 50)
+        else:
+            no_pitch_50 = np.zeros(len(pitchers), dtype=bool)
+        
+        penalties = np.zeros(len(pitchers), dtype=np.float64)
+        for mask, weight_key in (
+                (reads_pitches & (pitches < 4), "penalty_sp_low_pitches"),
+                (reads_stamina & (stamina < 50), "penalty_sp_low_stamina"),
+                (reads_stamina & (control_potential < 50), "penalty_sp_low_control_potential"),
+                (no_pitch_50, "no_pitch_50_plus")):
+            if mask.any():
+                penalties[mask] += self.section_weights["penalties"].get(weight_key, 0)
+        return penalties
+    
+    def components(self, pitchers):
+        """
+        Every pitcher's rating x weight products and penalties, before the
+        meta multipliers.
+        
+        Returns:
+            Tuple of (section of each product column, (len(pitchers), products
+            + 1) float array with the penalties as its last column)
+        """
+        table = common_table(pitchers)
+        if table is not None:
+            columns = table.columns
+        else:
+            # Plain dicts from one export share their key order; use the first one's
+            columns = list(pitchers[0]) if pitchers else []
+        scored = self.column_plan(columns)
+        values = column_matrix(pitchers, [header for header, _s, _w in scored], typed_value, 0)
+        products = values * np.array([weight for _h, _s, weight in scored], dtype=np.float64)
+        pitch_columns = [j for j, (header, _s, _w) in enumerate(scored) if header in PITCH_KEY_MAP]
+        penalties = self.penalties(pitchers, values[:, pitch_columns])
+        sections = [section for _h, section, _w in scored]
+        return sections, np.column_stack([products, penalties])
+    
+    def stat_results(self, pitchers, stat_weights_module):
+        """(stat_score, used_stats) of every pitcher, see calculate_pitcher_stat_score."""
+        return stat_score_pairs(*calculate_pitcher_stat_scores(pitchers, stat_weights_module))
+    
+    def combine(self, pitchers, components, meta=None, stat_results=None):
+        """
+        Score dicts from components(pitchers), cheap enough to redo for every
+        Draft/Stats mode change.
+        
+        Args:
+            pitchers: The pitchers components was calculated for
+            components: Result of components(pitchers)
+            meta: Meta multipliers to use instead of section_weights['meta']
+            stat_results: stat_results(pitchers, ...) for Stats Mode, or None
+        
+        Returns:
+            List of score dicts, in the order of pitchers
+        """
+        sections, matrix = components
+        multipliers = self.multipliers(meta)
+        scores = np.zeros((len(pitchers), len(PITCHER_SECTIONS)), dtype=np.float64)
+        for j, section in enumerate(sections):
+            scores[:, section] += matrix[:, j] * multipliers[section]
+        penalties = matrix[:, -1] * multipliers[-1]
+        return self._score_dicts(pitchers, scores, penalties, stat_results)
+    
+    def score(self, pitchers, use_stats=False, stat_weights_module=None, meta=None):
+        """
+        Scores of every pitcher, the same dicts calculate_score returns.
+        
+        Args:
+            pitchers: List of pitcher rows (PlayerRows of one table are read by column)
+            use_stats: Use the stat score as the total for pitchers with enough innings
+            stat_weights_module: pitcher_stat_weights module, required with use_stats
+            meta: Meta multipliers to use instead of section_weights['meta']
+        
+        Returns:
+            List of score dicts, in the order of pitchers
+        """
+        if not pitchers:
+            return []
+        if common_table(pitchers) is None:
+            section_weights = self.section_weights if meta is None else dict(self.section_weights, meta=meta)
+            return [calculate_score(p, section_weights, use_stats, stat_weights_module) for p in pitchers]
+        stat_results = None
+        if use_stats and stat_weights_module is not None:
+            stat_results = self.stat_results(pitchers, stat_weights_module)
+        return self.combine(pitchers, self.components(pitchers), meta, stat_results)
+    
+    def _score_dicts(self, pitchers, scores, penalties, stat_results):
+        core, core_potential, pitch_arsenal, pitch_potential, other = scores.T
+        other = other + penalties
+        total = core + (pitch_potential + core_potential) + pitch_arsenal + other
+        current = core + pitch_arsenal + other
+        if stat_results is None:
+            stat_results = [(None, False)] * len(pitchers)
+        
+        results = []
+        for player_total, arsenal, arsenal_potential, potential, current_total, (stat_score, used_stats) in zip(
+                total.tolist(), pitch_arsenal.tolist(), pitch_potential.tolist(),
+                core_potential.tolist(), current.tolist(), stat_results):
+            if used_stats and stat_score is not None:
+                player_total = stat_score
+            results.append({
+                'total': round(player_total, 2),
+                'pitches': round(arsenal, 2),
+                'pitches_potential': round(arsenal_potential, 2),
+                'core_potential': round(potential, 2),
+                'curr_total': round(current_total, 2),
+                'stat_score': stat_score,
+                'used_stats': used_stats
+            })
+        return results
+
+
+# Compiled models of the section_weights in use: id(section_weights) -> model
+_score_models = {}
+
+
+def get_pitcher_score_model(section_weights):
+    """The PitcherScoreModel of section_weights, compiled on first use."""
+    model = _score_models.get(id(section_weights))
+    if model is None or model.section_weights is not section_weights:
+        model = _score_models[id(section_weights)] = PitcherScoreModel(section_weights)
+    return model
+
+
+def _drop_score_models(module_name, module):
+    if module_name == "pitcher_weights":
+        _score_models.clear()
+
+
+on_weights_changed(_drop_score_models)
+
+
+def calculate_scores(pitchers, section_weights, use_stats=False, stat_weights_module=None, meta=None):
+    """
+    calculate_score for a whole list of pitchers at once (see PitcherScoreModel).
+    
+    Args:
+        meta: Meta multipliers to use instead of section_weights['meta']
+    
+    Returns:
+        List of score dicts, in the order of pitchers
+    """
+    return get_pitcher_score_model(section_weights).score(pitchers, use_stats, stat_weights_module, meta)
 # No file loader needed!
 
 
@@ -228,9 +481,9 @@ def calculate_park_adjusted_pitcher_score(player, team_data):
     """
     if not team_data:
         # No team data available, return neutral adjustments
-        stuff_raw = parse_stat_value(player.get("STU", 0))
-        movement_raw = parse_stat_value(player.get("MOV", 0))
-        control_raw = parse_stat_value(player.get("CON", 0))
+        stuff_raw = get_number(player, "STU", 0)
+        movement_raw = get_number(player, "MOV", 0)
+        control_raw = get_number(player, "CON", 0)
         
         return {
             "stuff_raw": stuff_raw,
@@ -256,9 +509,9 @@ def calculate_park_adjusted_pitcher_score(player, team_data):
         pf_hr = 1.0
     
     # Get raw pitching ratings
-    stuff_raw = parse_stat_value(player.get("STU", 0))
-    movement_raw = parse_stat_value(player.get("MOV", 0))
-    control_raw = parse_stat_value(player.get("CON", 0))
+    stuff_raw = get_number(player, "STU", 0)
+    movement_raw = get_number(player, "MOV", 0)
+    control_raw = get_number(player, "CON", 0)
     
     # Calculate adjusted scores using park factor directly
     # Higher park factor = tougher for pitchers = boost their adjusted score
@@ -341,7 +594,7 @@ def get_pitcher_park_impact_preview(player, current_team_data, new_team_data):
     
     # Estimate HR allowed change
     # Get pitcher's stuff rating to estimate HR susceptibility
-    stuff_raw = parse_stat_value(player.get("STU", 0))
+    stuff_raw = get_number(player, "STU", 0)
     base_hr_estimate = max(0, 30 - (stuff_raw / 3))  # Lower stuff = more HRs
     hr_change = base_hr_estimate * (hr_ratio - 1)
     
@@ -0,0 +1,715 @@
+# Player Table Module
+# Columnar store for a parsed OOTP player export.
+#
+# The export is parsed once into one array per column instead of one dict of
+# ~95 strings per player. Numeric columns that round-trip exactly are kept as
+# float arrays, low-cardinality text (ORG, POS, B, T, Prone, ...) as small
+# integer codes into a category list, and only free text such as names stays
+# in object arrays. PlayerRow gives every player a dict-compatible view over
+# the table so existing tabs keep working, while hot paths read whole columns
+# through column_values() / column_mask().
+
+import sys
+from collections.abc import Mapping, MutableMapping
+
+import numpy as np
+
+from html_parser import parse_player_rows, DEFAULT_BACKEND
+from field_types import parse_cell, typed_value
+from player_utils import parse_star_rating
+
+
+# Columns always stored as categorical codes
+CATEGORICAL_COLUMNS = ("ORG", "POS", "TM", "B", "T", "Prone")
+
+# Columns always stored as plain object arrays
+TEXT_COLUMNS = ("Name",)
+
+# Other text columns with at most this many distinct values become categorical too
+MAX_AUTO_CATEGORIES = 255
+
+# Cell values that mean "no data" in OOTP exports
+MISSING_VALUES = ("", "-")
+
+_DELETED = object()
+
+
+def _is_missing(val):
+    return not val or val == "-"
+
+
+def _exact_number(cells):
+    """
+    Try to store a column of cells as floats without losing the original text.
+    
+    Returns (values, fmt, missing_token) when every non-missing cell is a
+    canonical int ("65") or a canonical float ("0.245") and the column uses a
+    single missing token, otherwise None.
+    """
+    missing_token = None
+    fmt = None
+    values = np.empty(len(cells), dtype=np.float64)
+    for i, cell in enumerate(cells):
+        if cell in MISSING_VALUES:
+            if missing_token is None:
+                missing_token = cell
+            elif cell != missing_token:
+                return None
+            values[i] = np.nan
+            continue
+        try:
+            val = float(cell)
+        except ValueError:
+            return None
+        if val != val or val in (float("inf"), float("-inf")) or (val == 0 and cell.startswith("-")):
+            return None
+        if fmt != "float" and val.is_integer() and str(int(val)) == cell:
+            fmt = fmt or "int"
+        elif fmt != "int" and repr(val) == cell:
+            fmt = "float"
+        else:
+            return None
+        values[i] = val
+    if fmt is None:
+        return None
+    return values, fmt, missing_token if missing_token is not None else ""
+
+
+class PlayerTable:
+    """
+    Column-oriented storage for every player in one export.
+    
+    Build it once per load with PlayerTable.from_rows() and hand rows() to the
+    tabs. rows() always returns the same PlayerRow objects, so anything the
+    app attaches to a player (Scores, advanced_stats, ...) stays with it.
+    """
+    
+    def __init__(self, columns, size):
+        self.columns = list(columns)
+        self._column_set = frozenset(self.columns)
+        self._size = size
+        self._kind = {}          # column -> "category" | "number" | "text"
+        self._codes = {}         # category columns: integer codes
+        self._categories = {}    # category columns: list of distinct strings
+        self._numbers = {}       # number columns: float64 values, NaN when missing
+        self._formats = {}       # number columns: (fmt, missing_token)
+        self._text = {}          # text columns: object array of strings
+        self._getters = {}       # column -> callable(index) returning the cell text
+        self._factorized = {}    # column -> (codes, uniques) for non-category columns
+        self._parsed = {}        # (column, parser) -> array of parsed values
+        self._typed_cells = {}   # column -> array of TypedCell
+        self._typed_numbers = {} # column -> float64 array of typed values
+        self._overridden = set() # columns written through a PlayerRow
+        self._rows = None
+    
+    @classmethod
+    def from_rows(cls, headers, rows):
+        """
+        Build a table from parsed export cells.
+        
+        Args:
+            headers: Column names in export order (duplicates keep the last
+                cell, like building a dict per row would)
+            rows: List of cell lists; rows with the wrong cell count are skipped
+        
+        Returns:
+            PlayerTable
+        """
+        positions = {}
+        for i, header in enumerate(headers):
+            positions[header] = i
+        width = len(headers)
+        rows = [cells for cells in rows if len(cells) == width]
+        
+        table = cls(positions.keys(), len(rows))
+        for name, pos in positions.items():
+            table._add_column(name, [cells[pos] for cells in rows])
+        table.normalize()
+        return table
+    
+    @classmethod
+    def from_schema(cls, schema, rows):
+        """
+        Build a table from rows projected through an export schema.
+        
+        Args:
+            schema: ExportSchema of the export (see export_schema)
+            rows: Tuples ordered like schema.columns
+        
+        Returns:
+            PlayerTable
+        """
+        table = cls(schema.columns, len(rows))
+        if rows:
+            for name, cells in zip(schema.columns, zip(*rows)):
+                table._add_column(name, cells)
+        else:
+            for name in schema.columns:
+                table._add_column(name, ())
+        table.normalize()
+        return table
+    
+    @classmethod
+    def from_dicts(cls, players):
+        """Build a table from a list of player dicts (e.g. an older parse)."""
+        headers = []
+        seen = set()
+        for player in players:
+            for key in player:
+                if key not in seen:
+                    seen.add(key)
+                    headers.append(key)
+        rows = [[str(player.get(key, "")) for key in headers] for player in players]
+        return cls.from_rows(headers, rows)
+    
+    def _add_column(self, name, cells):
+        if name in TEXT_COLUMNS:
+            self._set_text(name, cells)
+            return
+        if name not in CATEGORICAL_COLUMNS:
+            exact = _exact_number(cells)
+            if exact is not None:
+                values, fmt, missing_token = exact
+                self._set_number(name, values, fmt, missing_token)
+                return
+        lookup = {}
+        for cell in cells:
+            if cell not in lookup:
+                lookup[cell] = len(lookup)
+                if name not in CATEGORICAL_COLUMNS and len(lookup) > MAX_AUTO_CATEGORIES:
+                    self._set_text(name, cells)
+                    return
+        categories = list(lookup)
+        dtype = np.min_scalar_type(max(len(categories) - 1, 0))
+        codes = np.fromiter((lookup[cell] for cell in cells), dtype=dtype, count=len(cells))
+        self._set_category(name, codes, categories)
+    
+    def _set_category(self, name, codes, categories):
+        self._kind[name] = "category"
+        self._codes[name] = codes
+        self._categories[name] = categories
+        self._getters[name] = lambda i, codes=codes, cats=categories: cats[codes[i]]
+    
+    def _set_text(self, name, cells):
+        values = np.empty(len(cells), dtype=object)
+        values[:] = [sys.intern(cell) for cell in cells]
+        self._kind[name] = "text"
+        self._text[name] = values
+        self._getters[name] = values.item
+    
+    def _set_number(self, name, values, fmt, missing_token):
+        self._kind[name] = "number"
+        self._numbers[name] = values
+        self._formats[name] = (fmt, missing_token)
+        as_text = repr if fmt == "float" else (lambda v: str(int(v)))
+        cache = {}
+        
+        def getter(i):
+            val = values.item(i)
+            if val != val:
+                return missing_token
+            text = cache.get(val)
+            if text is None:
+                text = cache[val] = as_text(val)
+            return text
+        
+        self._getters[name] = getter
+    
+    def to_arrays(self):
+        """
+        Flatten the table into JSON-safe metadata plus three plain NumPy arrays
+        (number values, codes and typed values, one row per column), so it can
+        be stored without pickle (see snapshot_cache).
+        
+        Returns:
+            Tuple of (meta, arrays)
+        """
+        columns = []
+        values, codes, typed = [], [], []
+        for name in self.columns:
+            kind = self._kind[name]
+            column = {"name": name, "kind": kind}
+            if kind == "number":
+                column["fmt"], column["missing"] = self._formats[name]
+                column["row"] = len(values)
+                values.append(self._numbers[name])
+            else:
+                column_codes, uniques = self.factorize(name)
+                column["values"] = list(uniques)
+                column["row"] = len(codes)
+                codes.append(column_codes)
+            if name in self._typed_numbers:
+                column["typed_row"] = len(typed)
+                typed.append(self._typed_numbers[name])
+            columns.append(column)
+        
+        def stack(rows, dtype):
+            if not rows:
+                return np.empty((0, self._size), dtype=dtype)
+            return np.stack([np.asarray(row, dtype=dtype) for row in rows])
+        
+        arrays = {
+            "values": stack(values, np.float64),
+            "codes": stack(codes, np.int32),
+            "typed": stack(typed, np.float64),
+        }
+        return {"size": self._size, "columns": columns}, arrays
+    
+    @classmethod
+    def from_arrays(cls, meta, arrays):
+        """Rebuild a table written by to_arrays()."""
+        columns = meta["columns"]
+        values, codes, typed = arrays["values"], arrays["codes"], arrays["typed"]
+        table = cls([column["name"] for column in columns], meta["size"])
+        for column in columns:
+            name = column["name"]
+            if column["kind"] == "number":
+                table._set_number(name, values[column["row"]], column["fmt"], column["missing"])
+            elif column["kind"] == "category":
+                categories = column["values"]
+                dtype = np.min_scalar_type(max(len(categories) - 1, 0))
+                table._set_category(name, codes[column["row"]].astype(dtype), categories)
+            else:
+                uniques = [sys.intern(val) for val in column["values"]]
+                table._set_text(name, [uniques[code] for code in codes[column["row"]].tolist()])
+            if "typed_row" in column:
+                table._typed_numbers[name] = typed[column["typed_row"]]
+        return table
+    
+    def __len__(self):
+        return self._size
+    
+    def __contains__(self, name):
+        return name in self._column_set
+    
+    def kind(self, name):
+        """Storage kind of a column: "category", "number", "text" or None."""
+        return self._kind.get(name)
+    
+    def cell(self, name, index):
+        """Original cell text for one player."""
+        return self._getters[name](index)
+    
+    def row(self, index):
+        return self.rows()[index]
+    
+    def rows(self):
+        """Dict-compatible views of every player, created once and reused."""
+        if self._rows is None:
+            self._rows = [PlayerRow(self, i) for i in range(self._size)]
+        return self._rows
+    
+    def numbers(self, name):
+        """Float values of a number column (NaN where the cell was blank or "-")."""
+        return self._numbers[name]
+    
+    def codes(self, name):
+        """Integer codes and category list of a categorical column."""
+        return self._codes[name], self._categories[name]
+    
+    def factorize(self, name):
+        """
+        Return (codes, uniques) for any column: every cell is uniques[codes[i]].
+        
+        Categorical columns return their stored codes; other columns are
+        factorized once and cached.
+        """
+        if name in self._codes:
+            return self._codes[name], self._categories[name]
+        cached = self._factorized.get(name)
+        if cached is None:
+            if name in self._numbers:
+                values, codes = np.unique(self._numbers[name], return_inverse=True)
+                fmt, missing_token = self._formats[name]
+                as_text = repr if fmt == "float" else (lambda v: str(int(v)))
+                uniques = [missing_token if v != v else as_text(v) for v in values.tolist()]
+            else:
+                uniques, codes = np.unique(self._text[name], return_inverse=True)
+                uniques = uniques.tolist()
+            cached = self._factorized[name] = (codes.reshape(-1), uniques)
+        return cached
+    
+    def parsed(self, name, parser=parse_star_rating, dtype=np.float64):
+        """
+        Apply parser to every cell of a column and return the results as an array.
+        
+        The parser runs once per distinct cell value, not once per player, and
+        the result is cached per (column, parser) for the lifetime of the table.
+        """
+        key = (name, parser, np.dtype(dtype))
+        cached = self._parsed.get(key)
+        if cached is None:
+            codes, uniques = self.factorize(name)
+            lookup = np.empty(len(uniques), dtype=dtype)
+            for i, val in enumerate(uniques):
+                lookup[i] = parser(val)
+            cached = self._parsed[key] = lookup[codes] if len(uniques) else np.empty(0, dtype=dtype)
+        return cached
+    
+    def typed_cells(self, name):
+        """TypedCell (kind, value, status) of every cell in a column, see field_types."""
+        cached = self._typed_cells.get(name)
+        if cached is None:
+            cached = self._typed_cells[name] = self.parsed(name, parse_cell, object)
+        return cached
+    
+    def typed_numbers(self, name):
+        """Typed numeric value of every cell in a column, see field_types."""
+        cached = self._typed_numbers.get(name)
+        if cached is None:
+            cached = self._typed_numbers[name] = self.parsed(name, typed_value)
+        return cached
+    
+    def normalize(self):
+        """
+        Convert every non-text column to typed values once, at load time, so
+        scoring code reads numbers instead of re-parsing cell strings.
+        """
+        for name in self.columns:
+            if name not in TEXT_COLUMNS:
+                self.typed_cells(name)
+                self.typed_numbers(name)
+    
+    def index_of(self, players):
+        """
+        Row indexes for a list of players, or None when any of them is not an
+        untouched PlayerRow of this table.
+        """
+        idx = np.empty(len(players), dtype=np.intp)
+        for i, player in enumerate(players):
+            if type(player) is not PlayerRow or player.table is not self:
+                return None
+            idx[i] = player.index
+        return idx
+
+
+class PlayerRow(MutableMapping):
+    """
+    Dict-compatible view of one player in a PlayerTable.
+    
+    Reads come from the table's columns; anything written to the row (Scores,
+    advanced_stats, edited cells) lives in a small per-row overlay. copy()
+    returns a plain dict, like dict.copy() would.
+    
+    cache holds values derived from the row's cells (e.g. archetype fits). It
+    is not part of the mapping and is cleared whenever a cell is overwritten.
+    """
+    
+    __slots__ = ("table", "index", "_extra", "cache")
+    
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+        self._extra = {}
+        self.cache = {}
+    
+    def __getitem__(self, key):
+        extra = self._extra
+        if key in extra:
+            val = extra[key]
+            if val is _DELETED:
+                raise KeyError(key)
+            return val
+        getter = self.table._getters.get(key)
+        if getter is None:
+            raise KeyError(key)
+        return getter(self.index)
+    
+    def get(self, key, default=None):
+        extra = self._extra
+        if key in extra:
+            val = extra[key]
+            return default if val is _DELETED else val
+        getter = self.table._getters.get(key)
+        if getter is None:
+            return default
+        return getter(self.index)
+    
+    def typed_cell(self, key, default=None):
+        """TypedCell of one field; default is parsed when the field is absent."""
+        if key in self._extra or key not in self.table._column_set:
+            return parse_cell(self.get(key, default))
+        return self.table.typed_cells(key).item(self.index)
+    
+    def typed_number(self, key, default=0):
+        """Typed numeric value of one field; default is parsed when the field is absent."""
+        if key in self._extra or key not in self.table._column_set:
+            return typed_value(self.get(key, default))
+        return self.table.typed_numbers(key).item(self.index)
+    
+    def __contains__(self, key):
+        val = self._extra.get(key)
+        if val is not None:
+            return val is not _DELETED
+        return key in self._extra or key in self.table._column_set
+    
+    def __setitem__(self, key, value):
+        if key in self.table._column_set:
+            self.table._overridden.add(key)
+            self.cache.clear()
+        self._extra[key] = value
+    
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if key in self.table._column_set:
+            self.table._overridden.add(key)
+            self.cache.clear()
+            self._extra[key] = _DELETED
+        else:
+            del self._extra[key]
+    
+    def __iter__(self):
+        extra = self._extra
+        columns = self.table.columns
+        if not extra:
+            return iter(columns)
+        column_set = self.table._column_set
+        keys = [key for key in columns if extra.get(key) is not _DELETED]
+        # A snapshot of the added fields: background tasks copy rows (copy,
+        # items, dict(row)) while the main thread may be adding to them
+        keys.extend(key for key in list(extra) if key not in column_set)
+        return iter(keys)
+    
+    def __len__(self):
+        extra = self._extra
+        if not extra:
+            return len(self.table.columns)
+        return sum(1 for _ in self)
+    
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        for key, val in self.items():
+            if other.get(key, _DELETED) != val:
+                return False
+        return True
+    
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    __hash__ = None
+    
+    def copy(self):
+        return dict(self.items())
+    
+    def adopt(self, previous):
+        """
+        Take over what the app attached to the same player's row in a previous
+        load (Scores, advanced_stats, cached values). Overwritten cells are not
+        carried over, so the new export's data always wins.
+        """
+        column_set = self.table._column_set
+        # previous is still the row on screen, and the main thread may be
+        # adding to it while the loader thread adopts: iterate snapshots
+        for key, val in list(previous._extra.items()):
+            if key not in column_set:
+                self._extra[key] = val
+        self.cache.update(previous.cache.copy())
+    
+    __copy__ = copy
+    
+    def __deepcopy__(self, memo):
+        import copy
+        return copy.deepcopy(self.copy(), memo)
+    
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+    
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class Changeset:
+    """
+    What changed between two loads of the same export, matched by player ID.
+    
+    Attributes:
+        inserted: Rows of the new table whose ID was not in the previous one
+        removed: Rows of the previous table whose ID is gone
+        changed: Rows of the new table whose cells differ from the previous load
+        unchanged: (previous_row, new_row) pairs with identical cells
+    
+    Tabs use rescore / affects() to recompute derived data only where needed.
+    """
+    
+    def __init__(self, inserted, removed, changed, unchanged):
+        self.inserted = inserted
+        self.removed = removed
+        self.changed = changed
+        self.unchanged = unchanged
+        self._dirty = {id(row) for row in inserted}
+        self._dirty.update(id(row) for row in changed)
+    
+    @property
+    def rescore(self):
+        """New rows that need their derived data recomputed."""
+        return self.inserted + self.changed
+    
+    def affects(self, player):
+        """True when player is an inserted or changed row of the new load."""
+        return id(player) in self._dirty
+    
+    def select(self, players):
+        """The inserted or changed players from a list, in list order."""
+        return [player for player in players if id(player) in self._dirty]
+    
+    def carry_over(self):
+        """Move Scores, advanced stats and cached values onto unchanged rows."""
+        for previous, row in self.unchanged:
+            row.adopt(previous)
+    
+    def __bool__(self):
+        return bool(self.inserted or self.removed or self.changed)
+    
+    def __repr__(self):
+        return (f"Changeset(inserted={len(self.inserted)}, removed={len(self.removed)}, "
+                f"changed={len(self.changed)}, unchanged={len(self.unchanged)})")
+
+
+def _cells(table, name, index):
+    codes, uniques = table.factorize(name)
+    lookup = np.empty(len(uniques), dtype=object)
+    lookup[:] = uniques
+    return lookup[codes[index]] if len(uniques) else np.empty(0, dtype=object)
+
+
+def diff_tables(previous, table, key="ID"):
+    """
+    Compare two loads of an export row by row, matching players by ID.
+    
+    Args:
+        previous: PlayerTable from the previous load (or None)
+        table: PlayerTable from the new load
+        key: Column that identifies a player
+    
+    Returns:
+        Changeset, or None when the loads cannot be compared (no previous
+        load, different columns, missing or duplicate IDs) and everything
+        has to be rebuilt
+    """
+    if previous is None or table is None or previous.columns != table.columns or key not in table:
+        return None
+    old_ids = [previous.cell(key, i) for i in range(len(previous))]
+    new_ids = [table.cell(key, i) for i in range(len(table))]
+    old_positions = {pid: i for i, pid in enumerate(old_ids)}
+    if len(old_positions) != len(old_ids) or len(set(new_ids)) != len(new_ids):
+        return None
+    
+    old_index, new_index, inserted = [], [], []
+    for j, pid in enumerate(new_ids):
+        i = old_positions.pop(pid, None)
+        if i is None:
+            inserted.append(j)
+        else:
+            old_index.append(i)
+            new_index.append(j)
+    old_index = np.array(old_index, dtype=np.intp)
+    new_index = np.array(new_index, dtype=np.intp)
+    
+    differs = np.zeros(len(new_index), dtype=bool)
+    for name in table.columns:
+        if (previous.kind(name) == "number" and table.kind(name) == "number"
+                and previous._formats[name] == table._formats[name]):
+            a = previous.numbers(name)[old_index]
+            b = table.numbers(name)[new_index]
+            differs |= ~((a == b) | (np.isnan(a) & np.isnan(b)))
+        else:
+            differs |= _cells(previous, name, old_index) != _cells(table, name, new_index)
+    
+    old_rows = previous.rows()
+    new_rows = table.rows()
+    changed = [new_rows[j] for j in new_index[differs].tolist()]
+    unchanged = [(old_rows[i], new_rows[j])
+                 for i, j in zip(old_index[~differs].tolist(), new_index[~differs].tolist())]
+    return Changeset(
+        inserted=[new_rows[j] for j in inserted],
+        removed=[old_rows[i] for i in sorted(old_positions.values())],
+        changed=changed,
+        unchanged=unchanged,
+    )
+
+
+def load_player_table(html_path, backend=DEFAULT_BACKEND):
+    """
+    Parse an OOTP player export straight into a PlayerTable.
+    
+    Args:
+        html_path: Path to the HTML file (e.g., "Player List.html" or "Free Agents.html")
+        backend: Parser backend ("auto", "stream", "lxml", "bs4" or "parallel")
+    
+    Returns:
+        PlayerTable
+    """
+    schema, rows = parse_player_rows(html_path, backend)
+    return PlayerTable.from_schema(schema, rows)
+
+
+def common_table(players):
+    """The PlayerTable every player is a row of, or None (dict players, mixed tables)."""
+    table, _idx = _table_and_index(players, None)
+    return table
+
+
+def _table_and_index(players, key):
+    if not players:
+        return None, None
+    first = players[0]
+    if type(first) is not PlayerRow:
+        return None, None
+    table = first.table
+    if key in table._overridden:
+        return None, None
+    idx = table.index_of(players)
+    if idx is None:
+        return None, None
+    return table, idx
+
+
+def column_values(players, key, parser=parse_star_rating, default="", dtype=np.float64):
+    """
+    Parsed values of one field for a list of players, as a NumPy array.
+    
+    Equivalent to np.array([parser(p.get(key, default)) for p in players]) but
+    reads straight from the PlayerTable when the players are rows of one.
+    """
+    table, idx = _table_and_index(players, key)
+    if table is not None:
+        if key in table:
+            return table.parsed(key, parser, dtype)[idx]
+        return np.full(len(idx), parser(default), dtype=dtype)
+    return np.array([parser(p.get(key, default)) for p in players], dtype=dtype)
+
+
+def column_matrix(players, keys, parser=parse_star_rating, default="", dtype=np.float64):
+    """
+    column_values of several fields as the columns of one 2-D array, with the
+    players matched to their table rows once rather than once per field.
+    
+    Returns:
+        (len(players), len(keys)) array
+    """
+    table, idx = _table_and_index(players, None)
+    matrix = np.empty((len(players), len(keys)), dtype=dtype)
+    for j, key in enumerate(keys):
+        if table is None or key in table._overridden:
+            matrix[:, j] = [parser(p.get(key, default)) for p in players]
+        elif key in table:
+            matrix[:, j] = table.parsed(key, parser, dtype)[idx]
+        else:
+            matrix[:, j] = parser(default)
+    return matrix
+
+
+def column_mask(players, key, predicate=_is_missing, default=""):
+    """
+    Boolean array of predicate(p.get(key, default)) for a list of players.
+    
+    The default predicate flags blank and "-" cells.
+    """
+    return column_values(players, key, predicate, default, dtype=bool)
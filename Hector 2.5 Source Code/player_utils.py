@@ -1,7 +1,7 @@
 # Shared utility functions for player analytics
 # Common functions used across percentiles, hidden_gems, archetypes, and roster_builder
 
-from trade_value import parse_number
+from field_types import get_number
 
 
 # Rating scale detection threshold
@@ -69,8 +69,8 @@ def get_war(player, player_type="batter"):
     Returns WAR as float, 0.0 if not available.
     """
     if player_type == "pitcher":
-        return parse_number(player.get("WAR (Pitcher)", player.get("WAR", 0)))
-    return parse_number(player.get("WAR (Batter)", player.get("WAR", 0)))
+        return get_number(player, "WAR (Pitcher)", player.get("WAR", 0))
+    return get_number(player, "WAR (Batter)", player.get("WAR", 0))
 
 
 def normalize_rating(ovr):
@@ -136,8 +136,8 @@ def apply_scouting_uncertainty(player, uncertainty_level=0.1):
     """
     import random
     
-    pot = parse_star_rating(player.get("POT", "0"))
-    ovr = parse_star_rating(player.get("OVR", "0"))
+    pot = get_number(player, "POT", "0")
+    ovr = get_number(player, "OVR", "0")
     age = get_age(player)
     
     if pot <= 0:
@@ -176,12 +176,12 @@ def get_games_played(player, player_type="batter"):
     """
     if player_type == "pitcher":
         # For pitchers, check G (games) or GS (games started)
-        g = parse_number(player.get("G", 0))
+        g = get_number(player, "G", 0)
         if g > 0:
             return int(g)
-        return int(parse_number(player.get("GS", 0)))
+        return int(get_number(player, "GS", 0))
     else:
-        return int(parse_number(player.get("G", 0)))
+        return int(get_number(player, "G", 0))
 
 
 def get_innings_pitched(player):
@@ -194,4 +194,4 @@ def get_innings_pitched(player):
     Returns:
         IP as float, 0.0 if not available
     """
-    return parse_number(player.get("IP", 0))
+    return get_number(player, "IP", 0)
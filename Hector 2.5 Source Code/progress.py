@@ -0,0 +1,144 @@
+# Progress Module
+# Progress reporting and cooperative cancellation for long operations
+# (loading exports, scoring, percentiles, advanced stats, roster generation).
+#
+# The code doing the work gets a Progress token and reports stages and steps
+# on it; whoever started the work (usually the GUI, on another thread) reads
+# status() to draw a progress bar and calls cancel() to stop it. Cancellation
+# is cooperative: the next step reported after cancel() raises
+# OperationCancelled, so work stops at a clean point and nothing is killed.
+#
+# Functions take progress=None and use a throwaway token when none is given,
+# so callers that don't care are unaffected.
+
+import threading
+
+
+# Stage names shared by the modules reporting them and the GUI weighting them
+STAGE_READ = "Reading exports"
+STAGE_SCORE = "Scoring players"
+STAGE_PERCENTILES = "Building percentiles"
+STAGE_TEAMS = "Loading teams and free agents"
+STAGE_ADVANCED_STATS = "Calculating advanced stats"
+STAGE_ROSTERS = "Generating rosters"
+
+
+class OperationCancelled(Exception):
+    """Raised inside an operation whose Progress token was cancelled."""
+
+
+class Progress:
+    """
+    Progress and cancellation token for one operation.
+    
+    An operation is a sequence of stages, each with a relative weight (its
+    rough share of the running time) and, once started, a number of steps.
+    Overall progress is the weighted share of finished stages plus the
+    finished fraction of the current one.
+    
+    Safe to share between threads: the worker reports, any thread reads
+    status() and calls cancel().
+    
+    Args:
+        stages: Sequence of (stage name, weight); stages not listed weigh 1
+    """
+    
+    def __init__(self, stages=()):
+        self._weights = dict(stages)
+        self._total_weight = sum(self._weights.values()) or 1
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._finished_weight = 0
+        self._stage = None
+        self._steps = 0
+        self._done = 0
+    
+    def start_stage(self, name, steps=0):
+        """
+        Finish the current stage and start the next.
+        
+        Args:
+            name: Stage name, as given in stages
+            steps: Number of steps the stage reports (0 when it reports none)
+        """
+        self.check()
+        with self._lock:
+            self._finish_current()
+            self._stage = name
+            self._steps = steps
+            self._done = 0
+    
+    def step(self, count=1):
+        """Report finished steps of the current stage; raises OperationCancelled after cancel()."""
+        self.check()
+        with self._lock:
+            self._done = min(self._done + count, self._steps) if self._steps else 0
+    
+    def advance(self, stage, count=1):
+        """
+        Report finished steps of stage from any thread (e.g. a future's done
+        callback). Ignored once another stage has started; never raises, the
+        thread doing the work still calls check().
+        """
+        with self._lock:
+            if self._stage == stage and self._steps:
+                self._done = min(self._done + count, self._steps)
+    
+    def finish(self):
+        """Mark the current stage (and with it the operation, if last) finished."""
+        with self._lock:
+            self._finish_current()
+            self._stage = None
+    
+    def cancel(self):
+        """Ask the operation to stop at its next reported step."""
+        self._cancelled.set()
+    
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+    
+    def check(self):
+        """Raise OperationCancelled if cancel() was called."""
+        if self._cancelled.is_set():
+            raise OperationCancelled()
+    
+    def status(self):
+        """
+        Current progress.
+        
+        Returns:
+            Tuple of (stage name or None, overall fraction 0..1)
+        """
+        with self._lock:
+            weight = self._weights.get(self._stage, 1) if self._stage is not None else 0
+            current = weight * self._done / self._steps if self._steps else 0
+            return self._stage, min(1.0, (self._finished_weight + current) / self._total_weight)
+    
+    def _finish_current(self):
+        if self._stage is not None:
+            self._finished_weight += self._weights.get(self._stage, 1)
+
+
+def track(items, progress=None, stage=None):
+    """
+    Iterate over items, reporting one step per item on progress.
+    
+    Args:
+        items: Sized iterable (list, dict, ...)
+        progress: Progress token, or None to iterate without reporting
+        stage: Start this stage (with len(items) steps) first; None to report
+            steps on the current stage
+    
+    Raises:
+        OperationCancelled: Before the next item once progress is cancelled
+    """
+    if progress is None:
+        yield from items
+        return
+    if stage is not None:
+        progress.start_stage(stage, len(items))
+    for item in items:
+        progress.check()
+        yield item
+        progress.step()
@@ -3,10 +3,10 @@
 
 import random
 
-from trade_value import parse_number, parse_salary, parse_years_left
+from field_types import get_number, get_salary, get_years_left
 from archetypes import get_best_archetype, ARCHETYPES
 from player_utils import (
-    parse_star_rating, get_age, get_war, normalize_rating, STAR_TO_RATING_SCALE,
+    get_age, get_war, normalize_rating, STAR_TO_RATING_SCALE,
     normalize_to_100, apply_scouting_uncertainty, get_games_played, get_innings_pitched
 )
 from philosophy_profiles import (
@@ -16,6 +16,7 @@ from philosophy_profiles import (
 from batter_stat_weights import stat_weights as batter_stat_weights, normalization as batter_normalization, MIN_PLATE_APPEARANCES
 from pitcher_stat_weights import stat_weights as pitcher_stat_weights, normalization as pitcher_normalization, MIN_INNINGS_PITCHED
 from advanced_stats import get_advanced_stats_score
+from progress import Progress, STAGE_ROSTERS, track
 
 
 # Roster slot definitions
@@ -346,7 +347,7 @@ class RosterBuilder:
             total_war += war
             
             # Get salary
-            salary = parse_salary(player.get("SLR", 0))
+            salary = get_salary(player, "SLR", 0)
             total_salary += salary
             
             # Get age
@@ -354,7 +355,7 @@ class RosterBuilder:
             total_age += age
             
             # Get OVR
-            ovr = parse_star_rating(player.get("OVR", "0"))
+            ovr = get_number(player, "OVR", "0")
             total_ovr += ovr
             count += 1
             
@@ -516,7 +517,7 @@ class RosterBuilder:
     
     def auto_generate_roster(self, competitive_level="Middle of the pack", 
                               salary_tier="Mid-market", identity="Any", 
-                              expansion_mode="Off"):
+                              expansion_mode="Off", progress=None):
         """
         Auto-generate a complete roster using weighted random selection.
         
@@ -538,7 +539,14 @@ class RosterBuilder:
         
         When expansion_mode is not "Off", it overrides/modifies the standard
         weights to match the expansion archetype's strategy.
+        
+        progress (optional Progress token) gets one step per lineup slot and
+        per rotation, bullpen and bench fill; cancelling it raises
+        OperationCancelled and leaves the roster partly filled.
         """
+        if progress is None:
+            progress = Progress()
+        progress.start_stage(STAGE_ROSTERS, len(LINEUP_SLOTS) + 3)
         self.clear_roster()
         
         # Track used players to avoid duplicates
@@ -571,15 +579,19 @@ class RosterBuilder:
                 selected = random.choices(candidates, weights=weights, k=1)[0]
                 self.add_to_lineup(selected, pos)
                 used_players.add(selected.get("Name", ""))
+            progress.step()
         
         # Fill rotation
         self._fill_rotation_random(competitive_level, salary_tier, identity, used_players, expansion_config)
+        progress.step()
         
         # Fill bullpen
         self._fill_bullpen_random(competitive_level, salary_tier, identity, used_players, expansion_config)
+        progress.step()
         
         # Fill bench
         self._fill_bench_random(competitive_level, salary_tier, identity, used_players, expansion_config)
+        progress.step()
     
     def _get_position_candidates(self, position, count, player_type, used_players,
                                   competitive_level="Middle of the pack", salary_tier="Mid-market"):
@@ -633,23 +645,23 @@ class RosterBuilder:
             # Sort by age (ascending) first, then by potential (descending)
             candidates.sort(key=lambda p: (
                 get_age(p),  # Younger first
-                -parse_star_rating(p.get("POT", "0"))  # Then high potential
+                -get_number(p, "POT", "0")  # Then high potential
             ))
         elif salary_tier == "Budget":
             # For budget: prioritize low salary players
             # Sort by salary (ascending), then by OVR (descending)
             candidates.sort(key=lambda p: (
-                parse_salary(p.get("SLR", 0)),  # Cheaper first
-                -parse_star_rating(p.get("OVR", "0"))  # Then high OVR within salary tier
+                get_salary(p, "SLR", 0),  # Cheaper first
+                -get_number(p, "OVR", "0")  # Then high OVR within salary tier
             ))
         elif competitive_level == "Contender" or salary_tier == "Big spender":
             # For contenders: prioritize high OVR players
-            candidates.sort(key=lambda p: parse_star_rating(p.get("OVR", "0")), reverse=True)
+            candidates.sort(key=lambda p: get_number(p, "OVR", "0"), reverse=True)
         else:
             # Middle of the pack: mix of OVR and value
             # Sort by a blend of OVR and age (prefer prime-age players)
             def middle_sort_key(p):
-                ovr = parse_star_rating(p.get("OVR", "0"))
+                ovr = get_number(p, "OVR", "0")
                 age = get_age(p)
                 # Prefer players aged 25-30 (prime years)
                 age_bonus = 0
@@ -686,12 +698,12 @@ class RosterBuilder:
             weight = 1.0
             
             # Get player attributes
-            ovr = parse_star_rating(player.get("OVR", "0"))
+            ovr = get_number(player, "OVR", "0")
             ovr_normalized = normalize_rating(ovr)
-            pot = parse_star_rating(player.get("POT", "0"))
+            pot = get_number(player, "POT", "0")
             pot_normalized = normalize_rating(pot)
             age = get_age(player)
-            salary = parse_salary(player.get("SLR", 0))
+            salary = get_salary(player, "SLR", 0)
             
             # Apply expansion archetype weights if active
             if expansion_config:
@@ -851,7 +863,7 @@ class RosterBuilder:
         
         # Pre-arb preference
         if config.get("prefer_pre_arb"):
-            yl_data = parse_years_left(player.get("YL", ""))
+            yl_data = get_years_left(player, "YL", "")
             status = yl_data.get("status", "unknown")
             if status == "pre_arb":
                 weight *= EXPANSION_PRE_ARB_WEIGHT
@@ -935,7 +947,7 @@ class RosterBuilder:
         # Find star candidates from all batters
         star_candidates = []
         for player in self._all_batters:
-            ovr = parse_star_rating(player.get("OVR", "0"))
+            ovr = get_number(player, "OVR", "0")
             ovr_normalized = normalize_rating(ovr)
             if ovr_normalized >= star_min_ovr:
                 star_candidates.append((ovr_normalized, player))
@@ -1070,7 +1082,7 @@ class RosterBuilder:
     # ========================================================================
     
     def auto_generate_roster_v2(self, philosophy="balanced", constraints=None,
-                                num_alternates=1, randomness=0.15):
+                                num_alternates=1, randomness=0.15, progress=None):
         """
         Generate roster(s) using philosophy-weighted optimization.
         
@@ -1079,9 +1091,14 @@ class RosterBuilder:
             constraints: Override constraints (budget, age limits, etc.)
             num_alternates: Number of alternate rosters to generate
             randomness: Noise factor (0-1) to introduce variety between runs
+            progress: Optional Progress token; one step per alternate, and
+                cancellation is checked for every player scored
         
         Returns:
             List of roster builds with scores and summaries
+        
+        Raises:
+            OperationCancelled: When progress is cancelled (no rosters are returned)
         """
         profile = get_philosophy_profile(philosophy)
         
@@ -1092,7 +1109,7 @@ class RosterBuilder:
         
         results = []
         
-        for i in range(num_alternates):
+        for i in track(range(num_alternates), progress, STAGE_ROSTERS):
             # Clear roster for each alternate
             self.clear_roster()
             
@@ -1101,10 +1118,10 @@ class RosterBuilder:
             
             # Score all players upfront
             batter_scores = self._score_all_players(
-                self._all_batters, "batter", profile, merged_constraints, randomness
+                self._all_batters, "batter", profile, merged_constraints, randomness, progress
             )
             pitcher_scores = self._score_all_players(
-                self._all_pitchers, "pitcher", profile, merged_constraints, randomness
+                self._all_pitchers, "pitcher", profile, merged_constraints, randomness, progress
             )
             
             # Fill lineup positions by selecting best available
@@ -1170,7 +1187,7 @@ class RosterBuilder:
         
         return results
     
-    def _score_all_players(self, players, player_type, profile, constraints, randomness):
+    def _score_all_players(self, players, player_type, profile, constraints, randomness, progress=None):
         """
         Score all players using composite scoring.
         
@@ -1179,6 +1196,9 @@ class RosterBuilder:
         scores = {}
         
         for player in players:
+            if progress is not None:
+                progress.check()
+            
             # Apply hard constraints first
             if not self._meets_constraints(player, player_type, constraints):
                 continue
@@ -1208,8 +1228,8 @@ class RosterBuilder:
             return True
         
         age = get_age(player)
-        salary = parse_salary(player.get("SLR", 0))
-        yl_data = parse_years_left(player.get("YL", ""))
+        salary = get_salary(player, "SLR", 0)
+        yl_data = get_years_left(player, "YL", "")
         status = yl_data.get("status", "unknown")
         
         # Max age constraint
@@ -1382,7 +1402,7 @@ class RosterBuilder:
             total_weight = 0
             
             # wRC+ (30% weight from batter_stat_weights)
-            wrc_plus = parse_number(player.get("wRC+", 100))
+            wrc_plus = get_number(player, "wRC+", 100)
             wrc_norm = batter_normalization.get("wRC+", {})
             wrc_score = normalize_to_100(
                 wrc_plus, 
@@ -1406,7 +1426,7 @@ class RosterBuilder:
             total_weight += weight
             
             # OPS+ (15% weight)
-            ops_plus = parse_number(player.get("OPS+", 100))
+            ops_plus = get_number(player, "OPS+", 100)
             ops_norm = batter_normalization.get("OPS+", {})
             ops_score = normalize_to_100(
                 ops_plus,
@@ -1434,7 +1454,7 @@ class RosterBuilder:
             total_weight = 0
             
             # ERA+ (30% weight)
-            era_plus = parse_number(player.get("ERA+", 100))
+            era_plus = get_number(player, "ERA+", 100)
             era_norm = pitcher_normalization.get("ERA+", {})
             era_score = normalize_to_100(
                 era_plus,
@@ -1469,7 +1489,7 @@ class RosterBuilder:
         
         Returns score 0-100.
         """
-        ovr = parse_star_rating(player.get("OVR", "0"))
+        ovr = get_number(player, "OVR", "0")
         ovr_normalized = normalize_rating(ovr)
         
         # Map 20-80 scale to 0-100
@@ -1484,8 +1504,8 @@ class RosterBuilder:
         
         Returns score 0-100.
         """
-        pot = parse_star_rating(player.get("POT", "0"))
-        ovr = parse_star_rating(player.get("OVR", "0"))
+        pot = get_number(player, "POT", "0")
+        ovr = get_number(player, "OVR", "0")
         
         pot_normalized = normalize_rating(pot)
         ovr_normalized = normalize_rating(ovr)
@@ -1510,7 +1530,7 @@ class RosterBuilder:
         Returns score 0-100.
         """
         war = get_war(player, player_type)
-        salary = parse_salary(player.get("SLR", 0))
+        salary = get_salary(player, "SLR", 0)
         
         # Handle edge cases
         if salary <= 0:
@@ -1532,7 +1552,7 @@ class RosterBuilder:
         score = normalize_to_100(war_per_million, -0.5, 2.0)
         
         # Bonus for pre-arb/arb status
-        yl_data = parse_years_left(player.get("YL", ""))
+        yl_data = get_years_left(player, "YL", "")
         status = yl_data.get("status", "unknown")
         
         if status == "pre_arb":
@@ -1640,8 +1660,8 @@ def calculate_trade_availability(player, player_type="batter"):
     score = 5  # Start at middle
     
     # Trade value component
-    ovr = parse_star_rating(player.get("OVR", "0"))
-    pot = parse_star_rating(player.get("POT", "0"))
+    ovr = get_number(player, "OVR", "0")
+    pot = get_number(player, "POT", "0")
     
     # Normalize OVR and POT to 20-80 scale using shared utility
     ovr = normalize_rating(ovr)
@@ -1660,7 +1680,7 @@ def calculate_trade_availability(player, player_type="batter"):
         score -= 1
     
     # Contract component
-    yl_data = parse_years_left(player.get("YL", ""))
+    yl_data = get_years_left(player, "YL", "")
     years_left = yl_data.get("years", 1)
     status = yl_data.get("status", "unknown")
     
@@ -1742,7 +1762,7 @@ def find_trade_targets_by_position(batters, pitchers, position, min_ovr=None, ma
         elif position != "RP" and pos != position:
             continue
         
-        ovr = parse_star_rating(player.get("OVR", "0"))
+        ovr = get_number(player, "OVR", "0")
         age = get_age(player)
         
         # Apply filters
@@ -1770,11 +1790,11 @@ def find_trade_targets_by_position(batters, pitchers, position, min_ovr=None, ma
             "pos": pos,
             "age": age,
             "ovr": ovr,
-            "pot": parse_star_rating(player.get("POT", "0")),
+            "pot": get_number(player, "POT", "0"),
             "availability": availability,
             "availability_tier": availability_tier,
             "war": get_war(player, player_type),
-            "salary": parse_salary(player.get("SLR", 0)),
+            "salary": get_salary(player, "SLR", 0),
         })
     
     # Sort by availability (most available first), then by OVR
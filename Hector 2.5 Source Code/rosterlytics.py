@@ -0,0 +1,220 @@
+# Rosterlytics Command Line
+# Scores a league without the GUI, for nightly scripts and servers without a
+# display. Loads an export, applies the weights files and writes every
+# player's scores, trade value, percentiles, archetype fits and hidden gem
+# categories as CSV or JSON.
+#
+# Nothing here imports tkinter (or the gui package), so it starts quickly and
+# runs anywhere Python does.
+#
+# Usage (run from the folder that holds your exports):
+#     python rosterlytics.py score                          # Player List, CSV to stdout
+#     python -m rosterlytics score -o scores.json
+#     python rosterlytics.py score "Free Agents.html" --players batters -o fa.csv
+#     python rosterlytics.py score --use-stats --format json
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from archetypes import get_player_archetype_fits, get_best_archetype
+from batters import calculate_batter_scores
+from export_files import find_export
+from hidden_gems import find_all_hidden_gems, HIDDEN_GEM_CATEGORIES
+from html_parser import split_players_by_type, DEFAULT_BACKEND
+from load_pipeline import ExportLoad, PLAYER_LIST_FILE
+from percentiles import initialize_percentiles
+from pitchers import calculate_scores
+from trade_value import calculate_trade_value
+from weights import get_weights_module, load_section_weights
+
+
+OUTPUT_FORMATS = ("csv", "json")
+PLAYER_GROUPS = ("all", "batters", "pitchers")
+
+# Export columns copied to the front of every output row
+IDENTITY_COLUMNS = ("ID", "Name", "ORG", "POS", "Age", "OVR", "POT")
+
+# Trade value fields written to CSV (JSON keeps the full breakdown)
+TRADE_VALUE_COLUMNS = {
+    "trade_value": "Trade Value",
+    "tier": "Trade Tier",
+    "contract_status": "Contract Status",
+    "aav": "AAV",
+    "total_commitment": "Total Commitment",
+}
+
+
+def score_league(export_path=PLAYER_LIST_FILE, backend=DEFAULT_BACKEND, use_stats=False):
+    """
+    Load an export and score it exactly as the GUI does on load.
+    
+    Args:
+        export_path: Player export to score (HTML, CSV or compressed; a newer
+            CSV or compressed version of an HTML name is used, as in the GUI)
+        backend: Parser backend, see html_parser
+        use_stats: Score players with enough playing time from their stats
+            (the GUI's stats mode) using the *_stat_weights files
+    
+    Returns:
+        Dict with "pitchers" and "batters" (sorted by total score, best first),
+        "percentiles" (the PercentileCalculator) and "hidden_gems"
+        (category -> list of finds, see hidden_gems)
+    """
+    section_weights, batter_section_weights = load_section_weights()
+    pitcher_stat_weights = batter_stat_weights = None
+    if use_stats:
+        pitcher_stat_weights = get_weights_module("pitcher_stat_weights")
+        batter_stat_weights = get_weights_module("batter_stat_weights")
+    
+    with ExportLoad(find_export(export_path), team_path=None, free_agents_path=None, backend=backend) as load:
+        table = load.players()
+    pitchers, batters = split_players_by_type(table.rows())
+    
+    for pitcher, scores in zip(pitchers, calculate_scores(pitchers, section_weights, use_stats, pitcher_stat_weights)):
+        pitcher["Scores"] = scores
+    for batter, scores in zip(batters, calculate_batter_scores(batters, batter_section_weights, use_stats, batter_stat_weights)):
+        batter["Scores"] = scores
+    pitchers.sort(key=lambda p: p["Scores"].get("total", 0), reverse=True)
+    batters.sort(key=lambda b: b["Scores"].get("total", 0), reverse=True)
+    
+    return {
+        "pitchers": pitchers,
+        "batters": batters,
+        "percentiles": initialize_percentiles(batters, pitchers),
+        "hidden_gems": find_all_hidden_gems(batters, pitchers),
+    }
+
+
+def player_records(league, players="all"):
+    """
+    One output record per player: export identity columns, scores, trade
+    value, percentiles, archetype fits and hidden gem categories.
+    
+    Args:
+        league: Result of score_league
+        players: "all", "batters" or "pitchers"
+    
+    Returns:
+        List of dicts (nested for JSON; see flatten_record for CSV)
+    """
+    gems = {}
+    for category, finds in league["hidden_gems"].items():
+        name = HIDDEN_GEM_CATEGORIES.get(category, {}).get("name", category)
+        for find in finds:
+            gems.setdefault(id(find["player"]), []).append(name)
+    
+    calc = league["percentiles"]
+    groups = []
+    if players in ("all", "pitchers"):
+        groups.append(("pitcher", league["pitchers"], calc.get_pitcher_percentiles))
+    if players in ("all", "batters"):
+        groups.append(("batter", league["batters"], calc.get_batter_percentiles))
+    
+    records = []
+    for player_type, group, get_percentiles in groups:
+        for player in group:
+            record = {"Type": player_type}
+            for column in IDENTITY_COLUMNS:
+                record[column] = player.get(column, "")
+            scores = player["Scores"]
+            record["Score"] = scores.get("total", 0)
+            record["Scores"] = scores
+            record["Trade Value"] = calculate_trade_value(player, player_type)
+            record["Percentiles"] = {
+                metric: data["percentile"] for metric, data in get_percentiles(player).items()
+            }
+            best = get_best_archetype(player, player_type)
+            record["Best Archetype"] = best["name"] if best else ""
+            record["Archetypes"] = {
+                fit["archetype_name"]: fit["score"]
+                for fit in get_player_archetype_fits(player, player_type).values()
+            }
+            record["Hidden Gems"] = gems.get(id(player), [])
+            records.append(record)
+    return records
+
+
+def flatten_record(record):
+    """Flatten a player record into CSV columns."""
+    row = {}
+    for key, value in record.items():
+        if key == "Scores":
+            for name, score in value.items():
+                if name != "total" and isinstance(score, (int, float)) and not isinstance(score, bool):
+                    row[f"Score {name}"] = score
+        elif key == "Trade Value":
+            for name, column in TRADE_VALUE_COLUMNS.items():
+                row[column] = value.get(name, "")
+        elif key == "Percentiles":
+            for metric, percentile in value.items():
+                row[f"Pctl {metric}"] = percentile
+        elif key == "Archetypes":
+            for name, score in value.items():
+                row[f"Fit {name}"] = score
+        elif key == "Hidden Gems":
+            row[key] = "; ".join(value)
+        else:
+            row[key] = value
+    return row
+
+
+def write_csv(records, f):
+    rows = [flatten_record(record) for record in records]
+    columns = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))  # Batter and pitcher columns differ
+    writer = csv.DictWriter(f, fieldnames=list(columns), restval="")
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def write_json(records, f):
+    json.dump(records, f, indent=2, ensure_ascii=False, default=str)
+    f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="rosterlytics", description="Rosterlytics without the GUI")
+    commands = parser.add_subparsers(dest="command", required=True)
+    score = commands.add_parser("score", help="Score an export and write the results")
+    score.add_argument("export", nargs="?", default=PLAYER_LIST_FILE,
+                       help=f"Player export to score (default: {PLAYER_LIST_FILE})")
+    score.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    score.add_argument("--format", choices=OUTPUT_FORMATS,
+                       help="Output format (default: from the output file's extension, else csv)")
+    score.add_argument("--players", choices=PLAYER_GROUPS, default="all", help="Players to write")
+    score.add_argument("--use-stats", action="store_true",
+                       help="Score players with enough playing time from their stats")
+    score.add_argument("--backend", default=DEFAULT_BACKEND, help="HTML parser backend")
+    args = parser.parse_args(argv)
+    
+    output_format = args.format
+    if output_format is None:
+        output_format = "json" if args.output.lower().endswith(".json") else "csv"
+    
+    start = time.perf_counter()
+    export_path = find_export(args.export)
+    if not os.path.exists(export_path):
+        parser.exit(1, f"Error: {args.export} not found in {os.getcwd()}\n")
+    try:
+        league = score_league(export_path, args.backend, args.use_stats)
+    except (ValueError, OSError, ImportError) as e:
+        parser.exit(1, f"Error: Could not score {export_path}: {e}\n")
+    records = player_records(league, args.players)
+    
+    write = write_json if output_format == "json" else write_csv
+    if args.output == "-":
+        write(records, sys.stdout)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            write(records, f)
+    print(f"Scored {len(league['pitchers'])} pitchers and {len(league['batters'])} batters "
+          f"from {export_path} in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Score Modes Module
+# Scores of a player list under the Batters and Pitchers tabs' Draft
+# Comparison and Stats modes, kept apart from the players' shared "Scores".
+#
+# Every tab reads player["Scores"], calculated at load with the weights files
+# as they are. A mode only changes what one tab shows, so its scores are kept
+# here, per player, instead of overwriting that dict. The ratings are read
+# into the score model's components once per player list (and stat
+# scores once, when Stats Mode is first used); switching modes afterwards
+# only recombines them with other meta multipliers.
+
+
+class ModeScores:
+    """
+    Scores of one player list under any Draft/Stats mode combination.
+    
+    Args:
+        players: The tab's players (copied; later sorting doesn't matter)
+        model: The list's BatterScoreModel or PitcherScoreModel
+    """
+    
+    def __init__(self, players, model):
+        self.players = list(players)
+        self.model = model
+        self._components = None
+        self._stat_results = {}  # stat weights module -> (stat_score, used_stats) per player
+    
+    def scores(self, meta=None, stat_weights_module=None):
+        """
+        Score dict of every player for one mode combination.
+        
+        Args:
+            meta: Draft Mode meta multipliers, or None for the weights file's
+            stat_weights_module: Stat weights module for Stats Mode, or None
+        
+        Returns:
+            Dict of id(player) -> score dict (the shape of player["Scores"])
+        """
+        if not self.players:
+            return {}
+        if self._components is None:
+            self._components = self.model.components(self.players)
+        stat_results = None
+        if stat_weights_module is not None:
+            stat_results = self._stat_results.get(stat_weights_module)
+            if stat_results is None:
+                stat_results = self.model.stat_results(self.players, stat_weights_module)
+                self._stat_results[stat_weights_module] = stat_results
+        results = self.model.combine(self.players, self._components, meta, stat_results)
+        return {id(player): scores for player, scores in zip(self.players, results)}
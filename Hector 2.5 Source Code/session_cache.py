@@ -0,0 +1,158 @@
+# Session Cache Module
+# The last session's loaded league, so the app can show it at start-up before
+# the exports have been checked.
+#
+# After every successful load the GUI saves the scored player table, the team
+# list and the free agents to one archive in the working folder (same format
+# as snapshot_cache: typed NumPy arrays plus JSON, nothing pickled). At the
+# next start the archive is shown straight away; it records which export
+# files (path, size, mtime) and weights files it was built from, so a quick
+# stat tells whether the exports changed and a background reload is needed.
+#
+# Unlike a snapshot, a session is shown even when it is out of date; it only
+# has to have been written by the same parser and scoring code.
+
+import hashlib
+import importlib
+import os
+
+from export_files import find_export
+from player_table import PlayerTable
+from snapshot_cache import parser_fingerprint, read_archive, write_archive
+
+
+SESSION_CACHE_FILE = "Rosterlytics Session.cache"
+
+# Bump when the session layout itself changes
+SESSION_FORMAT = 1
+
+# Modules (besides the parser's) whose code decides what a session holds;
+# editing any of them invalidates the session (the next start then loads
+# the exports normally)
+SCORING_MODULES = ("pitchers", "batters", "stat_scores", "session_cache")
+
+_session_fingerprint = None
+
+
+def session_fingerprint():
+    """Identify the parser and scoring code a session was written by."""
+    global _session_fingerprint
+    if _session_fingerprint is None:
+        digest = hashlib.blake2b(parser_fingerprint().encode(), digest_size=12)
+        for name in SCORING_MODULES:
+            path = getattr(importlib.import_module(name), "__file__", None)
+            if path and path.endswith(".py") and os.path.exists(path):
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+        _session_fingerprint = digest.hexdigest()
+    return _session_fingerprint
+
+
+def export_sources(export_names):
+    """
+    The file each export name is read from, with its size and mtime.
+    
+    Args:
+        export_names: Export names as used in the app (e.g., "Player List.html")
+    
+    Returns:
+        Dict of name -> [path, size, mtime_ns], or None for a missing export
+        (lists rather than tuples, so it compares equal after a JSON round trip)
+    """
+    sources = {}
+    for name in export_names:
+        path = find_export(name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            sources[name] = None
+            continue
+        sources[name] = [path, stat.st_size, stat.st_mtime_ns]
+    return sources
+
+
+def _table_arrays(prefix, table, meta):
+    table_meta, arrays = table.to_arrays()
+    meta[prefix] = table_meta
+    return {f"{prefix}_{name}": array for name, array in arrays.items()}
+
+
+def _table_from_arrays(prefix, meta, arrays):
+    if prefix not in meta:
+        return None
+    names = ("values", "codes", "typed")
+    return PlayerTable.from_arrays(meta[prefix], {name: arrays[f"{prefix}_{name}"] for name in names})
+
+
+def save_session(player_table, teams_list, free_agents_table, sources, weights_signature,
+                 path=SESSION_CACHE_FILE):
+    """
+    Save a loaded league as the session shown at the next start. Failures are
+    reported and otherwise ignored.
+    
+    Args:
+        player_table: Scored PlayerTable (rows without a scored position have
+            no "Scores" and are saved unscored)
+        teams_list: Parsed Team List (may be empty)
+        free_agents_table: PlayerTable of free agents, or None
+        sources: export_sources() taken before the exports were read
+        weights_signature: weights.weights_signature() the scores were calculated with
+        path: Archive to write
+    """
+    meta = {
+        "format": SESSION_FORMAT,
+        "fingerprint": session_fingerprint(),
+        "sources": sources,
+        "weights_signature": weights_signature,
+        "scores": [row.get("Scores") for row in player_table.rows()],
+        "teams": teams_list,
+    }
+    try:
+        arrays = _table_arrays("players", player_table, meta)
+        if free_agents_table is not None:
+            arrays.update(_table_arrays("free_agents", free_agents_table, meta))
+        write_archive(path, meta, arrays)
+    except Exception as e:
+        print(f"Warning: Could not save session cache {path}: {e}")
+
+
+def load_session(path=SESSION_CACHE_FILE):
+    """
+    Read the last session, whether or not the exports changed since.
+    
+    Returns:
+        Dict with "player_table" (scored rows carry their "Scores"), "teams_list",
+        "free_agents_table" (or None), "sources" and "weights_signature" (as
+        saved, see is_session_current), or None when there is no usable session
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        meta, arrays = read_archive(path)
+        if meta.get("format") != SESSION_FORMAT or meta.get("fingerprint") != session_fingerprint():
+            return None
+        player_table = _table_from_arrays("players", meta, arrays)
+        scores = meta["scores"]
+        if player_table is None or len(scores) != len(player_table):
+            return None
+        for row, row_scores in zip(player_table.rows(), scores):
+            if row_scores is not None:  # None for rows that were never scored (blank or unknown POS)
+                row["Scores"] = row_scores
+        return {
+            "player_table": player_table,
+            "teams_list": meta.get("teams", []),
+            "free_agents_table": _table_from_arrays("free_agents", meta, arrays),
+            "sources": meta["sources"],
+            "weights_signature": tuple(tuple(entry) for entry in meta["weights_signature"]),
+        }
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable session cache {path}: {e}")
+        return None
+
+
+def is_session_current(session, export_names, weights_signature):
+    """
+    True when neither the exports nor the weights files changed since the
+    session was saved (a stat of each file; nothing is read or hashed).
+    """
+    return session["sources"] == export_sources(export_names) and session["weights_signature"] == weights_signature
@@ -0,0 +1,240 @@
+# Snapshot Cache Module
+# Binary snapshots of parsed OOTP exports, so unchanged files load in milliseconds.
+#
+# A snapshot sits next to its export ("Player List.html" -> "Player List.html.snapshot")
+# and is a NumPy .npz archive: typed column arrays plus a JSON metadata block.
+# Nothing is pickled, so a snapshot can never execute code when it is read.
+#
+# A snapshot is only used when the export's size, mtime and content hash all
+# match what was recorded, and it was written by the same parser version.
+# Anything else (edited export, new parser, corrupt or unreadable snapshot)
+# falls back to a normal parse, which then refreshes the snapshot.
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from html_parser import PARSER_VERSION, DEFAULT_BACKEND
+from player_table import PlayerTable, load_player_table
+from team_parser import parse_team_html
+
+
+SNAPSHOT_SUFFIX = ".snapshot"
+
+# Bump when the snapshot layout itself changes
+SNAPSHOT_FORMAT = 1
+
+# Modules whose code decides what a parse produces; editing any of them
+# invalidates existing snapshots even if PARSER_VERSION was not bumped
+PARSER_MODULES = (
+    "html_parser", "csv_parser", "export_files", "export_schema", "player_table", "field_types",
+    "team_parser", "snapshot_cache",
+)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_parser_fingerprint = None
+
+
+def snapshot_path(export_path):
+    """Path of the snapshot file stored next to an export."""
+    return str(export_path) + SNAPSHOT_SUFFIX
+
+
+def file_hash(path):
+    """BLAKE2b digest of a file's contents, as hex."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parser_fingerprint():
+    """
+    Identify the parser that produced a snapshot: PARSER_VERSION plus a hash
+    of the parser modules' source when it is available (not in frozen builds).
+    """
+    global _parser_fingerprint
+    if _parser_fingerprint is None:
+        import importlib
+        digest = hashlib.blake2b(str(PARSER_VERSION).encode(), digest_size=12)
+        for name in PARSER_MODULES:
+            path = getattr(importlib.import_module(name), "__file__", None)
+            if path and path.endswith(".py") and os.path.exists(path):
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+        _parser_fingerprint = f"{PARSER_VERSION}-{digest.hexdigest()}"
+    return _parser_fingerprint
+
+
+def _source_key(export_path):
+    stat = os.stat(export_path)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": file_hash(export_path),
+    }
+
+
+def read_archive(path):
+    """
+    Read an .npz archive written by write_archive.
+    
+    Returns:
+        Tuple of (meta, arrays); raises on a missing or unreadable file
+    """
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+        arrays = {name: data[name] for name in data.files if name != "meta"}
+    return meta, arrays
+
+
+def write_archive(path, meta, arrays):
+    """
+    Write JSON metadata and plain NumPy arrays to an .npz archive. The file is
+    written under a temporary name and renamed, so readers never see half of it.
+    """
+    encoded = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".snapshot-", dir=folder)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, meta=encoded, **arrays)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_snapshot(export_path, kind):
+    """
+    Read the snapshot for an export if it is still valid.
+    
+    Args:
+        export_path: Path to the HTML export
+        kind: What the snapshot holds ("players" or "teams")
+    
+    Returns:
+        Tuple of (meta, arrays), or None when there is no valid snapshot
+    """
+    path = snapshot_path(export_path)
+    if not os.path.exists(path) or not os.path.exists(export_path):
+        return None
+    try:
+        meta, arrays = read_archive(path)
+        if (meta.get("format") != SNAPSHOT_FORMAT
+                or meta.get("kind") != kind
+                or meta.get("parser") != parser_fingerprint()):
+            return None
+        stat = os.stat(export_path)
+        source = meta.get("source", {})
+        if source.get("size") != stat.st_size or source.get("mtime_ns") != stat.st_mtime_ns:
+            return None
+        if source.get("hash") != file_hash(export_path):
+            return None
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable snapshot {path}: {e}")
+        return None
+    return meta, arrays
+
+
+def write_snapshot(export_path, kind, meta, arrays, source=None):
+    """
+    Write a snapshot next to an export. Failures (read-only folder, full disk)
+    are reported and otherwise ignored; the export is simply parsed next time.
+    
+    Args:
+        export_path: Path to the HTML export
+        kind: What the snapshot holds ("players" or "teams")
+        meta: JSON-serialisable metadata
+        arrays: Dict of name -> NumPy array (no object arrays)
+        source: Size/mtime/hash of the export as it was parsed; read now if omitted
+    """
+    path = snapshot_path(export_path)
+    meta = dict(meta)
+    meta.update({
+        "format": SNAPSHOT_FORMAT,
+        "kind": kind,
+        "parser": parser_fingerprint(),
+        "source": source or _source_key(export_path),
+    })
+    try:
+        write_archive(path, meta, arrays)
+    except Exception as e:
+        print(f"Warning: Could not write snapshot {path}: {e}")
+
+
+def clear_snapshot(export_path):
+    """Delete the snapshot for an export, if any."""
+    try:
+        os.remove(snapshot_path(export_path))
+    except FileNotFoundError:
+        pass
+
+
+def cached_player_table(html_path):
+    """PlayerTable from a still-valid snapshot of a player export, or None."""
+    cached = read_snapshot(html_path, "players")
+    if cached is not None:
+        meta, arrays = cached
+        try:
+            return PlayerTable.from_arrays(meta["table"], arrays)
+        except Exception as e:
+            print(f"Warning: Ignoring damaged snapshot for {html_path}: {e}")
+    return None
+
+
+def load_player_table_cached(html_path, backend=DEFAULT_BACKEND):
+    """
+    Load a player export as a PlayerTable, from its snapshot when unchanged.
+    
+    Args:
+        html_path: Path to the HTML file (e.g., "Player List.html" or "Free Agents.html")
+        backend: Parser backend used when the export has to be parsed
+    
+    Returns:
+        PlayerTable
+    """
+    table = cached_player_table(html_path)
+    if table is not None:
+        return table
+    
+    source = _source_key(html_path)
+    table = load_player_table(html_path, backend)
+    if len(table):
+        table_meta, arrays = table.to_arrays()
+        write_snapshot(html_path, "players", {"table": table_meta}, arrays, source)
+    return table
+
+
+def cached_teams(html_path):
+    """Team list from a still-valid snapshot of a Team List export, or None."""
+    cached = read_snapshot(html_path, "teams")
+    if cached is not None:
+        return cached[0]["teams"]
+    return None
+
+
+def load_teams_cached(html_path, backend=DEFAULT_BACKEND):
+    """
+    Parse a Team List export (see team_parser.parse_team_html), from its
+    snapshot when unchanged.
+    
+    Returns:
+        List of team dicts
+    """
+    if not os.path.exists(html_path):
+        return []
+    teams = cached_teams(html_path)
+    if teams is not None:
+        return teams
+    
+    source = _source_key(html_path)
+    teams = parse_team_html(html_path, backend)
+    if teams:
+        write_snapshot(html_path, "teams", {"teams": teams}, {}, source)
+    return teams
@@ -0,0 +1,77 @@
+# Stat Scores Module
+# Stats-based scores (the tabs' Stats Mode) of a whole player list at once.
+#
+# calculate_batter_stat_score and calculate_pitcher_stat_score score one
+# player from a *_stat_weights module, reading and clamping one stat at a
+# time. calculate_stat_scores gives the same scores for every player of a
+# list: each weighted stat is read as one column (straight from the
+# PlayerTable when the players are its rows), clamped and scaled to its
+# normalization range as a whole, and the minimum sample size becomes a mask.
+
+import numpy as np
+
+from field_types import typed_value
+from player_table import column_matrix, column_values
+
+
+def calculate_stat_scores(players, stat_weights_module, sample_stat, min_sample, position_stats=False):
+    """
+    Stat score of every player, as the calculate_*_stat_score functions give it.
+    
+    Args:
+        players: List of player rows
+        stat_weights_module: batter_stat_weights or pitcher_stat_weights module
+        sample_stat: Field deciding whether a player played enough ("G", "IP")
+        min_sample: Least sample_stat value for a player's stats to be used
+        position_stats: Only count stats with "applies_to" for the positions
+            listed there (pitchers)
+    
+    Returns:
+        Tuple of (stat_score, used_stats) arrays: the score rounded to 2
+        decimals (NaN where stats are not used) and whether the player's
+        sample was large enough
+    """
+    stat_weights = stat_weights_module.stat_weights
+    normalization = stat_weights_module.normalization
+    stats = [
+        (stat_name, config) for stat_name, config in stat_weights.items()
+        if stat_name != "age_adjustment" and config.get("weight", 0) != 0
+    ]
+    values = column_matrix(players, [sample_stat] + [stat_name for stat_name, _c in stats], typed_value, 0)
+    used_stats = values[:, 0] >= min_sample
+    positions = None
+    
+    # Added stat by stat, in the weights file's order, as the scalar functions do
+    stat_score = np.zeros(len(players), dtype=np.float64)
+    for j, (stat_name, config) in enumerate(stats, 1):
+        raw_value = values[:, j] * config.get("scale_factor", 1.0)
+        if stat_name in normalization:
+            norm = normalization[stat_name]
+            min_val = norm.get("min", 0)
+            max_val = norm.get("max", 100)
+            scale_to = norm.get("scale_to", 100)
+            clamped = np.maximum(min_val, np.minimum(max_val, raw_value))
+            contribution = ((clamped - min_val) / (max_val - min_val)) * scale_to * config["weight"]
+        else:
+            contribution = raw_value * config["weight"]
+        
+        applies_to = config.get("applies_to", None)
+        if position_stats and applies_to is not None:
+            if positions is None:
+                positions = column_values(players, "POS", str.upper, "", object)
+            applies = np.array([pos in applies_to for pos in positions.tolist()], dtype=bool)
+            stat_score = np.where(applies, stat_score + contribution, stat_score)
+        else:
+            stat_score += contribution
+    
+    # Python's round, not np.round: the two differ on ties
+    rounded = np.array([round(score, 2) for score in stat_score.tolist()], dtype=np.float64)
+    return np.where(used_stats, rounded, np.nan), used_stats
+
+
+def stat_score_pairs(stat_score, used_stats):
+    """(stat_score, used_stats) per player, as calculate_*_stat_score returns them."""
+    return [
+        (score, True) if used else (None, False)
+        for score, used in zip(stat_score.tolist(), used_stats.tolist())
+    ]
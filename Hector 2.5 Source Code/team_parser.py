@@ -1,7 +1,7 @@
 # Team Parser Module
 # Parse team HTML data for surplus value trade finder
 
-from bs4 import BeautifulSoup
+from html_parser import read_export_table, DEFAULT_BACKEND
 from trade_value import parse_number, parse_salary
 from player_utils import parse_star_rating
 
@@ -22,7 +22,7 @@ PARK_FACTOR_COLUMNS = [
 ]
 
 
-def parse_team_html(html_path):
+def parse_team_html(html_path, backend=DEFAULT_BACKEND):
     """
     Parse team standings/data from an HTML file.
     
@@ -35,49 +35,25 @@ def parse_team_html(html_path):
     - Park factor columns: PF, PF AVG, AVG L, AVG R, PF HR, HR L, HR R, PF D, PF T
     
     Args:
-        html_path: Path to the team HTML file
+        html_path: Path to the team HTML file (or its CSV version)
+        backend: Parser backend ("auto", "stream", "lxml" or "bs4"), see html_parser
     
     Returns:
         List of team dicts with parsed data including park factors
     """
     try:
-        with open(html_path, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f, "html.parser")
+        headers, rows = read_export_table(html_path, backend)
     except FileNotFoundError:
         return []
     except Exception:
         return []
     
-    table = soup.find("table", class_="data")
-    if not table:
-        return []
-    
-    # Get headers
-    thead = table.find("thead")
-    if thead:
-        header_row = thead.find("tr")
-    else:
-        header_row = table.find("tr")
-    
-    if not header_row:
-        return []
-    
-    headers = [th.get_text(strip=True) for th in header_row.find_all("th")]
-    
-    # Parse data rows
-    tbody = table.find("tbody")
-    if tbody:
-        rows = tbody.find_all("tr")
-    else:
-        rows = table.find_all("tr")[1:]
-    
     teams = []
-    for row in rows:
-        cells = row.find_all("td")
+    for cells in rows:
         if len(cells) != len(headers):
             continue
         
-        team_data = {headers[i]: cells[i].get_text(strip=True) for i in range(len(headers))}
+        team_data = {headers[i]: cells[i] for i in range(len(headers))}
         
         # Parse park factor columns into numeric values
         for pf_col in PARK_FACTOR_COLUMNS:
@@ -3,6 +3,8 @@
 
 import re
 
+from field_types import get_number, get_salary, get_years_left
+
 # Position scarcity multipliers - scarce positions are more valuable
 POSITION_SCARCITY = {
     "C": 1.15,
@@ -169,9 +171,9 @@ def get_contract_status(player):
     
     Returns tuple (status_name, status_key, color)
     """
-    yl_data = parse_years_left(player.get("YL", ""))
-    ty = parse_number(player.get("TY", 0))
-    ecv = parse_salary(player.get("ECV", 0))
+    yl_data = get_years_left(player, "YL", "")
+    ty = get_number(player, "TY", 0)
+    ecv = get_salary(player, "ECV", 0)
     
     status = yl_data.get("status", "unknown")
     years = yl_data.get("years", 0)
@@ -195,12 +197,12 @@ def calculate_aav(player):
     
     Returns AAV in millions, or 0 if data unavailable
     """
-    cv = parse_salary(player.get("CV", 0))
-    ty = parse_number(player.get("TY", 0))
+    cv = get_salary(player, "CV", 0)
+    ty = get_number(player, "TY", 0)
     
     # Fallback to SLR if CV not available
     if cv <= 0:
-        cv = parse_salary(player.get("SLR", 0))
+        cv = get_salary(player, "SLR", 0)
         ty = 1  # If using current salary, assume 1 year
     
     if ty <= 0:
@@ -218,14 +220,14 @@ def calculate_total_commitment(player):
     - total_years: TY + ETY (total years of commitment)
     - overall_aav: (CV + ECV) / (TY + ETY)
     """
-    cv = parse_salary(player.get("CV", 0))
-    ty = parse_number(player.get("TY", 0))
-    ecv = parse_salary(player.get("ECV", 0))
-    ety = parse_number(player.get("ETY", 0))
+    cv = get_salary(player, "CV", 0)
+    ty = get_number(player, "TY", 0)
+    ecv = get_salary(player, "ECV", 0)
+    ety = get_number(player, "ETY", 0)
     
     # Fallback to SLR if CV not available
     if cv <= 0:
-        cv = parse_salary(player.get("SLR", 0))
+        cv = get_salary(player, "SLR", 0)
         ty = 1
     
     total_value = cv + ecv
@@ -254,8 +256,8 @@ def get_extension_analysis(player, player_type="batter"):
     - extension_grade: Steal/Fair/Risky/Overpay
     - red_flags: list of concerns
     """
-    ecv = parse_salary(player.get("ECV", 0))
-    ety = parse_number(player.get("ETY", 0))
+    ecv = get_salary(player, "ECV", 0)
+    ety = get_number(player, "ETY", 0)
     
     if ecv <= 0 or ety <= 0:
         return {"has_extension": False}
@@ -264,16 +266,16 @@ def get_extension_analysis(player, player_type="batter"):
     
     # Get player attributes for grading
     if player_type == "pitcher":
-        war = parse_number(player.get("WAR (Pitcher)", player.get("WAR", 0)))
+        war = get_number(player, "WAR (Pitcher)", player.get("WAR", 0))
     else:
-        war = parse_number(player.get("WAR (Batter)", player.get("WAR", 0)))
+        war = get_number(player, "WAR (Batter)", player.get("WAR", 0))
     
     try:
         age = int(player.get("Age", 0))
     except (ValueError, TypeError):
         age = 0
     
-    ovr = parse_number(player.get("OVR", 0))
+    ovr = get_number(player, "OVR", 0)
     prone = str(player.get("Prone", "")).lower()
     
     # Calculate expected AAV based on WAR (rough estimate)
@@ -375,9 +377,9 @@ def calculate_current_production_score(player, player_type="batter"):
     """
     # Get WAR based on player type
     if player_type == "pitcher":
-        war = parse_number(player.get("WAR (Pitcher)", player.get("WAR", 0)))
+        war = get_number(player, "WAR (Pitcher)", player.get("WAR", 0))
     else:
-        war = parse_number(player.get("WAR (Batter)", player.get("WAR", 0)))
+        war = get_number(player, "WAR (Batter)", player.get("WAR", 0))
     
     # Try to use the existing score system if available
     scores = player.get("Scores", {})
@@ -400,7 +402,7 @@ def calculate_future_value_score(player):
     Calculate future value score (0-30 points) based on POT and age
     30% weight in final trade value
     """
-    pot = parse_number(player.get("POT", 0))
+    pot = get_number(player, "POT", 0)
     age = player.get("Age", 30)
     
     age_multiplier = get_age_multiplier(age)
@@ -428,12 +430,12 @@ def calculate_contract_value_score(player):
     More years of control at low cost = more value
     """
     # Parse contract data with new columns
-    yl_data = parse_years_left(player.get("YL", ""))
+    yl_data = get_years_left(player, "YL", "")
     years_left = yl_data.get("years", 0)
     status = yl_data.get("status", "unknown")
     
     # Use TY (Total Years) if available, otherwise fall back to YL
-    ty = parse_number(player.get("TY", 0))
+    ty = get_number(player, "TY", 0)
     if ty <= 0:
         ty = years_left
     
@@ -441,8 +443,8 @@ def calculate_contract_value_score(player):
     aav = calculate_aav(player)
     
     # Check for extension
-    ecv = parse_salary(player.get("ECV", 0))
-    ety = parse_number(player.get("ETY", 0))
+    ecv = get_salary(player, "ECV", 0)
+    ety = get_number(player, "ETY", 0)
     has_extension = ecv > 0 and ety > 0
     
     # Years of control contribution (0-10 points)
@@ -532,7 +534,7 @@ def calculate_trade_value(player, player_type="batter"):
     position_scarcity = calculate_position_scarcity_score(player)
     
     # Apply contract status multiplier to base value
-    yl_data = parse_years_left(player.get("YL", ""))
+    yl_data = get_years_left(player, "YL", "")
     status = yl_data.get("status", "unknown")
     status_multiplier = CONTRACT_STATUS_MULTIPLIERS.get(status, 1.0)
     
@@ -586,11 +588,11 @@ def calculate_dollars_per_war(player, player_type="batter"):
     Returns tuple (dollars_per_war, display_string)
     """
     if player_type == "pitcher":
-        war = parse_number(player.get("WAR (Pitcher)", player.get("WAR", 0)))
+        war = get_number(player, "WAR (Pitcher)", player.get("WAR", 0))
     else:
-        war = parse_number(player.get("WAR (Batter)", player.get("WAR", 0)))
+        war = get_number(player, "WAR (Batter)", player.get("WAR", 0))
     
-    salary = parse_number(player.get("SLR", 0))
+    salary = get_salary(player, "SLR", 0)
     
     if war <= 0:
         return float('inf'), "∞" if salary > 0 else "N/A"
@@ -608,11 +610,11 @@ def calculate_surplus_value(player, player_type="batter"):
     Returns tuple (surplus_value, display_string)
     """
     if player_type == "pitcher":
-        war = parse_number(player.get("WAR (Pitcher)", player.get("WAR", 0)))
+        war = get_number(player, "WAR (Pitcher)", player.get("WAR", 0))
     else:
-        war = parse_number(player.get("WAR (Batter)", player.get("WAR", 0)))
+        war = get_number(player, "WAR (Batter)", player.get("WAR", 0))
     
-    salary = parse_number(player.get("SLR", 0))
+    salary = get_salary(player, "SLR", 0)
     
     expected_value = war * LEAGUE_AVG_DOLLAR_PER_WAR
     surplus = expected_value - salary
@@ -637,18 +639,18 @@ def get_contract_category(player, player_type="batter"):
     Returns tuple (category_name, icon, color)
     """
     if player_type == "pitcher":
-        war = parse_number(player.get("WAR (Pitcher)", player.get("WAR", 0)))
+        war = get_number(player, "WAR (Pitcher)", player.get("WAR", 0))
     else:
-        war = parse_number(player.get("WAR (Batter)", player.get("WAR", 0)))
+        war = get_number(player, "WAR (Batter)", player.get("WAR", 0))
     
     # Get enhanced contract data
     aav = calculate_aav(player)
-    yl_data = parse_years_left(player.get("YL", ""))
+    yl_data = get_years_left(player, "YL", "")
     years_left = yl_data.get("years", 0)
     status = yl_data.get("status", "unknown")
     
     # Check for extension
-    ecv = parse_salary(player.get("ECV", 0))
+    ecv = get_salary(player, "ECV", 0)
     has_extension = ecv > 0
     
     try:
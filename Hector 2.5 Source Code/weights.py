@@ -0,0 +1,132 @@
+# Weights Module
+# Locates and loads the user-editable weights files (pitcher_weights.py, ...).
+#
+# The weights files are plain Python modules kept next to the app (or next to
+# the executable when frozen) so they can be edited without rebuilding. They
+# are loaded from that folder by path, never from the import path.
+# get_weights_module executes a file once and hands out the same module until
+# the file changes (a stat per call, the contents hashed only when the stat
+# differs), so reloads and mode toggles don't re-run unchanged weights. The
+# scoring modules compile the weights into coefficient tables and register
+# with on_weights_changed to drop them when a file is executed again.
+# Shared by the GUI and the command line (rosterlytics.py); nothing here
+# imports tkinter.
+
+import hashlib
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+
+
+# Weights files that scores depend on; editing any of them forces a full rescore on reload
+WEIGHTS_MODULES = ("pitcher_weights", "batter_weights", "pitcher_stat_weights", "batter_stat_weights")
+
+
+def get_weights_dir():
+    """Folder holding the weights files and config.ini."""
+    if getattr(sys, 'frozen', False):
+        return Path(sys.executable).parent
+    return Path(__file__).parent
+
+
+def import_weights_module(module_name):
+    """
+    (Re)load a weights module from the weights folder.
+    
+    Args:
+        module_name: Module name, e.g. "pitcher_weights"
+    
+    Returns:
+        The freshly executed module, also stored in sys.modules
+    """
+    module_path = get_weights_dir() / f"{module_name}.py"
+    if module_name in sys.modules:
+        del sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, str(module_path))
+    if spec is None or not module_path.exists():
+        raise ImportError(f"Could not find spec for {module_name} at {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[module_name] = module
+    return module
+
+
+# Loaded weights modules: name -> ((mtime_ns, size), content digest, module)
+_loaded = {}
+_loaded_lock = threading.RLock()
+_listeners = []
+
+
+def get_weights_module(module_name):
+    """
+    A weights module, executed again only when its file changed.
+    
+    The file is stat'ed on every call; when its mtime or size differs from
+    the last load its contents are hashed, and it is only executed again
+    (notifying on_weights_changed listeners) when the contents changed too.
+    Safe to call from the loader thread and the main thread at once.
+    
+    Args:
+        module_name: Module name, e.g. "batter_weights"
+    
+    Returns:
+        The module; the same object until the file is edited, so treat its
+        values as read-only
+    """
+    module_path = get_weights_dir() / f"{module_name}.py"
+    with _loaded_lock:
+        cached = _loaded.get(module_name)
+        try:
+            stat = module_path.stat()
+        except OSError:
+            stat = None
+        if stat is None:
+            if cached is not None:
+                return cached[2]  # File gone since; keep the weights in use
+            return import_weights_module(module_name)  # Raises ImportError
+        
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if cached is not None and cached[0] == stamp:
+            return cached[2]
+        with open(module_path, "rb") as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        if cached is not None and cached[1] == digest:
+            _loaded[module_name] = (stamp, digest, cached[2])  # Touched, not edited
+            return cached[2]
+        
+        module = import_weights_module(module_name)
+        _loaded[module_name] = (stamp, digest, module)
+        listeners = list(_listeners)
+    if cached is not None:
+        for callback in listeners:
+            callback(module_name, module)
+    return module
+
+
+def on_weights_changed(callback):
+    """
+    Call callback(module_name, module) whenever get_weights_module executes a
+    weights file again because it was edited (not on its first load).
+    """
+    _listeners.append(callback)
+
+
+def weights_signature():
+    """Size and modification time of every weights file, to detect edits between reloads."""
+    signature = []
+    for module_name in WEIGHTS_MODULES:
+        module_path = get_weights_dir() / f"{module_name}.py"
+        try:
+            stat = module_path.stat()
+            signature.append((module_name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((module_name, None, None))
+    return tuple(signature)
+
+
+def load_section_weights():
+    """pitcher_weights and batter_weights (reloaded if edited); returns their (pitcher, batter) section_weights."""
+    pitcher_weights_module = get_weights_module("pitcher_weights")
+    batter_weights_module = get_weights_module("batter_weights")
+    return pitcher_weights_module.section_weights, batter_weights_module.section_weights